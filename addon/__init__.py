@@ -1,28 +1,53 @@
 import bpy
 
 from .props.bone_property_group import BonePropertyGroup
+from .props.live_link_property_group import LiveLinkPropertyGroup
 from .props.wm_property_group import WindowManagerPropertyGroup
+from .props.scene_property_group import ScenePropertyGroup
 from .ui.bone_panel import BonePanel
 from .ui.menu_panel import MenuPanel
 from .ops.json_export import JsonExport
 from .ops.arduino_export import ArduinoExport
 from .ops.binary_export import BinaryExport
+from .ops.multi_export import MultiExport
+from .ops.scene_batch_export import SceneBatchExport
 from .ops.stop_live_mode import StopLiveMode
 from .ops.start_live_mode import StartLiveMode
 from .ops.calibrate_servo import CalibrateServo
+from .ops.bake_live_cache import BakeLiveCache
+from .ops.refresh_serial_ports import RefreshSerialPorts
+from .ops.add_live_link import AddLiveLink
+from .ops.remove_live_link import RemoveLiveLink
+from .utils.live_cache import invalidate_live_cache, clear_live_cache
+from .utils.rest_matrix_cache import invalidate_rest_matrices, clear_rest_matrices
+from .utils.servo_settings import clear_servo_settings
 
 
 classes = (
     BonePropertyGroup,
+    LiveLinkPropertyGroup,
     WindowManagerPropertyGroup,
+    ScenePropertyGroup,
     BonePanel,
     MenuPanel,
     ArduinoExport,
     JsonExport,
     BinaryExport,
+    MultiExport,
+    SceneBatchExport,
     StopLiveMode,
     StartLiveMode,
-    CalibrateServo
+    CalibrateServo,
+    BakeLiveCache,
+    RefreshSerialPorts,
+    AddLiveLink,
+    RemoveLiveLink
+)
+
+CLEAR_CACHE_HANDLERS = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post
 )
 
 
@@ -30,6 +55,8 @@ def menu_func_export(self, _):
     self.layout.operator(ArduinoExport.bl_idname)
     self.layout.operator(JsonExport.bl_idname)
     self.layout.operator(BinaryExport.bl_idname)
+    self.layout.operator(MultiExport.bl_idname)
+    self.layout.operator(SceneBatchExport.bl_idname)
 
 
 def menu_func_timeline(self, _):
@@ -48,6 +75,13 @@ def register():
         type=WindowManagerPropertyGroup)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
     bpy.types.DOPESHEET_MT_editor_menus.append(menu_func_timeline)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_rest_matrices)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_live_cache)
+
+    for handlers in CLEAR_CACHE_HANDLERS:
+        handlers.append(clear_servo_settings)
+        handlers.append(clear_live_cache)
+        handlers.append(clear_rest_matrices)
 
 
 def unregister():
@@ -59,3 +93,10 @@ def unregister():
     del bpy.types.WindowManager.servo_animation
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
     bpy.types.DOPESHEET_MT_editor_menus.remove(menu_func_timeline)
+    bpy.app.handlers.depsgraph_update_post.remove(invalidate_rest_matrices)
+    bpy.app.handlers.depsgraph_update_post.remove(invalidate_live_cache)
+
+    for handlers in CLEAR_CACHE_HANDLERS:
+        handlers.remove(clear_servo_settings)
+        handlers.remove(clear_live_cache)
+        handlers.remove(clear_rest_matrices)
@@ -0,0 +1,319 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+
+if __package__:
+    from .utils.names import get_unique_name
+else:
+    # Blender runs this file as a script outside of the add-on package
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils"))
+    from names import get_unique_name  # pylint: disable=import-error
+
+FORMATS = {
+    "h": ("arduino", ".h"),
+    "json": ("json", ".json"),
+    "bin": ("binary", ".bin"),
+}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python cli.py --",
+        description="Batch export servo animations of multiple .blend files and scenes"
+    )
+    parser.add_argument("files", nargs="+", help="the .blend files to export")
+    parser.add_argument(
+        "--scenes", nargs="+", default=[],
+        help="names of the scenes to export (default: all scenes)")
+    parser.add_argument(
+        "--formats", nargs="+", default=list(FORMATS), choices=list(FORMATS),
+        help="the export formats (default: all formats)")
+    parser.add_argument(
+        "--output-dir", default="export",
+        help="directory to write the exports to, one sub directory per file")
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="number of files to process concurrently")
+    parser.add_argument(
+        "--timeout", type=float, default=600,
+        help="maximum duration in seconds per file")
+    parser.add_argument(
+        "--no-skip-duplicates", dest="skip_duplicates", action="store_false",
+        help="export unchanged positions for every frame")
+    parser.add_argument(
+        "--binary-format", default="commands", choices=["commands", "compact", "packed"],
+        help="the binary format, compact uses the delta encoded v2 format")
+    parser.add_argument(
+        "--max-error", type=int, default=0,
+        help="maximum position error of the packed binary format")
+    parser.add_argument(
+        "--compress-holds", action="store_true",
+        help="replace runs of unchanged frames by wait commands in binary and Arduino exports")
+    parser.add_argument(
+        "--simplify", type=int, default=None, metavar="TOLERANCE",
+        help="replace linear movements by ramp commands within the given position tolerance")
+    parser.add_argument(
+        "--keyframe-interval", type=int, default=0,
+        help="append an index of full state keyframes written every given number of frames")
+    parser.add_argument(
+        "--namespace", action="store_true",
+        help="wrap the Arduino exports in a scene namespace")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of Blender processes calculating a single export")
+    parser.add_argument(
+        "--addon", default=None,
+        help="module name of the add-on to enable, e.g. bl_ext.user_default.servo_animation")
+    parser.add_argument(
+        "--blender", default=None,
+        help="path to the Blender executable (default: the running Blender)")
+    parser.add_argument("--summary", default=None, help="file to write the JSON summary to")
+    parser.add_argument("--job", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result", default=None, help=argparse.SUPPRESS)
+
+    return parser.parse_args(argv)
+
+
+def get_script_args():
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+
+    return sys.argv[1:]
+
+
+def get_blender_binary(args):
+    if args.blender:
+        return args.blender
+
+    try:
+        import bpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return "blender"
+
+    return bpy.app.binary_path
+
+
+def get_job_command(args, filepath, output_dir, result_file):
+    command = [
+        get_blender_binary(args),
+        "--background",
+        "-noaudio",
+        filepath,
+    ]
+
+    if args.addon:
+        command += ["--addons", args.addon]
+
+    command += [
+        "--python-exit-code",
+        "1",
+        "--python",
+        os.path.abspath(__file__),
+        "--",
+        "--job",
+        "--result",
+        result_file,
+        "--output-dir",
+        output_dir,
+        "--workers",
+        str(args.workers),
+        "--binary-format",
+        args.binary_format,
+        "--keyframe-interval",
+        str(args.keyframe_interval),
+        "--max-error",
+        str(args.max_error),
+        "--formats",
+        *args.formats,
+    ]
+
+    if args.scenes:
+        command += ["--scenes", *args.scenes]
+
+    if not args.skip_duplicates:
+        command.append("--no-skip-duplicates")
+
+    if args.namespace:
+        command.append("--namespace")
+
+    if args.compress_holds:
+        command.append("--compress-holds")
+
+    if args.simplify is not None:
+        command += ["--simplify", str(args.simplify)]
+
+    command.append(filepath)
+
+    return command
+
+
+def run_job(args, filepath, output_dir):
+    start = time.time()
+    handle, result_file = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    result = {"file": filepath, "status": "FAILED", "exports": [], "error": None}
+
+    try:
+        process = subprocess.run(
+            get_job_command(args, filepath, output_dir, result_file),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=args.timeout,
+            check=False
+        )
+
+        if os.path.getsize(result_file) > 0:
+            with open(result_file, encoding="utf-8") as file:
+                result["exports"] = json.load(file)
+
+        if process.returncode != 0:
+            lines = process.stderr.decode("utf-8", errors="replace").strip().splitlines()
+            result["error"] = lines[-1] if lines else f"exit code {process.returncode}"
+        elif any(export["error"] for export in result["exports"]):
+            result["error"] = "at least one export failed"
+        else:
+            result["status"] = "FINISHED"
+    except subprocess.TimeoutExpired:
+        result["status"] = "TIMEOUT"
+        result["error"] = f"timed out after {args.timeout} seconds"
+    finally:
+        if os.path.exists(result_file):
+            os.remove(result_file)
+
+    result["duration"] = round(time.time() - start, 3)
+
+    return result
+
+
+def run_batch(args):
+    start = time.time()
+    used_names = set()
+    # Files with the same name in different directories need their own output directory
+    output_dirs = [
+        os.path.join(
+            args.output_dir,
+            get_unique_name(os.path.splitext(os.path.basename(filepath))[0], used_names)
+        )
+        for filepath in args.files
+    ]
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        results = list(executor.map(
+            lambda job: run_job(args, *job), zip(args.files, output_dirs)))
+
+    summary = {
+        "duration": round(time.time() - start, 3),
+        "files": results,
+        "failed": sum(result["status"] != "FINISHED" for result in results),
+    }
+    content = json.dumps(summary, indent=2)
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as file:
+            file.write(content)
+
+    print(content)
+
+    return 1 if summary["failed"] else 0
+
+
+def run_export(args, scene, filepath):
+    import bpy  # pylint: disable=import-outside-toplevel
+
+    options = {
+        "filepath": filepath,
+        "skip_duplicates": args.skip_duplicates,
+        "worker_count": args.workers,
+        "namespace": args.namespace,
+        "binary_format": args.binary_format.upper(),
+        "keyframe_interval": args.keyframe_interval,
+        "max_error": args.max_error,
+        "compress_holds": args.compress_holds,
+        "simplify": args.simplify is not None,
+        "tolerance": args.simplify or 0,
+    }
+
+    for export_format, (operator_name, _extension) in FORMATS.items():
+        options["export_" + operator_name] = export_format in args.formats
+
+    start = time.time()
+    error = None
+
+    try:
+        with bpy.context.temp_override(scene=scene):
+            if "FINISHED" not in bpy.ops.export_anim.servo_animation_multi(**options):
+                error = "export was cancelled"
+    except RuntimeError as exception:
+        error = str(exception).strip()
+
+    duration = round(time.time() - start, 3)
+    exports = []
+
+    for export_format in args.formats:
+        export_path = filepath + FORMATS[export_format][1]
+        exports.append({
+            "scene": scene.name,
+            "format": export_format,
+            "path": export_path,
+            "error": error,
+            "duration": duration,
+            "size": os.path.getsize(export_path) if os.path.exists(export_path) else 0
+        })
+
+    return exports
+
+
+def run_file(args):
+    import bpy  # pylint: disable=import-outside-toplevel
+
+    output_dir = os.path.abspath(args.output_dir)
+    scene_names = args.scenes or [scene.name for scene in bpy.data.scenes]
+    used_names = set()
+    exports = []
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    for scene_name in scene_names:
+        scene = bpy.data.scenes.get(scene_name)
+
+        if scene is not None:
+            # Different scene names can result in the same clean file name
+            name = get_unique_name(bpy.path.clean_name(scene.name), used_names)
+            exports += run_export(args, scene, os.path.join(output_dir, name))
+            continue
+
+        for export_format in args.formats:
+            exports.append({
+                "scene": scene_name,
+                "format": export_format,
+                "path": None,
+                "error": "scene not found",
+                "duration": 0,
+                "size": 0
+            })
+
+    with open(args.result, "w", encoding="utf-8") as file:
+        json.dump(exports, file)
+
+    return 0
+
+
+def main():
+    args = parse_args(get_script_args())
+
+    if args.job:
+        return run_file(args)
+
+    return run_batch(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+from bpy.types import Operator
+
+
+class AddLiveLink(Operator):
+    bl_idname = "servo_animation.add_live_link"
+    bl_label = "Add Link"
+    bl_description = "Add a live mode link to another controller"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        context.window_manager.servo_animation.live_links.add()
+
+        return {'FINISHED'}
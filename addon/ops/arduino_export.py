@@ -2,10 +2,13 @@ import bpy
 
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
-from .base_export import BaseExport
+from .base_export import BaseExport, HoldSettings, PackSettings, SimplifySettings
+from ..utils.encoders import ArduinoEncoder
 
 
-class ArduinoExport(Operator, BaseExport, ExportHelper):
+class ArduinoExport(
+    Operator, BaseExport, PackSettings, HoldSettings, SimplifySettings, ExportHelper
+):
     bl_idname = "export_anim.servo_animation_arduino"
     bl_label = "Servo Animation (.h)"
     bl_description = "Save an Arduino header file with servo position values of the active scene"
@@ -26,63 +29,35 @@ class ArduinoExport(Operator, BaseExport, ExportHelper):
             "variables in a namespace"
         )
     )
-
-    def export(self, positions, filepath, context):
-        fps, frames, seconds = self.get_time_meta(context.scene)
-        filename = self.get_blend_filename()
-
-        content = (
-            "/*\n  Blender Servo Animation Positions\n\n"
-            f"  FPS: {fps}\n"
-            f"  Frames: {frames}\n"
-            f"  Seconds: {seconds}\n"
-            f"  Bones: {len(positions[0])}\n"
-            f"  Scene: {context.scene.name}\n"
-            f"  File: {filename}\n"
-            "*/\n\n"
-            "#include <Arduino.h>\n"
-        )
-
-        commands = self.get_commands(positions)
-        length = len(commands)
-        lines = self.join_by_chunk_size(commands, self.chunk_size)
-
-        if self.namespace:
-            scene_name = self.format_scene_name()
-            content += f"\nnamespace {scene_name} {{\n"
-
-        content += (
-            f"\nconst byte FPS = {fps};"
-            f"\nconst int FRAMES = {frames};"
-            f"\nconst int LENGTH = {length};\n\n"
+    packed: bpy.props.BoolProperty(
+        name="Pack positions",
+        description=(
+            "Store the positions in as few bits as the range of each servo and the max error "
+            "allow, using the packed binary format instead of commands"
         )
+    )
 
-        content += f'const byte PROGMEM ANIMATION_DATA[LENGTH] = {{\n{lines}}};\n'
-
-        if self.namespace:
-            content += f"\n}} // namespace {scene_name}\n"
-
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(content)
+    def create_encoder(self, files, filepath, context):
+        meta = self.get_meta(context.scene)
+        scene_name = self.format_scene_name() if self.namespace else None
 
-    @classmethod
-    def join_by_chunk_size(cls, iterable, chunk_size):
-        output = ''
-        str_iterable = list(map(cls.format_hex, iterable))
+        if self.packed and self.simplify:
+            raise RuntimeError("Packed positions can not be combined with simplified curves")
 
-        for i in range(0, len(str_iterable), chunk_size):
-            output += '    ' + ', '.join(str_iterable[i:i + chunk_size]) + ',\n'
+        if self.packed and self.compress_holds:
+            raise RuntimeError("Packed positions can not be combined with compressed holds")
 
-        return output
+        packer = self.create_packer(context.scene) if self.packed else None
 
-    @classmethod
-    def format_hex(cls, byte):
-        return f'{byte:#04x}'
+        return self.create_simplifier(ArduinoEncoder(
+            files.open(filepath), meta, self.chunk_size, scene_name, packer=packer,
+            compress_holds=self.compress_holds), context.scene)
 
     @classmethod
-    def format_scene_name(cls):
+    def format_scene_name(cls, scene=None):
+        scene = scene or bpy.context.scene
         valid_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
-        scene_name = ''.join(c if c in valid_chars else '_' for c in bpy.context.scene.name)
+        scene_name = ''.join(c if c in valid_chars else '_' for c in scene.name)
 
         if scene_name[0].isdigit():
             scene_name = '_' + scene_name
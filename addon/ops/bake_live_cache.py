@@ -0,0 +1,61 @@
+from bpy.types import Operator
+from ..utils.batch_converter import BatchConverter
+from ..utils.live_cache import LiveCache
+from ..utils.live_mode import LiveMode
+from ..utils.servo_settings import get_active_pose_bones, ServoSettingsTable
+
+
+class BakeLiveCache(Operator):
+    bl_idname = "servo_animation.bake_live_cache"
+    bl_label = "Bake for Live Mode"
+    bl_description = (
+        "Calculate the servo positions of all frames of the active scene in advance, "
+        "so the live mode only has to look them up during the playback"
+    )
+    bl_options = {'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context):
+        return len(get_active_pose_bones(context.scene)) > 0
+
+    def execute(self, context):
+        scene = context.scene
+        original_frame = scene.frame_current
+        handler_enabled = LiveMode.is_handler_enabled()
+
+        ServoSettingsTable.clear()
+        LiveCache.invalidate(scene)
+        LiveMode.disable_handler()
+
+        try:
+            self.bake(scene)
+        finally:
+            scene.frame_set(original_frame)
+
+            if handler_enabled:
+                LiveMode.enable_handler()
+
+        context.window_manager.servo_animation.use_playback_cache = True
+        self.report(
+            {'INFO'}, f"Baked {LiveCache.get_frame_count(scene)} frames for the live mode")
+
+        return {'FINISHED'}
+
+    @staticmethod
+    def bake(scene):
+        pose_bones = get_active_pose_bones(scene)
+        converter = BatchConverter(pose_bones)
+        thresholds = [ServoSettingsTable.get(pose_bone.bone).threshold for pose_bone in pose_bones]
+        frames = range(scene.frame_start, scene.frame_end + 1)
+
+        for frame, (positions, in_range) in zip(frames, converter.calculate_frames(scene, frames)):
+            target_positions = []
+
+            for servo_id, position, position_in_range, threshold in zip(
+                converter.servo_ids, positions, in_range, thresholds
+            ):
+                if position_in_range:
+                    target_positions.append(
+                        (servo_id, position, round(threshold / 10), threshold))
+
+            LiveCache.set(scene, frame, target_positions)
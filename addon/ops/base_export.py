@@ -1,15 +1,88 @@
 import time
 import bpy
 
-from ..utils.converter import calculate_positions
+from ..utils.batch_converter import BatchConverter
+from ..utils.converter import iter_positions
+from ..utils.parallel import iter_positions_parallel
+from ..utils.encoders import (
+    COMMAND_START, COMMAND_END, LINE_BREAK, OutputFiles, encode, get_command, get_commands
+)
+from ..utils.export_task import ExportTask
 from ..utils.live_mode import LiveMode
-from ..utils.servo_settings import get_active_pose_bones
+from ..utils.packing import PositionPacker
+from ..utils.simplify import SimplifyingEncoder
+from ..utils.servo_settings import get_active_pose_bones, get_servo_ids, ServoSettingsTable
 
 
-class BaseExport:
-    COMMAND_START = 0x3C
-    COMMAND_END = 0x3E
-    LINE_BREAK = 10
+class PackSettings:
+    max_error: bpy.props.IntProperty(
+        name="Max Error",
+        description=(
+            "Maximum difference between the calculated and the packed positions, "
+            "larger values result in fewer steps and therefore fewer bits per servo"
+        ),
+        default=0,
+        min=0,
+        max=1000
+    )
+
+    def create_packer(self, scene):
+        servo_settings = [
+            ServoSettingsTable.get(pose_bone.bone) for pose_bone in get_active_pose_bones(scene)]
+        packer = PositionPacker.from_servo_settings(
+            scene.render.fps, servo_settings, self.max_error)
+        self._reporters.append(packer)
+
+        return packer
+
+
+class HoldSettings:
+    compress_holds: bpy.props.BoolProperty(
+        name="Compress holds",
+        description=(
+            "Replace runs of frames without any changed position by a single wait command "
+            "of 4 bytes, requires a player supporting wait commands"
+        ),
+        default=False
+    )
+
+
+class SimplifySettings:
+    simplify: bpy.props.BoolProperty(
+        name="Simplify curves",
+        description=(
+            "Only write the breakpoints of each servo and let the player interpolate "
+            "linear ramps between them, requires a player supporting ramp commands"
+        ),
+        default=False
+    )
+    tolerance: bpy.props.IntProperty(
+        name="Tolerance",
+        description="Maximum difference between the calculated and the interpolated positions",
+        default=1,
+        min=0,
+        max=1000
+    )
+
+    def create_simplifier(self, encoder, scene, report=True):
+        if not self.simplify:
+            return encoder
+
+        simplifier = SimplifyingEncoder(encoder, self.tolerance, get_servo_ids(scene))
+
+        if report:
+            self._reporters.append(simplifier)
+
+        return simplifier
+
+
+class BaseExport:  # pylint: disable=attribute-defined-outside-init
+    COMMAND_START = COMMAND_START
+    COMMAND_END = COMMAND_END
+    LINE_BREAK = LINE_BREAK
+
+    TIME_SLICE = 0.01
+    BACKGROUND_BLOCK_SIZE = 4
 
     skip_duplicates: bpy.props.BoolProperty(
         name="Skip unchanged positions",
@@ -17,6 +90,26 @@ class BaseExport:
         default=True
     )
 
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description=(
+            "Number of background Blender processes calculating the positions in parallel, "
+            "each processing a part of the frame range of a temporary copy of the file"
+        ),
+        default=1,
+        min=1,
+        max=64
+    )
+
+    use_background: bpy.props.BoolProperty(
+        name="Run in background",
+        description=(
+            "Calculate the positions in small time slices while Blender stays responsive, "
+            "press Esc to cancel the export"
+        ),
+        default=False
+    )
+
     @classmethod
     def poll(cls, context):
         pose_bones = get_active_pose_bones(context.scene)
@@ -28,52 +121,160 @@ class BaseExport:
         return False
 
     def execute(self, context):
-        start = time.time()
-        original_frame = context.scene.frame_current
-        original_live_mode = LiveMode.is_connected()
+        self.start_export(context)
 
-        if original_live_mode is True:
-            bpy.ops.servo_animation.stop_live_mode()
+        if self.use_background and context.window is not None:
+            return self.start_background_export(context)
 
         try:
-            positions = calculate_positions(context, self.skip_duplicates)
-            self.export(positions, self.filepath, context)
+            self.run_export(context)
         except RuntimeError as error:
             self.report({'ERROR'}, str(error))
 
             return {'CANCELLED'}
         finally:
-            context.scene.frame_set(original_frame)
+            self.finish_export()
+
+        self.report_duration()
+
+        return {'FINISHED'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.stop_background_export(context)
+            self.report({'WARNING'}, "Animation servo position export cancelled")
+
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        try:
+            finished = self._task.process(time.time() + self.TIME_SLICE)
+        except (RuntimeError, OSError) as error:
+            self.stop_background_export(context)
+            self.report({'ERROR'}, str(error))
+
+            return {'CANCELLED'}
+        except Exception:
+            # Unexpected errors must not leave the timer or partial files behind either
+            self.stop_background_export(context)
+            raise
+
+        if finished:
+            self.stop_background_export(context)
+            self.report_duration()
+
+            return {'FINISHED'}
+
+        context.workspace.status_text_set(self._task.get_status_text())
+
+        return {'PASS_THROUGH'}
+
+    def start_export(self, context):
+        self._start = time.time()
+        self._original_frames = [
+            (scene, scene.frame_current) for scene in self.get_scenes(context)]
+        self._original_live_mode = LiveMode.is_connected()
+        self._reporters = []
+
+        if self._original_live_mode is True:
+            bpy.ops.servo_animation.stop_live_mode()
+
+        ServoSettingsTable.clear()
+
+    def finish_export(self):
+        for scene, original_frame in self._original_frames:
+            scene.frame_set(original_frame)
+
+        if self._original_live_mode is True:
+            bpy.ops.servo_animation.start_live_mode('INVOKE_DEFAULT')
+
+    def start_background_export(self, context):
+        window_manager = context.window_manager
+        files = OutputFiles()
+        total_frames = sum(
+            self.get_time_meta(scene)[1] for scene, _frame in self._original_frames)
+
+        self._task = ExportTask(self.get_export_jobs(context, files), files, total_frames)
+        self._timer = window_manager.event_timer_add(self.TIME_SLICE, window=context.window)
+
+        window_manager.modal_handler_add(self)
+        context.workspace.status_text_set(self._task.get_status_text())
 
-            if original_live_mode is True:
-                bpy.ops.servo_animation.start_live_mode('INVOKE_DEFAULT')
+        return {'RUNNING_MODAL'}
 
-        end = time.time()
-        duration = round(end - start)
+    def stop_background_export(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
+        try:
+            self._task.cancel()
+        finally:
+            self.finish_export()
+
+    def report_duration(self):
+        duration = round(time.time() - self._start)
         unit = "second" if duration == 1 else "seconds"
         self.report(
             {'INFO'}, f"Animation servo positions exported after {duration} {unit}")
 
-        return {'FINISHED'}
+        for reporter in self._reporters:
+            self.report({'INFO'}, reporter.get_summary())
+
+    def get_scenes(self, context):
+        return [context.scene]
+
+    def run_export(self, context):
+        with OutputFiles() as files:
+            for positions, encoder in self.get_export_jobs(context, files):
+                encode(encoder, positions)
+
+            files.commit()
 
-    def get_commands(self, positions):
-        commands = []
+    def get_export_jobs(self, context, files):
+        positions = self.get_positions(context, context.scene)
 
-        for frame_positions in positions:
-            for servo_id in frame_positions:
-                position = frame_positions[servo_id]
-                commands += self.get_command(servo_id, position)
+        yield positions, self.create_encoder(files, self.filepath, context)
 
-            commands.append(self.LINE_BREAK)
+    def export(self, positions, filepath, context):
+        with OutputFiles() as files:
+            encode(self.create_encoder(files, filepath, context), positions)
+            files.commit()
 
-        return commands
+    def get_positions(self, context, scene, converter=None):
+        if self.worker_count > 1:
+            return iter_positions_parallel(
+                context, self.skip_duplicates, self.worker_count, scene)
+
+        if converter is None:
+            converter = BatchConverter(get_active_pose_bones(scene), self.get_block_size())
+
+        return iter_positions(context, self.skip_duplicates, scene, converter)
+
+    def get_block_size(self):
+        if self.use_background:
+            return self.BACKGROUND_BLOCK_SIZE
+
+        return BatchConverter.BLOCK_SIZE
+
+    def get_commands(self, positions, compress_holds=False):
+        return get_commands(positions, compress_holds)
 
     def get_command(self, servo_id, position):
-        command = [self.COMMAND_START, servo_id]
-        command += position.to_bytes(2, 'big')
-        command += [self.COMMAND_END]
+        return get_command(servo_id, position)
+
+    @classmethod
+    def get_meta(cls, scene):
+        fps, frames, seconds = cls.get_time_meta(scene)
 
-        return command
+        return {
+            "fps": fps,
+            "frames": frames,
+            "seconds": seconds,
+            "scene": scene.name,
+            "file": cls.get_blend_filename()
+        }
 
     @staticmethod
     def get_time_meta(scene):
@@ -2,10 +2,73 @@ import bpy
 
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
-from .base_export import BaseExport
+from .base_export import BaseExport, HoldSettings, PackSettings, SimplifySettings
+from ..utils.binary_v2 import BinaryV2Encoder
+from ..utils.container import SeekableEncoder
+from ..utils.encoders import BinaryEncoder
+from ..utils.packing import PackedBinaryEncoder
+from ..utils.servo_settings import get_servo_ids
 
 
-class BinaryExport(Operator, BaseExport, ExportHelper):
+class BinarySettings(PackSettings, HoldSettings, SimplifySettings):
+    FORMAT_ITEMS = [
+        ('COMMANDS', "Commands", "Write a command of 5 bytes for each changed position"),
+        (
+            'COMPACT',
+            "Compact (v2)",
+            "Write a header with a servo table followed by frames of delta encoded positions, "
+            "which results in much smaller files"
+        ),
+        (
+            'PACKED',
+            "Packed",
+            "Write a header with the range of each servo followed by frames of positions "
+            "packed into as few bits as the range and the max error allow"
+        ),
+    ]
+
+    binary_format: bpy.props.EnumProperty(
+        name="Binary Format",
+        items=FORMAT_ITEMS,
+        default='COMMANDS'
+    )
+    keyframe_interval: bpy.props.IntProperty(
+        name="Keyframe Interval",
+        description=(
+            "Write the positions of all servos every given number of frames and append an "
+            "index of these keyframes, so players can seek without reading the whole file. "
+            "Use 0 to write a plain stream without an index"
+        ),
+        default=0,
+        min=0,
+        max=65535
+    )
+
+    def create_binary_encoder(self, file, scene):
+        if self.simplify and (self.binary_format != 'COMMANDS' or self.keyframe_interval > 0):
+            raise RuntimeError(
+                "Simplified curves require the commands binary format without keyframes")
+
+        if self.compress_holds and self.binary_format != 'COMMANDS':
+            raise RuntimeError("Compressed holds require the commands binary format")
+
+        if self.binary_format == 'COMPACT':
+            try:
+                encoder = BinaryV2Encoder(file, scene.render.fps, get_servo_ids(scene))
+            except ValueError as error:
+                raise RuntimeError(str(error)) from error
+        elif self.binary_format == 'PACKED':
+            encoder = PackedBinaryEncoder(file, self.create_packer(scene))
+        else:
+            encoder = BinaryEncoder(file, self.compress_holds)
+
+        if self.keyframe_interval > 0:
+            return SeekableEncoder(file, encoder, self.keyframe_interval)
+
+        return self.create_simplifier(encoder, scene)
+
+
+class BinaryExport(Operator, BaseExport, BinarySettings, ExportHelper):
     bl_idname = "export_anim.servo_animation_binary"
     bl_label = "Servo Animation (.bin)"
     bl_description = "Save a binary file with servo position values of the active scene"
@@ -18,8 +81,5 @@ class BinaryExport(Operator, BaseExport, ExportHelper):
         maxlen=255
     )
 
-    def export(self, positions, filepath, _context):
-        commands = self.get_commands(positions)
-
-        with open(filepath, 'wb') as file:
-            file.write(bytes(commands))
+    def create_encoder(self, files, filepath, context):
+        return self.create_binary_encoder(files.open(filepath, 'wb'), context.scene)
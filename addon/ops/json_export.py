@@ -1,9 +1,9 @@
-import json
 import bpy
 
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
 from .base_export import BaseExport
+from ..utils.encoders import JsonEncoder
 
 
 class JsonExport(Operator, BaseExport, ExportHelper):
@@ -19,39 +19,29 @@ class JsonExport(Operator, BaseExport, ExportHelper):
         maxlen=255
     )
 
+    INDENT_ITEMS = [
+        ('None', 'No indent', ''),
+        ('1', '1 Space', ''),
+        ('2', '2 Spaces', ''),
+        ('3', '3 Spaces', ''),
+        ('4', '4 Spaces', ''),
+    ]
+
     indent: bpy.props.EnumProperty(
         name="Indent",
-        items=[
-            ('None', 'No indent', ''),
-            ('1', '1 Space', ''),
-            ('2', '2 Spaces', ''),
-            ('3', '3 Spaces', ''),
-            ('4', '4 Spaces', ''),
-        ],
+        items=INDENT_ITEMS,
         default='2',
     )
 
-    def export(self, positions, filepath, context):
-        fps, frames, seconds = self.get_time_meta(context.scene)
-        filename = self.get_blend_filename()
+    def create_encoder(self, files, filepath, context):
+        meta = self.get_meta(context.scene)
+        indent = self.parse_indent(self.indent)
+
+        return JsonEncoder(files.open(filepath), meta, indent)
 
+    @staticmethod
+    def parse_indent(indent):
         try:
-            indent = int(self.indent)
+            return int(indent)
         except ValueError:
-            indent = None
-
-        data = {
-            "description": 'Blender Servo Animation Positions',
-            "fps": fps,
-            "frames": frames,
-            "seconds": seconds,
-            "bones": len(positions[0]),
-            "file": filename,
-            "scene": context.scene.name,
-            "positions": positions
-        }
-
-        content = json.dumps(data, indent=indent)
-
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(content)
+            return None
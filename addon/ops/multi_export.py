@@ -0,0 +1,86 @@
+import os
+import bpy
+
+from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+from .base_export import BaseExport
+from .arduino_export import ArduinoExport
+from .binary_export import BinarySettings
+from .json_export import JsonExport
+from ..utils.encoders import ArduinoEncoder, JsonEncoder, FanOutEncoder
+
+
+class MultiExport(Operator, BaseExport, BinarySettings, ExportHelper):
+    bl_idname = "export_anim.servo_animation_multi"
+    bl_label = "Servo Animation (multiple formats)"
+    bl_description = (
+        "Calculate the servo position values of the active scene once "
+        "and save them in multiple formats"
+    )
+
+    filename_ext = ""
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.h;*.json;*.bin",
+        options={'HIDDEN'},
+        maxlen=255
+    )
+
+    export_arduino: bpy.props.BoolProperty(
+        name="Arduino (.h)",
+        description="Save an Arduino header file",
+        default=True
+    )
+    export_json: bpy.props.BoolProperty(
+        name="JSON (.json)",
+        description="Save a JSON file",
+        default=True
+    )
+    export_binary: bpy.props.BoolProperty(
+        name="Binary (.bin)",
+        description="Save a binary file",
+        default=True
+    )
+
+    namespace: bpy.props.BoolProperty(
+        name="Add scene namespace",
+        description=(
+            "Use the current scene name to wrap the position arrays and "
+            "variables of the Arduino header file in a namespace"
+        )
+    )
+    indent: bpy.props.EnumProperty(
+        name="JSON Indent",
+        items=JsonExport.INDENT_ITEMS,
+        default='2',
+    )
+
+    def execute(self, context):
+        if not (self.export_arduino or self.export_json or self.export_binary):
+            self.report({'ERROR'}, "No export format selected")
+
+            return {'CANCELLED'}
+
+        return BaseExport.execute(self, context)
+
+    def create_encoder(self, files, filepath, context):
+        meta = self.get_meta(context.scene)
+        base_path = os.path.splitext(filepath)[0]
+        encoders = []
+
+        if self.export_arduino:
+            scene_name = ArduinoExport.format_scene_name() if self.namespace else None
+            # Each format is simplified the same way, so the summary is only reported once
+            encoders.append(self.create_simplifier(ArduinoEncoder(
+                files.open(base_path + '.h'), meta, ArduinoExport.chunk_size, scene_name,
+                compress_holds=self.compress_holds), context.scene, report=not self.export_binary))
+
+        if self.export_json:
+            encoders.append(JsonEncoder(
+                files.open(base_path + '.json'), meta, JsonExport.parse_indent(self.indent)))
+
+        if self.export_binary:
+            encoders.append(
+                self.create_binary_encoder(files.open(base_path + '.bin', 'wb'), context.scene))
+
+        return FanOutEncoder(encoders)
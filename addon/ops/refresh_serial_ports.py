@@ -0,0 +1,17 @@
+from bpy.types import Operator
+from ..utils.serial_ports import SerialPortRegistry
+
+
+class RefreshSerialPorts(Operator):
+    bl_idname = "servo_animation.refresh_serial_ports"
+    bl_label = "Refresh Serial Ports"
+    bl_description = "Search for available serial ports"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        SerialPortRegistry.refresh()
+
+        for area in context.screen.areas if context.screen else []:
+            area.tag_redraw()
+
+        return {'FINISHED'}
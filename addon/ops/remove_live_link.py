@@ -0,0 +1,22 @@
+import bpy
+
+from bpy.types import Operator
+
+
+class RemoveLiveLink(Operator):
+    bl_idname = "servo_animation.remove_live_link"
+    bl_label = "Remove Link"
+    bl_description = "Remove this live mode link"
+    bl_options = {'INTERNAL'}
+
+    index: bpy.props.IntProperty()
+
+    def execute(self, context):
+        live_links = context.window_manager.servo_animation.live_links
+
+        if not 0 <= self.index < len(live_links):
+            return {'CANCELLED'}
+
+        live_links.remove(self.index)
+
+        return {'FINISHED'}
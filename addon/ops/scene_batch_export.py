@@ -0,0 +1,217 @@
+import os
+import bpy
+
+from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+from .base_export import BaseExport
+from .arduino_export import ArduinoExport
+from .binary_export import BinarySettings
+from .json_export import JsonExport
+from ..props.scene_property_group import ScenePropertyGroup
+from ..utils.batch_converter import BatchConverter
+from ..utils.encoders import ArduinoEncoder, JsonEncoder
+from ..utils.names import get_unique_name
+from ..utils.servo_settings import get_active_pose_bones
+
+
+class SceneBatchExport(Operator, BaseExport, BinarySettings, ExportHelper):
+    bl_idname = "export_anim.servo_animation_scenes"
+    bl_label = "Servo Animation (multiple scenes)"
+    bl_description = "Save the servo position values of multiple scenes at once"
+
+    filename_ext = ""
+
+    FORMAT_EXTENSIONS = {
+        'ARDUINO': ".h",
+        'JSON': ".json",
+        'BINARY': ".bin",
+    }
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.h;*.json;*.bin",
+        options={'HIDDEN'},
+        maxlen=255
+    )
+
+    export_format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('ARDUINO', "Arduino (.h)", "Save Arduino header files"),
+            ('JSON', "JSON (.json)", "Save JSON files"),
+            ('BINARY', "Binary (.bin)", "Save binary files"),
+        ]
+    )
+    single_file: bpy.props.BoolProperty(
+        name="Single header file",
+        description=(
+            "Save all scenes to one Arduino header file using a namespace per scene "
+            "instead of one file per scene"
+        ),
+        default=True
+    )
+    namespace: bpy.props.BoolProperty(
+        name="Add scene namespace",
+        description=(
+            "Use the scene name to wrap the position arrays and "
+            "variables of each Arduino header file in a namespace"
+        )
+    )
+    indent: bpy.props.EnumProperty(
+        name="Indent",
+        items=JsonExport.INDENT_ITEMS,
+        default='2',
+    )
+    scenes: bpy.props.CollectionProperty(type=ScenePropertyGroup)
+
+    @classmethod
+    def poll(cls, context):
+        for scene in bpy.data.scenes:
+            if get_active_pose_bones(scene):
+                return True
+
+        return False
+
+    def invoke(self, context, event):
+        self.scenes.clear()
+
+        for scene in bpy.data.scenes:
+            item = self.scenes.add()
+            item.name = scene.name
+            item.selected = bool(get_active_pose_bones(scene))
+
+        return ExportHelper.invoke(self, context, event)
+
+    def draw(self, _context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        layout.prop(self, "export_format")
+
+        if self.export_format == 'ARDUINO':
+            layout.prop(self, "single_file")
+
+            if not self.single_file:
+                layout.prop(self, "namespace")
+
+            layout.prop(self, "compress_holds")
+            self.draw_simplify(layout)
+        elif self.export_format == 'JSON':
+            layout.prop(self, "indent")
+        elif self.export_format == 'BINARY':
+            layout.prop(self, "binary_format")
+            layout.prop(self, "keyframe_interval")
+
+            if self.binary_format == 'PACKED':
+                layout.prop(self, "max_error")
+            elif self.binary_format == 'COMMANDS':
+                layout.prop(self, "compress_holds")
+                self.draw_simplify(layout)
+
+        layout.prop(self, "skip_duplicates")
+        layout.prop(self, "worker_count")
+        layout.prop(self, "use_background")
+
+        col = layout.column(heading="Scenes", align=True)
+
+        for item in self.scenes:
+            col.prop(item, "selected", text=item.name)
+
+    def draw_simplify(self, layout):
+        layout.prop(self, "simplify")
+
+        if self.simplify:
+            layout.prop(self, "tolerance")
+
+    def get_scenes(self, _context):
+        # Without a selection (e.g. when called from a script) all scenes are exported
+        if len(self.scenes) == 0:
+            candidates = list(bpy.data.scenes)
+        else:
+            candidates = [
+                bpy.data.scenes[item.name] for item in self.scenes
+                if item.selected and item.name in bpy.data.scenes
+            ]
+
+        return [scene for scene in candidates if get_active_pose_bones(scene)]
+
+    def get_export_jobs(self, context, files):
+        scenes = self.get_scenes(context)
+
+        if not scenes:
+            raise RuntimeError("No scene with servo settings selected")
+
+        base_path = os.path.splitext(self.filepath)[0]
+        converters = {}
+        names = self.get_scene_names(scenes)
+
+        if self.export_format == 'ARDUINO' and self.single_file:
+            file = files.open(base_path + ".h")
+            file.write(self.get_header(scenes))
+
+            for scene, (_name, scene_name) in zip(scenes, names):
+                positions = self.get_positions(
+                    context, scene, self.get_converter(converters, scene))
+
+                yield positions, self.create_simplifier(ArduinoEncoder(
+                    file, self.get_meta(scene), ArduinoExport.chunk_size,
+                    scene_name, standalone=False, compress_holds=self.compress_holds), scene)
+
+            return
+
+        extension = self.FORMAT_EXTENSIONS[self.export_format]
+
+        for scene, (name, scene_name) in zip(scenes, names):
+            positions = self.get_positions(context, scene, self.get_converter(converters, scene))
+            filepath = f"{base_path}_{name}{extension}"
+
+            yield positions, self.create_scene_encoder(
+                files, filepath, scene, scene_name if self.namespace else None)
+
+    @staticmethod
+    def get_scene_names(scenes):
+        # Different scene names can still map to the same file name or namespace
+        used_names = set()
+        used_namespaces = set()
+
+        return [
+            (
+                get_unique_name(bpy.path.clean_name(scene.name), used_names),
+                get_unique_name(ArduinoExport.format_scene_name(scene), used_namespaces)
+            )
+            for scene in scenes
+        ]
+
+    def create_scene_encoder(self, files, filepath, scene, scene_name):
+        meta = self.get_meta(scene)
+
+        if self.export_format == 'BINARY':
+            return self.create_binary_encoder(files.open(filepath, 'wb'), scene)
+
+        if self.export_format == 'JSON':
+            return JsonEncoder(files.open(filepath), meta, JsonExport.parse_indent(self.indent))
+
+        return self.create_simplifier(ArduinoEncoder(
+            files.open(filepath), meta, ArduinoExport.chunk_size, scene_name,
+            compress_holds=self.compress_holds), scene)
+
+    def get_converter(self, converters, scene):
+        # Scenes sharing the same armatures also share the bone index and settings
+        pose_bones = get_active_pose_bones(scene)
+        key = tuple(pose_bone.as_pointer() for pose_bone in pose_bones)
+
+        if key not in converters:
+            converters[key] = BatchConverter(pose_bones, self.get_block_size())
+
+        return converters[key]
+
+    def get_header(self, scenes):
+        scene_names = ", ".join(scene.name for scene in scenes)
+
+        return (
+            "/*\n  Blender Servo Animation Positions\n\n"
+            f"  Scenes: {scene_names}\n"
+            f"  File: {self.get_blend_filename()}\n"
+            "*/\n\n"
+            "#include <Arduino.h>\n"
+        )
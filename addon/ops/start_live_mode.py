@@ -3,20 +3,43 @@ import serial
 import websocket
 
 from bpy.types import Operator
+from ..utils.live_links import LiveLink, LiveRouter, parse_servo_ids
 from ..utils.live_mode import LiveMode
+from ..utils.protocol import get_encoder
+from ..utils.udp_connection import UdpConnection
+from ..utils.servo_settings import ServoSettingsTable
 
 
-class StartLiveMode(Operator):
+class StartLiveMode(Operator):  # pylint: disable=too-many-instance-attributes
     bl_idname = "servo_animation.start_live_mode"
     bl_label = "Live Mode"
     bl_description = "Start sending live position values via a live mode connection"
     bl_options = {'INTERNAL', 'BLOCKING'}
 
-    METHOD_ITEMS = [
+    LINK_METHOD_ITEMS = [
         (LiveMode.METHOD_SERIAL, "Serial", "Connect via USB"),
         (LiveMode.METHOD_SOCKET, "Web Socket", "Connect via a web socket"),
     ]
 
+    METHOD_ITEMS = LINK_METHOD_ITEMS + [
+        (
+            LiveMode.METHOD_UDP,
+            "UDP",
+            "Send datagrams via UDP, where lost or late positions are skipped"
+        ),
+        (
+            LiveMode.METHOD_LINKS,
+            "Multiple",
+            "Connect to multiple controllers at once, each receiving its own servos"
+        ),
+    ]
+
+    BAUD_ITEMS = [
+        ("19200", "19200", ""),
+        ("115200", "115200", ""),
+        ("192500", "192500", "")
+    ]
+
     method: bpy.props.EnumProperty(items=METHOD_ITEMS)
 
     serial_port: bpy.props.StringProperty()
@@ -26,6 +49,9 @@ class StartLiveMode(Operator):
     socket_port: bpy.props.IntProperty()
     socket_path: bpy.props.StringProperty()
 
+    udp_host: bpy.props.StringProperty()
+    udp_port: bpy.props.IntProperty()
+
     @classmethod
     def poll(cls, context):
         servo_animation = context.window_manager.servo_animation
@@ -40,14 +66,31 @@ class StartLiveMode(Operator):
                 or (
                     servo_animation.live_mode_method == LiveMode.METHOD_SOCKET
                     and servo_animation.socket_host != ""
+                ) or (
+                    servo_animation.live_mode_method == LiveMode.METHOD_UDP
+                    and servo_animation.udp_host != ""
+                ) or (
+                    servo_animation.live_mode_method == LiveMode.METHOD_LINKS
+                    and len(servo_animation.live_links) > 0
                 ) or bpy.app.background
             )
         )
 
     @classmethod
     def register_handler(cls):
+        ServoSettingsTable.clear()
+
+        servo_animation = bpy.context.window_manager.servo_animation
+
+        if (
+            servo_animation.use_sender_thread
+            or servo_animation.live_mode_method == LiveMode.METHOD_LINKS
+        ):
+            LiveMode.start_sender()
+
         bpy.app.handlers.frame_change_post.append(LiveMode.handler)
-        bpy.app.handlers.depsgraph_update_post.append(LiveMode.handler)
+        bpy.app.handlers.depsgraph_update_post.append(LiveMode.depsgraph_handler)
+        bpy.app.handlers.animation_playback_post.append(LiveMode.playback_handler)
         LiveMode.handler(bpy.context.scene, None)
 
     def execute(self, context):
@@ -60,6 +103,12 @@ class StartLiveMode(Operator):
         if self.method == LiveMode.METHOD_SOCKET:
             return self.open_socket(context)
 
+        if self.method == LiveMode.METHOD_UDP:
+            return self.open_udp(context)
+
+        if self.method == LiveMode.METHOD_LINKS:
+            return self.open_links(context)
+
         self.report({'ERROR'}, "Unknown live mode method")
 
         return {'CANCELLED'}
@@ -90,11 +139,9 @@ class StartLiveMode(Operator):
 
     def open_socket(self, _context):
         socket_url = f"ws://{self.socket_host}:{self.socket_port}{self.socket_path}"
-        socket_connection = websocket.WebSocket()
-        socket_connection.settimeout(1)
 
         try:
-            socket_connection.connect(socket_url)
+            socket_connection = self.connect_socket(socket_url)
         except (websocket.WebSocketException, OSError):
             self.report({'ERROR'}, f"Failed to open web socket connection with {socket_url}")
 
@@ -107,6 +154,74 @@ class StartLiveMode(Operator):
 
         return {'FINISHED'}
 
+    def open_udp(self, _context):
+        address = f"{self.udp_host}:{self.udp_port}"
+
+        try:
+            udp_connection = UdpConnection(self.udp_host, self.udp_port)
+        except (OSError, OverflowError):
+            self.report({'ERROR'}, f"Failed to open UDP connection with {address}")
+
+            return {'CANCELLED'}
+
+        LiveMode.set_connection(udp_connection)
+
+        self.register_handler()
+        self.report({'INFO'}, f"Opened UDP connection with {address}")
+
+        return {'FINISHED'}
+
+    def open_links(self, context):
+        servo_animation = context.window_manager.servo_animation
+        encode = get_encoder(servo_animation.live_mode_protocol)
+        links = []
+
+        if len(servo_animation.live_links) < 1:
+            self.report({'ERROR'}, "No live mode links configured")
+
+            return {'CANCELLED'}
+
+        for index, live_link in enumerate(servo_animation.live_links):
+            try:
+                links.append(self.open_link(live_link, encode))
+            except (serial.SerialException, websocket.WebSocketException, OSError, ValueError):
+                for link in links:
+                    link.close()
+
+                self.report({'ERROR'}, f"Failed to open live mode link {index + 1}")
+
+                return {'CANCELLED'}
+
+        LiveMode.set_connection(LiveRouter(links))
+
+        self.register_handler()
+        self.report({'INFO'}, f"Opened {len(links)} live mode links")
+
+        return {'FINISHED'}
+
+    @classmethod
+    def open_link(cls, live_link, encode):
+        servo_ids = parse_servo_ids(live_link.servo_ids)
+
+        if live_link.method == LiveMode.METHOD_SOCKET:
+            name = f"ws://{live_link.socket_host}:{live_link.socket_port}{live_link.socket_path}"
+            connection = cls.connect_socket(name)
+
+            return LiveLink(name, connection, connection.send_binary, servo_ids, encode)
+
+        name = live_link.serial_port
+        connection = serial.Serial(name, int(live_link.serial_baud))
+
+        return LiveLink(name, connection, connection.write, servo_ids, encode)
+
+    @staticmethod
+    def connect_socket(socket_url):
+        socket_connection = websocket.WebSocket()
+        socket_connection.settimeout(1)
+        socket_connection.connect(socket_url)
+
+        return socket_connection
+
     def invoke(self, context, _event):
         servo_animation = context.window_manager.servo_animation
 
@@ -119,4 +234,7 @@ class StartLiveMode(Operator):
         self.socket_port = servo_animation.socket_port
         self.socket_path = servo_animation.socket_path
 
+        self.udp_host = servo_animation.udp_host
+        self.udp_port = servo_animation.udp_port
+
         return self.execute(context)
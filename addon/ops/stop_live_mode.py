@@ -21,8 +21,11 @@ class StopLiveMode(Operator):
         if bpy.app.handlers.frame_change_post.count(LiveMode.handler):
             bpy.app.handlers.frame_change_post.remove(LiveMode.handler)
 
-        if bpy.app.handlers.depsgraph_update_post.count(LiveMode.handler):
-            bpy.app.handlers.depsgraph_update_post.remove(LiveMode.handler)
+        if bpy.app.handlers.depsgraph_update_post.count(LiveMode.depsgraph_handler):
+            bpy.app.handlers.depsgraph_update_post.remove(LiveMode.depsgraph_handler)
+
+        if bpy.app.handlers.animation_playback_post.count(LiveMode.playback_handler):
+            bpy.app.handlers.animation_playback_post.remove(LiveMode.playback_handler)
 
     def execute(self, context):
         method = context.window_manager.servo_animation.live_mode_method
@@ -35,6 +38,10 @@ class StopLiveMode(Operator):
             connection_type = "serial"
         elif method == LiveMode.METHOD_SOCKET:
             connection_type = "web socket"
+        elif method == LiveMode.METHOD_UDP:
+            connection_type = "UDP"
+        elif method == LiveMode.METHOD_LINKS:
+            connection_type = "multi-link"
         else:
             self.report({'ERROR'}, "Unknown live mode method")
 
@@ -1,20 +1,29 @@
 import bpy
 
 from bpy.types import PropertyGroup
-from ..utils.servo_settings import range_limit_value
+from ..utils.live_cache import LiveCache
+from ..utils.servo_settings import range_limit_value, ServoSettingsTable
 
 
-def update_position_min(self, _context):
+def update_servo_settings(_self, _context):
+    ServoSettingsTable.clear()
+    LiveCache.clear()
+
+
+def update_position_min(self, context):
+    update_servo_settings(self, context)
     self["position_min"] = range_limit_value(
         self.position_min, None, self.position_max)
 
 
-def update_position_max(self, _context):
+def update_position_max(self, context):
+    update_servo_settings(self, context)
     self["position_max"] = range_limit_value(
         self.position_max, self.position_min, None)
 
 
-def update_neutral_angle(self, _context):
+def update_neutral_angle(self, context):
+    update_servo_settings(self, context)
     self["neutral_angle"] = range_limit_value(
         self.neutral_angle, None, self.rotation_range)
 
@@ -22,14 +31,16 @@ def update_neutral_angle(self, _context):
 class BonePropertyGroup(PropertyGroup):
     active: bpy.props.BoolProperty(
         name="Provide Servo Settings",
-        description="Provide servo settings for this bone"
+        description="Provide servo settings for this bone",
+        update=update_servo_settings
     )
     servo_id: bpy.props.IntProperty(
         name="Servo ID",
         default=0,
         min=0,
         max=255,
-        description="The unique servo ID which is also used for sending live commands"
+        description="The unique servo ID which is also used for sending live commands",
+        update=update_servo_settings
     )
     position_min: bpy.props.IntProperty(
         name="Min Position",
@@ -55,7 +66,8 @@ class BonePropertyGroup(PropertyGroup):
         description=(
             "The maximum value change between frames which is also "
             "used for frame jump handling in live mode"
-        )
+        ),
+        update=update_servo_settings
     )
     neutral_angle: bpy.props.IntProperty(
         name="Neutral Angle",
@@ -74,7 +86,8 @@ class BonePropertyGroup(PropertyGroup):
             "Whether the applied rotation should be reversed when converting to "
             "position value which might be necessary to reflect the servo's "
             "positioning within a specific build"
-        )
+        ),
+        update=update_servo_settings
     )
     multiplier: bpy.props.FloatProperty(
         name="Multiplier",
@@ -86,14 +99,16 @@ class BonePropertyGroup(PropertyGroup):
         description=(
             "Multiplier to increase or decrease the rotation to adjust the "
             "intensity within a specific build"
-        )
+        ),
+        update=update_servo_settings
     )
     rotation_range: bpy.props.IntProperty(
         name="Rotation Range",
         default=180,
         min=0,
         max=360,
-        description="The manufactured rotation range of the servo in degrees (typically 180)"
+        description="The manufactured rotation range of the servo in degrees (typically 180)",
+        update=update_servo_settings
     )
     rotation_axis: bpy.props.EnumProperty(
         name="Euler Rotation Axis",
@@ -102,5 +117,6 @@ class BonePropertyGroup(PropertyGroup):
             ('0', 'X', "X Euler rotation axis"),
             ('1', 'Y', "Y Euler rotation axis"),
             ('2', 'Z', "Z Euler rotation axis")
-        ]
+        ],
+        update=update_servo_settings
     )
@@ -0,0 +1,25 @@
+import bpy
+
+from ..ops.start_live_mode import StartLiveMode
+
+
+class ConnectionSettings:
+    serial_baud: bpy.props.EnumProperty(
+        name="Baud Rate",
+        default="115200",
+        items=StartLiveMode.BAUD_ITEMS
+    )
+    socket_host: bpy.props.StringProperty(
+        name="Host",
+        default="127.0.0.1"
+    )
+    socket_port: bpy.props.IntProperty(
+        name="Port",
+        min=0,
+        max=65535,
+        default=80
+    )
+    socket_path: bpy.props.StringProperty(
+        name="Path",
+        default="/"
+    )
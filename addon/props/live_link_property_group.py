@@ -0,0 +1,29 @@
+import bpy
+
+from bpy.types import PropertyGroup
+from ..props.connection_settings import ConnectionSettings
+from ..ops.start_live_mode import StartLiveMode
+from ..utils.live_mode import LiveMode
+
+
+def search_serial_ports(_self, _context, edit_text):
+    return [port for port in LiveMode.get_serial_ports() if edit_text in port]
+
+
+class LiveLinkPropertyGroup(ConnectionSettings, PropertyGroup):
+    method: bpy.props.EnumProperty(
+        name="Method",
+        items=StartLiveMode.LINK_METHOD_ITEMS
+    )
+    servo_ids: bpy.props.StringProperty(
+        name="Servo IDs",
+        description=(
+            "Comma separated servo IDs or ranges like 0-7 which are sent via this link, "
+            "leave empty to send all servos"
+        ),
+        default=""
+    )
+    serial_port: bpy.props.StringProperty(
+        name="Port",
+        search=search_serial_ports
+    )
@@ -0,0 +1,11 @@
+import bpy
+
+from bpy.types import PropertyGroup
+
+
+class ScenePropertyGroup(PropertyGroup):
+    selected: bpy.props.BoolProperty(
+        name="Export",
+        description="Export the servo position values of this scene",
+        default=True
+    )
@@ -1,8 +1,14 @@
 import bpy
 
 from bpy.types import PropertyGroup
+from ..props.connection_settings import ConnectionSettings
 from ..ops.start_live_mode import StartLiveMode
+from ..props.live_link_property_group import LiveLinkPropertyGroup
 from ..utils.live_mode import LiveMode
+from ..utils.protocol import PROTOCOL_COMMANDS, PROTOCOL_PACKETS
+
+
+serial_port_items = []
 
 
 def get_serial_port_items(_self, _context):
@@ -15,40 +21,54 @@ def get_serial_port_items(_self, _context):
         for port in ports:
             items.append((port, port, ""))
 
-    return items
+    # Blender requires the returned strings to stay referenced, so the items are kept
+    if items != serial_port_items:
+        serial_port_items[:] = items
+
+    return serial_port_items
 
 
-class WindowManagerPropertyGroup(PropertyGroup):
+class WindowManagerPropertyGroup(ConnectionSettings, PropertyGroup):
     live_mode_method: bpy.props.EnumProperty(
         name="Method",
         items=StartLiveMode.METHOD_ITEMS
     )
+    live_mode_protocol: bpy.props.EnumProperty(
+        name="Protocol",
+        items=[
+            (PROTOCOL_COMMANDS, "Commands", "Send a separate command for each servo"),
+            (
+                PROTOCOL_PACKETS,
+                "Packets",
+                "Send all changed positions of a frame in a single packet with a checksum"
+            ),
+        ]
+    )
     serial_port: bpy.props.EnumProperty(
         name="Port",
         items=get_serial_port_items
     )
-    serial_baud: bpy.props.EnumProperty(
-        name="Baud Rate",
-        default="115200",
-        items=[
-            ("19200", "19200", ""),
-            ("115200", "115200", ""),
-            ("192500", "192500", "")
-        ]
-    )
-    socket_host: bpy.props.StringProperty(
+    udp_host: bpy.props.StringProperty(
         name="Host",
         default="127.0.0.1"
     )
-    socket_port: bpy.props.IntProperty(
+    udp_port: bpy.props.IntProperty(
         name="Port",
         min=0,
         max=65535,
-        default=80
+        default=4210
     )
-    socket_path: bpy.props.StringProperty(
-        name="Path",
-        default="/"
+    udp_refresh_interval: bpy.props.FloatProperty(
+        name="Refresh Interval",
+        description=(
+            "Seconds after which the positions of all servos are sent again, "
+            "so the receiver recovers from lost datagrams. Use 0 to disable the refresh"
+        ),
+        default=1,
+        min=0,
+        max=60,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE'
     )
     position_jump_handling: bpy.props.BoolProperty(
         name="Position Jump Handling",
@@ -58,3 +78,77 @@ class WindowManagerPropertyGroup(PropertyGroup):
         ),
         default=True
     )
+    jump_velocity: bpy.props.FloatProperty(
+        name="Jump Velocity",
+        description=(
+            "Maximum speed of the servos during position jump handling "
+            "in multiples of their threshold per second"
+        ),
+        default=10,
+        min=.1,
+        soft_max=100
+    )
+    jump_acceleration: bpy.props.FloatProperty(
+        name="Jump Acceleration",
+        description=(
+            "Maximum acceleration of the servos during position jump handling "
+            "in multiples of their threshold per second squared"
+        ),
+        default=50,
+        min=.1,
+        soft_max=1000
+    )
+    use_sender_thread: bpy.props.BoolProperty(
+        name="Send in Background",
+        description=(
+            "Send the positions from a separate thread so a slow connection doesn't block "
+            "Blender, only the latest position of each servo is sent"
+        ),
+        default=False
+    )
+    max_send_rate: bpy.props.IntProperty(
+        name="Max Send Rate",
+        description=(
+            "Maximum number of times per second the live mode sends positions, "
+            "in between only the latest positions are kept. Use 0 to send every update"
+        ),
+        default=0,
+        min=0,
+        max=1000
+    )
+    use_buffered_playback: bpy.props.BoolProperty(
+        name="Buffered Playback",
+        description=(
+            "Send the upcoming frames with timestamps ahead of time during the animation "
+            "playback, which requires a receiver supporting timed packets"
+        ),
+        default=False
+    )
+    playback_buffer_frames: bpy.props.IntProperty(
+        name="Buffer Frames",
+        description="Number of frames which are sent ahead of the current frame",
+        default=24,
+        min=2,
+        max=1000
+    )
+    playback_lead_time: bpy.props.IntProperty(
+        name="Lead Time (ms)",
+        description=(
+            "Expected transmission delay in milliseconds, which is added to the clock "
+            "synchronization so the servos do not lag behind"
+        ),
+        default=20,
+        min=0,
+        max=1000
+    )
+    use_playback_cache: bpy.props.BoolProperty(
+        name="Playback Cache",
+        description=(
+            "Remember the calculated positions of each frame until the armatures, "
+            "actions or servo settings change"
+        ),
+        default=False
+    )
+    live_links: bpy.props.CollectionProperty(
+        type=LiveLinkPropertyGroup
+    )
@@ -1,7 +1,7 @@
 
 from bpy.types import Panel
 from ..ops.calibrate_servo import CalibrateServo
-from ..utils.converter import calculate_position
+from ..utils.servo_position import calculate_position
 from ..utils.servo_settings import has_unique_servo_id
 
 
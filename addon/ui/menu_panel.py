@@ -2,7 +2,13 @@ from bpy.types import Panel
 from ..ops.json_export import JsonExport
 from ..ops.arduino_export import ArduinoExport
 from ..ops.binary_export import BinaryExport
+from ..ops.multi_export import MultiExport
+from ..ops.scene_batch_export import SceneBatchExport
 from ..ops.stop_live_mode import StopLiveMode
+from ..ops.bake_live_cache import BakeLiveCache
+from ..ops.refresh_serial_ports import RefreshSerialPorts
+from ..ops.add_live_link import AddLiveLink
+from ..ops.remove_live_link import RemoveLiveLink
 from ..ops.start_live_mode import StartLiveMode
 from ..utils.live_mode import LiveMode
 
@@ -28,6 +34,8 @@ class MenuPanel(Panel):
         col.operator(ArduinoExport.bl_idname, text="Arduino (.h)")
         col.operator(JsonExport.bl_idname, text="JSON (.json)")
         col.operator(BinaryExport.bl_idname, text="Binary (.bin)")
+        col.operator(MultiExport.bl_idname, text="Multiple formats")
+        col.operator(SceneBatchExport.bl_idname, text="Multiple scenes")
 
     @classmethod
     def draw_live_mode(cls, context, layout, col):
@@ -45,8 +53,10 @@ class MenuPanel(Panel):
         col.prop(servo_animation, "live_mode_method")
 
         if servo_animation.live_mode_method == LiveMode.METHOD_SERIAL:
-            sub = col.column(align=True)
+            row = col.row(align=True)
+            sub = row.row(align=True)
             sub.prop(servo_animation, "serial_port")
+            row.operator(RefreshSerialPorts.bl_idname, text="", icon='FILE_REFRESH')
             col.prop(servo_animation, "serial_baud")
 
             if servo_animation.serial_port == 'NONE':
@@ -57,5 +67,65 @@ class MenuPanel(Panel):
             col.prop(servo_animation, "socket_port")
             col.prop(servo_animation, "socket_path")
 
+        elif servo_animation.live_mode_method == LiveMode.METHOD_UDP:
+            col.prop(servo_animation, "udp_host")
+            col.prop(servo_animation, "udp_port")
+            col.prop(servo_animation, "udp_refresh_interval")
+
+        elif servo_animation.live_mode_method == LiveMode.METHOD_LINKS:
+            cls.draw_live_links(servo_animation, col)
+
+        col.prop(servo_animation, "live_mode_protocol")
+        col.prop(servo_animation, "use_sender_thread")
+
+        if live_mode_is_connected and servo_animation.live_mode_method == LiveMode.METHOD_LINKS:
+            cls.draw_live_link_stats(layout)
+
         col = layout.column()
         col.prop(servo_animation, "position_jump_handling")
+
+        sub = col.column(align=True)
+        sub.active = servo_animation.position_jump_handling
+        sub.prop(servo_animation, "jump_velocity")
+        sub.prop(servo_animation, "jump_acceleration")
+
+        col.prop(servo_animation, "max_send_rate")
+
+        row = col.row(align=True)
+        row.prop(servo_animation, "use_playback_cache")
+        row.operator(BakeLiveCache.bl_idname, text="", icon='FILE_REFRESH')
+
+        col.prop(servo_animation, "use_buffered_playback")
+
+        sub = col.column(align=True)
+        sub.active = servo_animation.use_buffered_playback
+        sub.prop(servo_animation, "playback_buffer_frames")
+        sub.prop(servo_animation, "playback_lead_time")
+
+    @classmethod
+    def draw_live_links(cls, servo_animation, col):
+        for index, live_link in enumerate(servo_animation.live_links):
+            box = col.box()
+            row = box.row(align=True)
+            row.prop(live_link, "method")
+            row.operator(RemoveLiveLink.bl_idname, text="", icon='X').index = index
+            box.prop(live_link, "servo_ids")
+
+            if live_link.method == LiveMode.METHOD_SERIAL:
+                box.prop(live_link, "serial_port")
+                box.prop(live_link, "serial_baud")
+            else:
+                box.prop(live_link, "socket_host")
+                box.prop(live_link, "socket_port")
+                box.prop(live_link, "socket_path")
+
+        col.operator(AddLiveLink.bl_idname, icon='ADD')
+
+    @classmethod
+    def draw_live_link_stats(cls, layout):
+        col = layout.column(align=True)
+
+        for stats in LiveMode.get_connection().get_stats():
+            icon = 'CHECKMARK' if stats["healthy"] else 'ERROR'
+            rate = stats["bytes_per_second"] / 1000
+            col.label(text=f"{stats['name']}: {rate:.1f} kB/s", icon=icon)
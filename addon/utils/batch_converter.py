@@ -0,0 +1,253 @@
+import math
+import mathutils
+import numpy as np
+
+from ..utils.rest_matrix_cache import RestMatrixCache
+from ..utils.servo_position import get_matrix_visual, get_position
+from ..utils.servo_settings import ServoSettingsTable
+
+FLT_EPSILON = float(np.finfo(np.float32).eps)
+ROUNDING_TOLERANCE = 1e-6
+# Maximum deviation of the double precision calculation from the single precision one of
+# mathutils, in radians for the Euler angles and in hundredths of a degree for the rotation
+EULER_TOLERANCE = 1e-5
+DEGREES_TOLERANCE = .02
+
+
+def round_decimals(values, decimals):
+    factor = 10 ** decimals
+    scaled = values * factor
+    rounded = np.rint(scaled) / factor
+
+    # Values which are (almost) exactly halfway between two decimals might be
+    # rounded differently than Python's correctly rounded round(), so they are
+    # resolved via the scalar implementation instead.
+    ambiguous = np.flatnonzero(is_near_half(scaled, ROUNDING_TOLERANCE))
+
+    for index in ambiguous:
+        rounded.flat[index] = round(float(values.flat[index]), decimals)
+
+    return rounded
+
+
+def is_near_half(values, tolerance):
+    with np.errstate(invalid='ignore'):
+        fraction = np.abs(values - np.trunc(values))
+
+        return np.abs(fraction - .5) < tolerance
+
+
+def matrices_to_euler(matrices):
+    # Vectorized equivalent of mathutils.Matrix.to_euler() using the XYZ order
+    rotation = matrices[..., :3, :3]
+    rotation = rotation / np.linalg.norm(rotation, axis=-2, keepdims=True)
+
+    cos_y = np.hypot(rotation[..., 0, 0], rotation[..., 1, 0])
+    gimbal_lock = cos_y <= 16 * FLT_EPSILON
+
+    euler_a = np.stack((
+        np.where(
+            gimbal_lock,
+            np.arctan2(-rotation[..., 1, 2], rotation[..., 1, 1]),
+            np.arctan2(rotation[..., 2, 1], rotation[..., 2, 2])
+        ),
+        np.arctan2(-rotation[..., 2, 0], cos_y),
+        np.where(
+            gimbal_lock,
+            0,
+            np.arctan2(rotation[..., 1, 0], rotation[..., 0, 0])
+        )
+    ), axis=-1)
+    euler_b = np.stack((
+        np.arctan2(-rotation[..., 2, 1], -rotation[..., 2, 2]),
+        np.arctan2(-rotation[..., 2, 0], -cos_y),
+        np.arctan2(-rotation[..., 1, 0], -rotation[..., 0, 0])
+    ), axis=-1)
+
+    sum_a = np.abs(euler_a).sum(axis=-1)
+    sum_b = np.abs(euler_b).sum(axis=-1)
+    use_b = ~gimbal_lock & (sum_a > sum_b)
+    euler = np.where(use_b[..., np.newaxis], euler_b, euler_a)
+
+    # Close to these decisions the single precision of mathutils can pick another solution
+    ambiguous = (
+        (np.abs(cos_y - 16 * FLT_EPSILON) < EULER_TOLERANCE)
+        | (np.abs(sum_a - sum_b) < EULER_TOLERANCE)
+        | np.any(np.abs(np.abs(euler) - math.pi) < EULER_TOLERANCE, axis=-1)
+    )
+
+    return euler, ambiguous
+
+
+class BatchConverter:  # pylint: disable=too-many-instance-attributes
+    BLOCK_SIZE = 64
+
+    def __init__(self, pose_bones, block_size=BLOCK_SIZE):
+        self.servo_ids = []
+        self.block_size = block_size
+
+        self._armatures = []
+        self._bone_count = 0
+
+        bone_indices = []
+        parent_indices = []
+        rest_matrices = []
+        settings = []
+        self._bones = []
+
+        for pose_bone in pose_bones:
+            offset, indices = self._register_armature(pose_bone.id_data)
+            servo_settings = ServoSettingsTable.get(pose_bone.bone)
+
+            bone_indices.append(offset + indices[pose_bone.name])
+
+            if pose_bone.parent:
+                parent_indices.append(offset + indices[pose_bone.parent.name])
+            else:
+                parent_indices.append(-1)
+
+            _matrix_bone_inverted, matrix_rest = RestMatrixCache.get(pose_bone.bone)
+            rest_matrices.append(matrix_rest)
+            self._bones.append((servo_settings, matrix_rest))
+            settings.append((
+                servo_settings.rotation_axis,
+                servo_settings.multiplier,
+                servo_settings.direction,
+                servo_settings.neutral_angle,
+                servo_settings.rotation_range,
+                servo_settings.position_min,
+                servo_settings.position_max
+            ))
+            self.servo_ids.append(servo_settings.servo_id)
+
+        # The last matrix slot is reserved for an identity matrix which is used
+        # as the parent pose matrix of bones without a parent
+        parent_indices = [
+            self._bone_count if index < 0 else index for index in parent_indices]
+
+        self._matrix_indices = np.array((bone_indices, parent_indices), dtype=np.intp)
+        self._rest_matrices = np.array(rest_matrices, dtype=np.float64).reshape((-1, 4, 4))
+        self._settings = np.array(settings, dtype=np.float64).reshape((-1, 7)).T
+
+    def _register_armature(self, obj):
+        for armature_obj, offset, indices in self._armatures:
+            if armature_obj == obj:
+                return offset, indices
+
+        offset = self._bone_count
+        indices = {pose_bone.name: index for index, pose_bone in enumerate(obj.pose.bones)}
+        self._armatures.append((obj, offset, indices))
+        self._bone_count += len(indices)
+
+        return offset, indices
+
+    def read_pose_matrices(self, depsgraph=None):
+        matrices = np.empty((self._bone_count + 1, 16), dtype=np.float32)
+        matrices[-1] = np.identity(4, dtype=np.float32).ravel()
+
+        for obj, offset, indices in self._armatures:
+            if depsgraph is not None:
+                obj = obj.evaluated_get(depsgraph)
+
+            obj.pose.bones.foreach_get(
+                "matrix", matrices[offset:offset + len(indices)].ravel())
+
+        # Blender stores matrices in column-major order
+        return matrices.reshape((-1, 4, 4)).transpose(0, 2, 1)
+
+    def matrix_visual(self, pose_matrices):
+        pose_matrices = pose_matrices.astype(np.float64)
+        bone_indices, parent_indices = self._matrix_indices
+        matrix_pose_bone = pose_matrices[..., bone_indices, :, :]
+        matrix_parent_pose_bone = pose_matrices[..., parent_indices, :, :]
+
+        matrices = (
+            self._rest_matrices
+            @ np.linalg.inv(matrix_parent_pose_bone)
+            @ matrix_pose_bone
+        )
+
+        # Match the single precision of mathutils matrices
+        return matrices.astype(np.float32).astype(np.float64)
+
+    def calculate(self, pose_matrices):
+        rotation_axis = self._settings[0].astype(np.intp)
+        euler, ambiguous = matrices_to_euler(self.matrix_visual(pose_matrices))
+        euler = euler.astype(np.float32).astype(np.float64)
+        rotation = np.take_along_axis(
+            euler,
+            np.broadcast_to(rotation_axis[:, np.newaxis], euler.shape[:-1] + (1,)),
+            axis=-1
+        )[..., 0]
+        position, in_range, ambiguous = self.map_positions(rotation, ambiguous)
+
+        # The double precision result can differ from mathutils' single precision near
+        # rounding boundaries, so these positions are calculated like calculate_position
+        for index in map(tuple, np.argwhere(ambiguous)):
+            position[index], in_range[index] = self.calculate_scalar(pose_matrices, index)
+
+        return position, in_range
+
+    def map_positions(self, rotation, ambiguous):
+        (
+            _rotation_axis, multiplier, direction, neutral_angle,
+            rotation_range, position_min, position_max
+        ) = self._settings
+        rotation_in_degrees = rotation * (180 / math.pi) * multiplier
+        ambiguous = ambiguous | is_near_half(
+            rotation_in_degrees * 100, DEGREES_TOLERANCE * np.maximum(1, np.abs(multiplier)))
+        rotation_in_degrees = round_decimals(rotation_in_degrees, 2) * direction
+
+        angle = neutral_angle - rotation_in_degrees
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mapped = angle * (position_max - position_min) / rotation_range + position_min
+
+        position = np.rint(mapped)
+        ambiguous = ambiguous | is_near_half(mapped, ROUNDING_TOLERANCE)
+        in_range = (
+            np.isfinite(position)
+            & (position_min <= position)
+            & (position <= position_max)
+        )
+        position = np.where(in_range, position, 0).astype(np.int64)
+
+        return position, in_range, ambiguous
+
+    def calculate_scalar(self, pose_matrices, index):
+        *frame, servo = index
+        servo_settings, matrix_rest = self._bones[servo]
+        bone_index, parent_index = self._matrix_indices[:, servo]
+        matrix_parent_pose_bone = None
+
+        if parent_index != self._bone_count:
+            matrix_parent_pose_bone = mathutils.Matrix(
+                pose_matrices[(*frame, parent_index)].tolist())
+
+        matrix = get_matrix_visual(
+            matrix_rest,
+            matrix_parent_pose_bone,
+            mathutils.Matrix(pose_matrices[(*frame, bone_index)].tolist())
+        )
+        position, _angle, in_range = get_position(servo_settings, matrix)
+
+        return (position if in_range else 0), in_range
+
+    def calculate_frames(self, scene, frames, depsgraph=None):
+        block = []
+
+        for frame in frames:
+            scene.frame_set(frame)
+            block.append(self.read_pose_matrices(depsgraph))
+
+            if len(block) == self.block_size:
+                yield from self._calculate_block(block)
+                block = []
+
+        if block:
+            yield from self._calculate_block(block)
+
+    def _calculate_block(self, block):
+        positions, in_range = self.calculate(np.stack(block))
+
+        yield from zip(positions.tolist(), in_range.tolist())
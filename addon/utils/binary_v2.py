@@ -0,0 +1,172 @@
+MAGIC = b"SRVA"
+VERSION = 2
+HEADER_LENGTH = 14
+FRAMES_OFFSET = 8
+MAX_SERVOS = 256
+
+
+def zigzag_encode(value):
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def zigzag_decode(value):
+    return value >> 1 if value & 1 == 0 else -((value + 1) >> 1)
+
+
+def encode_varint(value):
+    data = bytearray()
+
+    while value > 0x7F:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    data.append(value)
+
+    return data
+
+
+def decode_varint(data, offset):
+    value = 0
+    shift = 0
+
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated varint")
+
+        byte = data[offset]
+        value |= (byte & 0x7F) << shift
+        offset += 1
+
+        if byte & 0x80 == 0:
+            return value, offset
+
+        shift += 7
+
+
+def get_bitmap_length(servo_count):
+    return (servo_count + 7) // 8
+
+
+def encode_header(fps, frames, servo_ids):
+    if len(servo_ids) > MAX_SERVOS:
+        raise ValueError(f"A binary file can contain at most {MAX_SERVOS} servos")
+
+    return (
+        MAGIC
+        + bytes([VERSION, 0])
+        + fps.to_bytes(2, 'big')
+        + frames.to_bytes(4, 'big')
+        + len(servo_ids).to_bytes(2, 'big')
+        + bytes(servo_ids)
+    )
+
+
+def decode_header(data):
+    if len(data) < HEADER_LENGTH or data[:4] != MAGIC:
+        raise ValueError("Invalid binary header")
+
+    if data[4] != VERSION:
+        raise ValueError(f"Unsupported binary version {data[4]}")
+
+    servo_count = int.from_bytes(data[12:14], 'big')
+    servo_ids = list(data[HEADER_LENGTH:HEADER_LENGTH + servo_count])
+
+    if len(servo_ids) != servo_count:
+        raise ValueError("Truncated servo table")
+
+    return {
+        "version": data[4],
+        "fps": int.from_bytes(data[6:8], 'big'),
+        "frames": int.from_bytes(data[FRAMES_OFFSET:12], 'big'),
+        "servo_ids": servo_ids,
+    }
+
+
+class BinaryV2Encoder:
+    def __init__(self, file, fps, servo_ids):
+        self.file = file
+        self.fps = fps
+        self.servo_ids = list(dict.fromkeys(servo_ids))
+        self.columns = {servo_id: index for index, servo_id in enumerate(self.servo_ids)}
+        self.last_positions = [0] * len(self.servo_ids)
+        self.bitmap_length = get_bitmap_length(len(self.servo_ids))
+        self.frames = 0
+
+        self.file.write(encode_header(fps, 0, self.servo_ids))
+
+    def write(self, frame_positions):
+        self.file.write(self.encode_frame(frame_positions))
+        self.frames += 1
+
+    def encode_frame(self, frame_positions):
+        bitmap = bytearray(self.bitmap_length)
+        changes = []
+
+        for servo_id, position in frame_positions.items():
+            changes.append((self.columns[servo_id], position))
+
+        changes.sort()
+        deltas = bytearray()
+
+        for column, position in changes:
+            bitmap[column >> 3] |= 1 << (column & 7)
+            deltas += encode_varint(zigzag_encode(position - self.last_positions[column]))
+            self.last_positions[column] = position
+
+        return bytes(bitmap + deltas)
+
+    def start_keyframe(self):
+        # Keyframes are stored relative to 0, so decoding can start right there
+        self.last_positions = [0] * len(self.servo_ids)
+
+    def close(self):
+        # The number of frames is only known at the end, so it is patched into the header
+        self.file.seek(FRAMES_OFFSET)
+        self.file.write(self.frames.to_bytes(4, 'big'))
+        self.file.seek(0, 2)
+
+
+def get_frames_offset(header):
+    return HEADER_LENGTH + len(header["servo_ids"])
+
+
+def decode_frame(data, offset, servo_ids, last_positions):
+    bitmap_length = get_bitmap_length(len(servo_ids))
+    bitmap = data[offset:offset + bitmap_length]
+
+    if len(bitmap) != bitmap_length:
+        raise ValueError("Truncated frame")
+
+    offset += bitmap_length
+    frame_positions = {}
+
+    for column, servo_id in enumerate(servo_ids):
+        if bitmap[column >> 3] & 1 << (column & 7):
+            value, offset = decode_varint(data, offset)
+            last_positions[column] += zigzag_decode(value)
+            frame_positions[servo_id] = last_positions[column]
+
+    return frame_positions, offset
+
+
+def iter_frames(data, header, keyframe_interval=0, end=None):
+    servo_ids = header["servo_ids"]
+    last_positions = [0] * len(servo_ids)
+    offset = get_frames_offset(header)
+
+    for frame in range(header["frames"]):
+        if keyframe_interval and frame % keyframe_interval == 0:
+            last_positions = [0] * len(servo_ids)
+
+        frame_positions, offset = decode_frame(data, offset, servo_ids, last_positions)
+
+        yield frame_positions
+
+    if offset != (len(data) if end is None else end):
+        raise ValueError("Unexpected data after the last frame")
+
+
+def decode(data, keyframe_interval=0, end=None):
+    header = decode_header(data)
+
+    return header, list(iter_frames(data, header, keyframe_interval, end))
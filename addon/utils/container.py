@@ -0,0 +1,171 @@
+import mmap
+
+from ..utils import binary_v2, packing
+from ..utils.encoders import iter_command_frames
+
+INDEX_MAGIC = b"SRVI"
+FOOTER_MAGIC = b"SRVX"
+INDEX_HEADER_LENGTH = 14
+FOOTER_LENGTH = 8
+
+
+def encode_index(keyframe_interval, frames, offsets, index_offset):
+    data = bytearray(INDEX_MAGIC)
+    data += keyframe_interval.to_bytes(2, 'big')
+    data += frames.to_bytes(4, 'big')
+    data += len(offsets).to_bytes(4, 'big')
+
+    for offset in offsets:
+        data += offset.to_bytes(4, 'big')
+
+    data += index_offset.to_bytes(4, 'big')
+    data += FOOTER_MAGIC
+
+    return bytes(data)
+
+
+def decode_index(data):
+    if len(data) < FOOTER_LENGTH or data[-4:] != FOOTER_MAGIC:
+        raise ValueError("Missing frame index")
+
+    index_offset = int.from_bytes(data[-FOOTER_LENGTH:-4], 'big')
+    index = data[index_offset:len(data) - FOOTER_LENGTH]
+
+    if len(index) < INDEX_HEADER_LENGTH or index[:4] != INDEX_MAGIC:
+        raise ValueError("Invalid frame index")
+
+    count = int.from_bytes(index[10:14], 'big')
+
+    if len(index) != INDEX_HEADER_LENGTH + count * 4:
+        raise ValueError("Invalid frame index length")
+
+    offsets = [
+        int.from_bytes(index[offset:offset + 4], 'big')
+        for offset in range(INDEX_HEADER_LENGTH, len(index), 4)
+    ]
+
+    return {
+        "keyframe_interval": int.from_bytes(index[4:6], 'big'),
+        "frames": int.from_bytes(index[6:10], 'big'),
+        "offsets": offsets,
+        "index_offset": index_offset,
+    }
+
+
+class SeekableEncoder:
+    def __init__(self, file, encoder, keyframe_interval):
+        self.file = file
+        self.encoder = encoder
+        self.keyframe_interval = keyframe_interval
+        self.positions = {}
+        self.offsets = []
+        self.frames = 0
+
+    def write(self, frame_positions):
+        self.positions.update(frame_positions)
+
+        if self.frames % self.keyframe_interval == 0:
+            # A keyframe contains the full state, so playback can start from here
+            self.encoder.start_keyframe()
+            self.offsets.append(self.file.tell())
+            frame_positions = dict(self.positions)
+
+        self.encoder.write(frame_positions)
+        self.frames += 1
+
+    def close(self):
+        self.encoder.close()
+        index_offset = self.file.tell()
+        self.file.write(encode_index(
+            self.keyframe_interval, self.frames, self.offsets, index_offset))
+
+
+class ContainerReader:
+    def __init__(self, filepath):
+        self.file = open(filepath, 'rb')  # pylint: disable=consider-using-with
+        self.data = None
+
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.index = decode_index(self.data)
+        except (ValueError, OSError):
+            self.close()
+            raise
+
+        self.header = None
+        self.packed_header = None
+
+        if self.data[:4] == binary_v2.MAGIC:
+            self.header = binary_v2.decode_header(self.data)
+        elif self.data[:4] == packing.MAGIC:
+            self.packed_header = packing.decode_header(self.data)
+
+    def __len__(self):
+        return self.index["frames"]
+
+    def get_keyframe(self, frame):
+        if not 0 <= frame < len(self):
+            raise IndexError("frame index out of range")
+
+        keyframe = frame // self.index["keyframe_interval"]
+
+        return keyframe * self.index["keyframe_interval"], self.index["offsets"][keyframe]
+
+    def iter_frames(self, start=0, stop=None):
+        stop = len(self) if stop is None else min(stop, len(self))
+
+        if start >= stop:
+            return
+
+        keyframe, offset = self.get_keyframe(start)
+        last_positions = None
+        commands = None
+
+        if self.header is not None:
+            last_positions = [0] * len(self.header["servo_ids"])
+        elif self.packed_header is None:
+            commands = iter_command_frames(self.data, offset, self.index["index_offset"])
+
+        for frame in range(keyframe, stop):
+            if self.packed_header is not None:
+                frame_positions, offset = packing.decode_frame(
+                    self.data, offset, self.packed_header["quantizers"])
+            elif commands is not None:
+                frame_positions = next(commands, None)
+
+                if frame_positions is None:
+                    raise ValueError("Truncated frame")
+            else:
+                if frame % self.index["keyframe_interval"] == 0:
+                    last_positions = [0] * len(self.header["servo_ids"])
+
+                frame_positions, offset = binary_v2.decode_frame(
+                    self.data, offset, self.header["servo_ids"], last_positions)
+
+            if frame >= start:
+                yield frame_positions
+
+    def get_frame(self, frame):
+        return next(self.iter_frames(frame, frame + 1))
+
+    def get_state(self, frame):
+        keyframe, _offset = self.get_keyframe(frame)
+        positions = {}
+
+        for frame_positions in self.iter_frames(keyframe, frame + 1):
+            positions.update(frame_positions)
+
+        return positions
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
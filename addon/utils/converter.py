@@ -1,91 +1,55 @@
-import math
-import mathutils
+from ..utils.servo_settings import get_active_pose_bones, get_servo_ids
+from ..utils.batch_converter import BatchConverter
+from ..utils.positions import PositionStore
 
-from ..utils.servo_settings import get_active_pose_bones
 
+def calculate_positions(context, skip_duplicates, scene=None):
+    scene = scene or context.scene
+    return PositionStore.from_frames(
+        get_servo_ids(scene), iter_positions(context, skip_duplicates, scene))
 
-def range_map(value, from_low, from_high, to_low, to_high):
-    return (value - from_low) * (to_high - to_low) / (from_high - from_low) + to_low
 
+def get_scene_depsgraph(context, scene):
+    # The original pose is only updated for the active scene, so other scenes
+    # have to be read from their evaluated objects
+    if scene == context.scene:
+        return None
 
-def matrix_visual(pose_bone):
-    bone = pose_bone.bone
+    return scene.view_layers[0].depsgraph
 
-    matrix_pose_bone = pose_bone.matrix
-    matrix_bone = bone.matrix_local
 
-    if bone.parent:
-        matrix_parent_bone = bone.parent.matrix_local.copy()
-        matrix_parent_pose_bone = pose_bone.parent.matrix.copy()
-    else:
-        matrix_parent_bone = mathutils.Matrix()
-        matrix_parent_pose_bone = mathutils.Matrix()
-
-    matrix_bone_inverted = matrix_bone.copy().inverted()
-    matrix_parent_pose_bone_inverted = matrix_parent_pose_bone.copy().inverted()
-
-    return (
-        matrix_bone_inverted
-        @ matrix_parent_bone
-        @ matrix_parent_pose_bone_inverted
-        @ matrix_pose_bone
-    )
-
-
-def calculate_position(pose_bone):
-    servo_settings = pose_bone.bone.servo_settings
-    rotation_euler = matrix_visual(pose_bone).to_euler()
-    rotation_axis_index = int(servo_settings.rotation_axis)
-    rotation_in_degrees = round(math.degrees(
-        rotation_euler[rotation_axis_index]) * servo_settings.multiplier, 2)
-
-    if servo_settings.reverse_direction:
-        rotation_in_degrees = rotation_in_degrees * -1
-
-    angle = servo_settings.neutral_angle - rotation_in_degrees
-    position = round(range_map(angle, 0, servo_settings.rotation_range,
-                     servo_settings.position_min, servo_settings.position_max))
-
-    in_range = servo_settings.position_min <= position <= servo_settings.position_max
-
-    return position, round(angle, 2), in_range
-
-
-def calculate_positions(context, skip_duplicates):
-    positions = []
+def iter_positions(context, skip_duplicates, scene=None, converter=None):
+    scene = scene or context.scene
     last_positions = {}
-    pose_bones = get_active_pose_bones(context.scene)
+    converter = converter or BatchConverter(get_active_pose_bones(scene))
+    depsgraph = get_scene_depsgraph(context, scene)
     window_manager = context.window_manager
-    start = context.scene.frame_start
-    end = context.scene.frame_end + 1
+    start = scene.frame_start
+    end = scene.frame_end + 1
+    frames = range(start, end)
 
     window_manager.progress_begin(min=start, max=end)
 
-    for frame in range(start, end):
-        frame_positions = calculate_frame_positions(
-            context, pose_bones, last_positions, skip_duplicates, frame)
-        positions.append(frame_positions)
-        window_manager.progress_update(frame)
-
-    window_manager.progress_end()
+    try:
+        for frame, (frame_positions, frame_in_range) in zip(
+            frames, converter.calculate_frames(scene, frames, depsgraph)
+        ):
+            yield filter_frame_positions(
+                converter.servo_ids, frame_positions, frame_in_range, last_positions,
+                skip_duplicates)
+            window_manager.progress_update(frame)
+    finally:
+        window_manager.progress_end()
 
-    return positions
 
-
-def calculate_frame_positions(context, pose_bones, last_positions, skip_duplicates, frame):
+def filter_frame_positions(servo_ids, positions, in_range, last_positions, skip_duplicates):
     frame_positions = {}
 
-    context.scene.frame_set(frame)
-
-    for pose_bone in pose_bones:
-        bone = pose_bone.bone
-        servo_id = bone.servo_settings.servo_id
-        position, _angle, in_range = calculate_position(pose_bone)
-
+    for servo_id, position, position_in_range in zip(servo_ids, positions, in_range):
         if servo_id not in last_positions:
             last_positions[servo_id] = None
 
-        if not in_range or (skip_duplicates and last_positions[servo_id] == position):
+        if not position_in_range or (skip_duplicates and last_positions[servo_id] == position):
             continue
 
         frame_positions[servo_id] = position
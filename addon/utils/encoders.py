@@ -0,0 +1,463 @@
+import os
+import json
+import queue
+import shutil
+import tempfile
+import threading
+
+from collections import namedtuple
+
+COMMAND_START = 0x3C
+COMMAND_END = 0x3E
+LINE_BREAK = 10
+WAIT_START = 0x28
+WAIT_END = 0x29
+WAIT_MIN_FRAMES = 5
+WAIT_MAX_FRAMES = 0xFFFF
+RAMP_START = 0x2F
+RAMP_END = 0x5C
+RAMP_MAX_FRAMES = 0xFFFF
+
+Ramp = namedtuple('Ramp', ['target', 'frames'])
+
+
+def get_command(servo_id, position):
+    command = [COMMAND_START, servo_id]
+    command += position.to_bytes(2, 'big')
+    command += [COMMAND_END]
+
+    return command
+
+
+def get_ramp_command(servo_id, ramp):
+    command = [RAMP_START, servo_id]
+    command += ramp.target.to_bytes(2, 'big')
+    command += ramp.frames.to_bytes(2, 'big')
+    command += [RAMP_END]
+
+    return command
+
+
+def get_frame_commands(frame_positions):
+    commands = []
+
+    for servo_id, position in frame_positions.items():
+        if isinstance(position, Ramp):
+            commands += get_ramp_command(servo_id, position)
+        else:
+            commands += get_command(servo_id, position)
+
+    commands.append(LINE_BREAK)
+
+    return commands
+
+
+def get_wait_command(frames):
+    command = [WAIT_START]
+    command += frames.to_bytes(2, 'big')
+    command += [WAIT_END]
+
+    return command
+
+
+def get_hold_commands(frames):
+    commands = []
+
+    # A wait command only pays off once it replaces more line breaks than its own length
+    while frames >= WAIT_MIN_FRAMES:
+        wait_frames = min(frames, WAIT_MAX_FRAMES)
+        commands += get_wait_command(wait_frames)
+        frames -= wait_frames
+
+    commands += [LINE_BREAK] * frames
+
+    return commands
+
+
+class HoldCompressor:
+    def __init__(self):
+        self.holds = 0
+
+    def encode(self, frame_positions):
+        if not frame_positions:
+            self.holds += 1
+
+            return []
+
+        return self.flush() + get_frame_commands(frame_positions)
+
+    def flush(self):
+        commands = get_hold_commands(self.holds)
+        self.holds = 0
+
+        return commands
+
+
+def get_commands(positions, compress_holds=False):
+    commands = []
+    holds = HoldCompressor() if compress_holds else None
+
+    for frame_positions in positions:
+        if holds is None:
+            commands += get_frame_commands(frame_positions)
+        else:
+            commands += holds.encode(frame_positions)
+
+    if holds is not None:
+        commands += holds.flush()
+
+    return commands
+
+
+def decode_wait_command(data, offset):
+    command = data[offset:offset + 4]
+
+    if len(command) != 4 or command[0] != WAIT_START or command[3] != WAIT_END:
+        raise ValueError(f"Invalid wait command at offset {offset}")
+
+    return int.from_bytes(command[1:3], 'big'), offset + 4
+
+
+def decode_command_frame(data, offset):
+    frame_positions = {}
+
+    while offset < len(data):
+        if data[offset] == LINE_BREAK:
+            return frame_positions, offset + 1
+
+        if data[offset] == RAMP_START:
+            command = data[offset:offset + 7]
+
+            if len(command) != 7 or command[6] != RAMP_END or command[4:6] == b"\x00\x00":
+                raise ValueError(f"Invalid ramp command at offset {offset}")
+
+            frame_positions[command[1]] = Ramp(
+                int.from_bytes(command[2:4], 'big'), int.from_bytes(command[4:6], 'big'))
+            offset += 7
+            continue
+
+        if data[offset] != COMMAND_START or data[offset + 4:offset + 5] != bytes([COMMAND_END]):
+            raise ValueError(f"Invalid command at offset {offset}")
+
+        frame_positions[data[offset + 1]] = int.from_bytes(data[offset + 2:offset + 4], 'big')
+        offset += 5
+
+    raise ValueError("Truncated frame")
+
+
+def iter_command_frames(data, offset=0, end=None):
+    end = len(data) if end is None else end
+
+    while offset < end:
+        if data[offset] == WAIT_START:
+            frames, offset = decode_wait_command(data, offset)
+
+            for _frame in range(frames):
+                yield {}
+        else:
+            frame_positions, offset = decode_command_frame(data, offset)
+
+            yield frame_positions
+
+
+def decode_frame_commands(data, end=None):
+    return list(iter_command_frames(data, 0, end))
+
+
+class BinaryEncoder:
+    def __init__(self, file, compress_holds=False):
+        self.file = file
+        self.holds = HoldCompressor() if compress_holds else None
+
+    def write(self, frame_positions):
+        if self.holds is None:
+            self.file.write(bytes(get_frame_commands(frame_positions)))
+        else:
+            self.file.write(bytes(self.holds.encode(frame_positions)))
+
+    def start_keyframe(self):
+        self.flush()
+
+    def flush(self):
+        if self.holds is not None:
+            self.file.write(bytes(self.holds.flush()))
+
+    def close(self):
+        self.flush()
+
+
+class ArduinoEncoder:  # pylint: disable=too-many-instance-attributes
+    def __init__(  # pylint: disable=too-many-arguments
+        self, file, meta, chunk_size, scene_name=None, standalone=True, *, packer=None,
+        compress_holds=False
+    ):
+        self.file = file
+        self.standalone = standalone
+        self.packer = packer
+        self.holds = HoldCompressor() if compress_holds and packer is None else None
+        self.meta = meta
+        self.chunk_size = chunk_size
+        self.scene_name = scene_name
+        self.bones = 0
+        self.length = 0
+        self.pending = []
+        self.frames = 0
+        self.lines = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def write(self, frame_positions):
+        commands = []
+
+        if self.frames == 0:
+            self.bones = len(frame_positions)
+
+            if self.packer is not None:
+                commands += self.packer.get_header(self.meta['frames'])
+
+        if self.packer is not None:
+            commands += self.packer.encode_frame(frame_positions)
+        elif self.holds is not None:
+            commands += self.holds.encode(frame_positions)
+        else:
+            commands += get_frame_commands(frame_positions)
+
+        self.frames += 1
+        self.add_commands(commands)
+
+    def add_commands(self, commands):
+        self.length += len(commands)
+        self.pending += commands
+
+        while len(self.pending) >= self.chunk_size:
+            self.write_line(self.pending[:self.chunk_size])
+            del self.pending[:self.chunk_size]
+
+    def write_line(self, chunk):
+        self.lines.write('    ' + ', '.join(map(self.format_hex, chunk)) + ',\n')
+
+    def close(self):
+        if self.holds is not None:
+            self.add_commands(self.holds.flush())
+
+        if self.pending:
+            self.write_line(self.pending)
+            self.pending = []
+
+        self.file.write(self.get_header())
+        self.lines.seek(0)
+        shutil.copyfileobj(self.lines, self.file)
+        self.lines.close()
+        self.file.write('};\n')
+
+        if self.scene_name:
+            self.file.write(f"\n}} // namespace {self.scene_name}\n")
+
+    def get_header(self):
+        meta = self.meta
+        content = ''
+
+        if self.standalone:
+            content += (
+                "/*\n  Blender Servo Animation Positions\n\n"
+                f"  FPS: {meta['fps']}\n"
+                f"  Frames: {meta['frames']}\n"
+                f"  Seconds: {meta['seconds']}\n"
+                f"  Bones: {self.bones}\n"
+                f"  Scene: {meta['scene']}\n"
+                f"  File: {meta['file']}\n"
+                "*/\n\n"
+                "#include <Arduino.h>\n"
+            )
+
+        if self.scene_name:
+            content += f"\nnamespace {self.scene_name} {{\n"
+
+        content += (
+            f"\nconst byte FPS = {meta['fps']};"
+            f"\nconst int FRAMES = {meta['frames']};"
+            f"\nconst int LENGTH = {self.length};\n\n"
+        )
+
+        content += 'const byte PROGMEM ANIMATION_DATA[LENGTH] = {\n'
+
+        return content
+
+    @staticmethod
+    def format_hex(byte):
+        return f'{byte:#04x}'
+
+
+class JsonEncoder:
+    def __init__(self, file, meta, indent):
+        self.file = file
+        self.meta = meta
+        self.indent = indent
+        self.frames = 0
+
+        if indent is None:
+            self.separator = ', '
+            self.frame_prefix = ''
+        else:
+            self.separator = ','
+            self.frame_prefix = '\n' + ' ' * indent * 2
+
+    def write(self, frame_positions):
+        if self.frames == 0:
+            self.write_header(len(frame_positions))
+        else:
+            self.file.write(self.separator)
+
+        content = json.dumps(frame_positions, indent=self.indent)
+
+        if self.indent is not None:
+            content = content.replace('\n', self.frame_prefix)
+
+        self.file.write(self.frame_prefix + content)
+        self.frames += 1
+
+    def write_header(self, bones):
+        data = {
+            "description": 'Blender Servo Animation Positions',
+            "fps": self.meta['fps'],
+            "frames": self.meta['frames'],
+            "seconds": self.meta['seconds'],
+            "bones": bones,
+            "file": self.meta['file'],
+            "scene": self.meta['scene'],
+            "positions": []
+        }
+
+        content = json.dumps(data, indent=self.indent)
+
+        # Strip the empty list and the closing brace to append the frames
+        self.file.write(content[:content.rindex('[') + 1])
+
+    def close(self):
+        if self.frames == 0:
+            self.write_header(0)
+
+        if self.indent is None:
+            self.file.write(']}')
+        else:
+            self.file.write('\n' + ' ' * self.indent + ']\n}')
+
+
+class FanOutEncoder:
+    QUEUE_SIZE = 256
+
+    def __init__(self, encoders):
+        self.queues = []
+        self.threads = []
+        self.errors = []
+        self.aborted = False
+
+        for encoder in encoders:
+            frame_queue = queue.Queue(self.QUEUE_SIZE)
+            thread = threading.Thread(target=self.run, args=(encoder, frame_queue), daemon=True)
+            thread.start()
+            self.queues.append(frame_queue)
+            self.threads.append(thread)
+
+    def run(self, encoder, frame_queue):
+        failed = False
+
+        while True:
+            frame_positions = frame_queue.get()
+
+            if frame_positions is None:
+                break
+
+            if failed or self.aborted:
+                continue
+
+            try:
+                encoder.write(frame_positions)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.errors.append(error)
+                failed = True
+
+        if not failed and not self.aborted:
+            try:
+                encoder.close()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.errors.append(error)
+
+    def write(self, frame_positions):
+        for frame_queue in self.queues:
+            frame_queue.put(frame_positions)
+
+    def close(self):
+        self.stop()
+
+        if self.errors:
+            raise self.errors[0]
+
+    def abort(self):
+        # The remaining frames are skipped and the files are left to be discarded
+        self.aborted = True
+        self.stop()
+
+    def stop(self):
+        for frame_queue in self.queues:
+            frame_queue.put(None)
+
+        for thread in self.threads:
+            thread.join()
+
+        self.queues = []
+        self.threads = []
+
+
+def abort(encoder):
+    # Only encoders running their own threads have to be stopped
+    if isinstance(encoder, FanOutEncoder):
+        encoder.abort()
+
+
+def encode(encoder, positions):
+    try:
+        for frame_positions in positions:
+            encoder.write(frame_positions)
+    except Exception:
+        abort(encoder)
+        raise
+
+    encoder.close()
+
+
+class OutputFiles:
+    SUFFIX = '.part'
+
+    def __init__(self):
+        self.files = []
+
+    def open(self, filepath, mode='w'):
+        temp_path = filepath + self.SUFFIX
+
+        encoding = None if 'b' in mode else 'utf-8'
+        file = open(temp_path, mode, encoding=encoding)  # pylint: disable=consider-using-with
+
+        self.files.append((file, temp_path, filepath))
+
+        return file
+
+    def commit(self):
+        for file, temp_path, filepath in self.files:
+            file.close()
+            os.replace(temp_path, filepath)
+
+        self.files = []
+
+    def discard(self):
+        for file, temp_path, _filepath in self.files:
+            file.close()
+
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self.files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.discard()
@@ -0,0 +1,65 @@
+import time
+
+from ..utils.encoders import abort
+
+
+class ExportTask:
+    def __init__(self, jobs, files, total_frames):
+        self.jobs = jobs
+        self.files = files
+        self.total_frames = total_frames
+        self.job = None
+        self.frame_count = 0
+        self.start = time.time()
+
+    def process(self, deadline):
+        while time.time() < deadline:
+            if self.job is None:
+                self.job = next(self.jobs, None)
+
+                if self.job is None:
+                    self.files.commit()
+
+                    return True
+
+            positions, encoder = self.job
+            frame_positions = next(positions, None)
+
+            if frame_positions is None:
+                encoder.close()
+                self.job = None
+                continue
+
+            encoder.write(frame_positions)
+            self.frame_count += 1
+
+        return False
+
+    def cancel(self):
+        if self.job is not None:
+            positions, encoder = self.job
+            positions.close()
+            abort(encoder)
+            self.job = None
+
+        self.jobs.close()
+        self.files.discard()
+
+    def get_frames_per_second(self):
+        duration = time.time() - self.start
+
+        return self.frame_count / duration if duration > 0 else 0
+
+    def get_status_text(self):
+        frames_per_second = self.get_frames_per_second()
+        remaining = self.total_frames - self.frame_count
+
+        if frames_per_second > 0:
+            eta = f"{round(remaining / frames_per_second)} s"
+        else:
+            eta = "unknown"
+
+        return (
+            f"Exporting servo positions: {self.frame_count}/{self.total_frames} frames, "
+            f"{frames_per_second:.1f} frames/s, ETA {eta} (Esc to cancel)"
+        )
@@ -0,0 +1,79 @@
+import bpy
+
+from bpy.app.handlers import persistent
+
+
+class LiveCache:
+    _scenes = {}
+
+    @classmethod
+    def get(cls, scene, frame):
+        return cls._scenes.get(scene.as_pointer(), {}).get(frame)
+
+    @classmethod
+    def set(cls, scene, frame, target_positions):
+        cls._scenes.setdefault(scene.as_pointer(), {})[frame] = target_positions
+
+    @classmethod
+    def get_frame_count(cls, scene):
+        return len(cls._scenes.get(scene.as_pointer(), {}))
+
+    @classmethod
+    def invalidate(cls, scene):
+        cls._scenes.pop(scene.as_pointer(), None)
+
+    @classmethod
+    def clear(cls):
+        cls._scenes = {}
+
+
+def uses_action(obj, action):
+    animation_data = obj.animation_data
+
+    if animation_data is None:
+        return False
+
+    if animation_data.action == action:
+        return True
+
+    return any(
+        strip.action == action for track in animation_data.nla_tracks for strip in track.strips)
+
+
+def get_user_scenes(id_data):
+    if isinstance(id_data, bpy.types.Object):
+        return list(id_data.users_scene)
+
+    if isinstance(id_data, bpy.types.Armature):
+        objects = [obj for obj in bpy.data.objects if obj.data == id_data]
+    else:
+        objects = [obj for obj in bpy.data.objects if uses_action(obj, id_data)]
+
+    return [scene for obj in objects for scene in obj.users_scene]
+
+
+def is_pose_update(update):
+    if isinstance(update.id, bpy.types.Action):
+        return True
+
+    # Selection changes only sync the evaluated copy without updating the geometry
+    if isinstance(update.id, bpy.types.Armature):
+        return update.is_updated_geometry
+
+    return (
+        isinstance(update.id, bpy.types.Object) and update.id.type == 'ARMATURE'
+        and update.is_updated_geometry
+    )
+
+
+@persistent
+def invalidate_live_cache(_scene, depsgraph):
+    for update in depsgraph.updates:
+        if is_pose_update(update):
+            for scene in get_user_scenes(update.id.original):
+                LiveCache.invalidate(scene)
+
+
+@persistent
+def clear_live_cache(*_args):
+    LiveCache.clear()
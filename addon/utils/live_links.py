@@ -0,0 +1,112 @@
+import time
+
+from ..utils.live_sender import LiveSender
+from ..utils.protocol import encode_commands
+
+
+def parse_servo_ids(text):
+    servo_ids = set()
+
+    for part in text.replace(' ', '').split(','):
+        if part == '':
+            continue
+
+        if '-' in part:
+            start, end = part.split('-', 1)
+            servo_ids.update(range(int(start), int(end) + 1))
+        else:
+            servo_ids.add(int(part))
+
+    for servo_id in servo_ids:
+        if not 0 <= servo_id <= 255:
+            raise ValueError(f"Servo ID {servo_id} is out of range")
+
+    return servo_ids or None
+
+
+class LiveLink:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, name, connection, write, servo_ids=None, encode=encode_commands):
+        self.name = name
+        self.connection = connection
+        self.servo_ids = servo_ids
+        self.bytes_sent = 0
+        self.writes = 0
+        self.write_time = 0
+        self.started = time.monotonic()
+        self._write = write
+        self.sender = LiveSender(self.write, encode)
+
+    @property
+    def error(self):
+        return self.sender.error
+
+    def accepts(self, servo_id):
+        return self.servo_ids is None or servo_id in self.servo_ids
+
+    def write(self, data):
+        start = time.monotonic()
+        self._write(data)
+        self.write_time += time.monotonic() - start
+        self.bytes_sent += len(data)
+        self.writes += 1
+
+    def get_stats(self):
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+
+        return {
+            "name": self.name,
+            "healthy": self.error is None,
+            "error": None if self.error is None else str(self.error),
+            "bytes_sent": self.bytes_sent,
+            "writes": self.writes,
+            "bytes_per_second": self.bytes_sent / elapsed,
+            "average_write_time": self.write_time / self.writes if self.writes else 0,
+        }
+
+    def close(self):
+        self.sender.close()
+        self.connection.close()
+
+
+class LiveRouter:
+    def __init__(self, links):
+        self.links = links
+        self.closed = False
+
+    @property
+    def error(self):
+        # A single failing link is reported in its stats while the other links keep running
+        errors = [link.error for link in self.links]
+
+        if errors and None not in errors:
+            return errors[0]
+
+        return None
+
+    def is_connected(self):
+        return not self.closed and self.error is None
+
+    def send(self, servo_id, position):
+        for link in self.links:
+            if link.error is None and link.accepts(servo_id):
+                link.sender.send(servo_id, position)
+
+    def send_data(self, data):
+        for link in self.links:
+            if link.error is None:
+                link.sender.send_data(data)
+
+    def get_stats(self):
+        return [link.get_stats() for link in self.links]
+
+    def close(self, timeout=1):
+        if self.closed:
+            return
+
+        self.closed = True
+
+        for link in self.links:
+            link.sender.close(timeout)
+
+        for link in self.links:
+            link.connection.close()
@@ -6,10 +6,16 @@ import bpy
 import serial
 import websocket
 
-from serial.tools import list_ports
-
-from ..utils.servo_settings import get_active_pose_bones
-from ..utils.converter import calculate_position
+from ..utils.servo_settings import get_active_pose_bones, ServoSettingsTable
+from ..utils.servo_position import calculate_position
+from ..utils.live_cache import LiveCache
+from ..utils.live_links import LiveRouter
+from ..utils.live_sender import LiveSender
+from ..utils.playback import PlaybackStream
+from ..utils.position_ramp import PositionRamp
+from ..utils.protocol import encode_packets, get_encoder
+from ..utils.serial_ports import SerialPortRegistry
+from ..utils.udp_connection import UdpConnection
 
 class LiveMode:
     COMMAND_START = 0x3C
@@ -17,29 +23,43 @@ class LiveMode:
 
     METHOD_SERIAL = "SERIAL"
     METHOD_SOCKET = "SOCKET"
+    METHOD_UDP = "UDP"
+    METHOD_LINKS = "LINKS"
 
     STEP_DURATION_BASE = .3
+    SENDER_CHECK_INTERVAL = .1
+    RAMP_INTERVAL = .01
 
     _last_positions = {}
+    _pending_positions = {}
+    _last_send_time = 0
     _connection = None
+    _sender = None
+    _ramp = None
+    _playback = None
     _handler_enabled = True
 
     @classmethod
     def set_connection(cls, connection):
         cls._connection = connection
+        refresh_interval = bpy.context.window_manager.servo_animation.udp_refresh_interval
+
+        if (
+            isinstance(connection, UdpConnection)
+            and refresh_interval > 0
+            and not bpy.app.timers.is_registered(LiveMode._refresh_tick)
+        ):
+            bpy.app.timers.register(LiveMode._refresh_tick, first_interval=refresh_interval)
 
     @classmethod
     def is_connected(cls):
         method = bpy.context.window_manager.servo_animation.live_mode_method
 
+        # A disconnected serial device fails on the next write, which stops the live mode
         if method == LiveMode.METHOD_SERIAL:
             return (
                 isinstance(cls._connection, serial.Serial)
                 and cls._connection.is_open
-                and (
-                    cls._connection.port in cls.get_serial_ports()
-                    or bpy.app.background
-                )
             )
 
         if method == LiveMode.METHOD_SOCKET:
@@ -48,8 +68,58 @@ class LiveMode:
                 and cls._connection.connected
             )
 
+        if method == LiveMode.METHOD_UDP:
+            return (
+                isinstance(cls._connection, UdpConnection)
+                and cls._connection.connected
+            )
+
+        if method == LiveMode.METHOD_LINKS:
+            return (
+                isinstance(cls._connection, LiveRouter)
+                and cls._connection.is_connected()
+            )
+
         return False
 
+    @classmethod
+    def get_connection(cls):
+        return cls._connection
+
+    @classmethod
+    def start_sender(cls):
+        if isinstance(cls._connection, LiveRouter):
+            # Every link already sends from its own thread
+            cls._sender = cls._connection
+        else:
+            cls._sender = LiveSender(
+                cls._get_writer(), cls._get_encoder(), cls._get_max_pending_data())
+
+        if not bpy.app.timers.is_registered(cls.check_sender):
+            bpy.app.timers.register(cls.check_sender, first_interval=cls.SENDER_CHECK_INTERVAL)
+
+    @classmethod
+    def _get_max_pending_data(cls):
+        # Enough for a sync packet and a full buffer of frames of two frame changes
+        buffer_frames = bpy.context.window_manager.servo_animation.playback_buffer_frames
+
+        return 2 * (buffer_frames + 1)
+
+    @staticmethod
+    def check_sender():
+        # Timers are identified by the function object, so a static method is used here
+        sender = LiveMode._sender
+
+        if sender is None:
+            return None
+
+        if sender.error is not None:
+            bpy.ops.servo_animation.stop_live_mode(unexpected=True)
+
+            return None
+
+        return LiveMode.SENDER_CHECK_INTERVAL
+
     @classmethod
     def is_handler_enabled(cls):
         return cls._handler_enabled
@@ -64,12 +134,7 @@ class LiveMode:
 
     @classmethod
     def get_serial_ports(cls):
-        ports = []
-
-        for port in list_ports.comports():
-            ports.append(port.device)
-
-        return ports
+        return SerialPortRegistry.get_ports()
 
     @classmethod
     def get_last_position(cls, servo_id):
@@ -79,53 +144,219 @@ class LiveMode:
         return None
 
     @classmethod
-    def handler(cls, _scene, _depsgraph):
+    def depsgraph_handler(cls, _scene, depsgraph):
         if not cls.is_handler_enabled():
             return
 
-        cls.disable_handler()
+        armatures = cls.get_updated_armatures(bpy.context.scene, depsgraph)
 
-        threshold_exceeded = False
-        target_positions = []
-        servo_animation = bpy.context.window_manager.servo_animation
+        if armatures:
+            cls.handler(bpy.context.scene, depsgraph, armatures)
 
-        for pose_bone in get_active_pose_bones(bpy.context.scene):
-            position, _angle, in_range = calculate_position(pose_bone)
+    @classmethod
+    def get_updated_armatures(cls, scene, depsgraph):
+        updated = set()
 
-            if not in_range:
+        for update in depsgraph.updates:
+            if isinstance(update.id, (bpy.types.Object, bpy.types.Armature)):
+                updated.add(update.id.original.as_pointer())
+
+        if not updated:
+            return set()
+
+        armatures = set()
+
+        for obj in scene.objects:
+            if obj.type != "ARMATURE":
                 continue
 
-            servo_settings = pose_bone.bone.servo_settings
-            servo_id = servo_settings.servo_id
-            step = round(servo_settings.threshold / 10)
-            target_positions.append((servo_id, position, step))
+            if obj.as_pointer() in updated or obj.data.as_pointer() in updated:
+                armatures.add(obj.as_pointer())
+
+        return armatures
+
+    @classmethod
+    def handler(cls, _scene, _depsgraph, armatures=None):
+        if not cls.is_handler_enabled():
+            return
+
+        cls.disable_handler()
+
+        if cls._is_buffered_playback():
+            cls._handle_buffered_playback(bpy.context.scene)
+            cls.enable_handler()
+
+            return
+
+        if cls._playback is not None:
+            cls._stop_buffered_playback()
+
+        servo_animation = bpy.context.window_manager.servo_animation
+        target_positions = cls._get_target_positions(bpy.context.scene, armatures)
+        threshold_exceeded = False
+
+        if not servo_animation.position_jump_handling:
+            cls._ramp = None
 
+        for servo_id, position, _step, threshold in target_positions:
             if (
                 servo_id in cls._last_positions
-                and abs(position - cls._last_positions[servo_id]) > servo_settings.threshold
+                and abs(position - cls._last_positions[servo_id]) > threshold
             ):
                 threshold_exceeded = True
 
-        if (servo_animation.position_jump_handling and threshold_exceeded):
+        if servo_animation.position_jump_handling and threshold_exceeded:
+            for servo_id, _position, _step, _threshold in target_positions:
+                cls._pending_positions.pop(servo_id, None)
+
             cls.handle_position_jump(target_positions)
+        elif servo_animation.position_jump_handling and cls._ramp is not None:
+            # A new target interrupts the running ramp which then heads for the new target
+            cls._start_ramp(target_positions)
         else:
             cls.handle_default(target_positions)
 
         cls.enable_handler()
 
+    @classmethod
+    def _get_target_positions(cls, scene, armatures=None):
+        use_cache = (
+            armatures is None
+            and bpy.context.window_manager.servo_animation.use_playback_cache
+        )
+
+        if use_cache:
+            target_positions = LiveCache.get(scene, scene.frame_current)
+
+            if target_positions is not None:
+                return target_positions
+
+        target_positions = []
+
+        for pose_bone in get_active_pose_bones(scene):
+            if armatures is not None and pose_bone.id_data.as_pointer() not in armatures:
+                continue
+
+            position, _angle, in_range = calculate_position(pose_bone)
+
+            if not in_range:
+                continue
+
+            servo_settings = ServoSettingsTable.get(pose_bone.bone)
+            step = round(servo_settings.threshold / 10)
+            target_positions.append(
+                (servo_settings.servo_id, position, step, servo_settings.threshold))
+
+        if use_cache:
+            LiveCache.set(scene, scene.frame_current, target_positions)
+
+        return target_positions
+
     @classmethod
     def handle_default(cls, target_positions):
-        for servo_id, position, _step in target_positions:
-            cls.send_position(servo_id, position)
+        cls.queue_positions(
+            [(servo_id, position) for servo_id, position, _step, _threshold in target_positions])
+
+    @classmethod
+    def queue_positions(cls, positions):
+        max_send_rate = bpy.context.window_manager.servo_animation.max_send_rate
+
+        if max_send_rate == 0:
+            cls.send_positions(positions)
+
+            return
+
+        for servo_id, position in positions:
+            cls._pending_positions[servo_id] = position
+
+        interval = 1 / max_send_rate
+        elapsed = time.time() - cls._last_send_time
+
+        if elapsed >= interval:
+            cls._flush_positions()
+        elif not bpy.app.timers.is_registered(cls._send_tick):
+            bpy.app.timers.register(cls._send_tick, first_interval=interval - elapsed)
+
+    @staticmethod
+    def _send_tick():
+        LiveMode._flush_positions()
+
+    @classmethod
+    def _flush_positions(cls):
+        positions = list(cls._pending_positions.items())
+        cls._pending_positions = {}
+        cls._last_send_time = time.time()
+        cls.send_positions(positions)
 
     @classmethod
     def handle_position_jump(cls, target_positions):
         if bpy.context.screen.is_animation_playing:
             bpy.ops.screen.animation_cancel(restore_frame=False)
 
+        # Timers are not running without a user interface, so the steps are sent right away
+        if bpy.app.background:
+            cls._step_position_jump(target_positions)
+        else:
+            cls._start_ramp(target_positions)
+
+    @classmethod
+    def _start_ramp(cls, target_positions):
+        servo_animation = bpy.context.window_manager.servo_animation
+        now = time.time()
+        start_positions = dict(cls._last_positions)
+        start_velocities = {}
+        targets = {}
+        velocities = {}
+        accelerations = {}
+
+        if cls._ramp is not None:
+            if all(
+                cls._ramp.targets.get(servo_id) == position
+                for servo_id, position, _step, _threshold in target_positions
+            ):
+                return
+
+            # The new ramp continues from where the running ramp currently is
+            start_positions.update(cls._ramp.get_positions(now))
+            start_velocities = cls._ramp.get_velocities(now)
+            targets.update(cls._ramp.targets)
+            velocities.update(cls._ramp.velocities)
+            accelerations.update(cls._ramp.accelerations)
+
+        for servo_id, position, _step, threshold in target_positions:
+            targets[servo_id] = position
+            velocities[servo_id] = max(threshold, 1) * servo_animation.jump_velocity
+            accelerations[servo_id] = max(threshold, 1) * servo_animation.jump_acceleration
+
+        cls._ramp = PositionRamp(
+            start_positions, targets, velocities, accelerations, now, start_velocities)
+
+        if not bpy.app.timers.is_registered(LiveMode._ramp_tick):
+            bpy.app.timers.register(LiveMode._ramp_tick)
+
+    @staticmethod
+    def _ramp_tick():
+        ramp = LiveMode._ramp
+
+        if ramp is None:
+            return None
+
+        now = time.time()
+        LiveMode.send_positions(ramp.get_positions(now))
+
+        if ramp.is_finished(now):
+            if LiveMode._ramp is ramp:
+                LiveMode._ramp = None
+
+            return None
+
+        return LiveMode.RAMP_INTERVAL
+
+    @classmethod
+    def _step_position_jump(cls, target_positions):
         abs_steps = 0
 
-        for servo_id, position, step in target_positions:
+        for servo_id, position, step, _threshold in target_positions:
             diff = abs(position - cls._last_positions[servo_id])
             steps = math.ceil(diff / step)
             abs_steps = max(abs_steps, steps)
@@ -135,8 +366,9 @@ class LiveMode:
 
         for abs_step in range(abs_steps):
             window_manager.progress_update(abs_step)
+            step_positions = []
 
-            for servo_id, position, step in target_positions:
+            for servo_id, position, step, _threshold in target_positions:
                 new_position = cls._last_positions[servo_id]
 
                 if position == new_position:
@@ -150,36 +382,212 @@ class LiveMode:
                 if abs(position - new_position) < step:
                     new_position = position
 
-                cls.send_position(servo_id, new_position)
+                step_positions.append((servo_id, new_position))
 
+            cls.send_positions(step_positions)
             time.sleep(.01)
 
         window_manager.progress_end()
 
+    @classmethod
+    def _is_buffered_playback(cls):
+        servo_animation = bpy.context.window_manager.servo_animation
+        screen = bpy.context.screen
+
+        # Timed packets rely on every frame arriving, which datagrams do not guarantee
+        return (
+            servo_animation.use_buffered_playback
+            and servo_animation.live_mode_method != LiveMode.METHOD_UDP
+            and screen is not None
+            and screen.is_animation_playing
+        )
+
+    @classmethod
+    def playback_handler(cls, _scene, _depsgraph):
+        if cls._playback is not None:
+            cls._stop_buffered_playback()
+            cls.handler(bpy.context.scene, None)
+
+    @classmethod
+    def _handle_buffered_playback(cls, scene):
+        if cls._playback is None:
+            servo_animation = bpy.context.window_manager.servo_animation
+            cls._playback = PlaybackStream(
+                scene.render.fps / scene.render.fps_base,
+                scene.frame_start,
+                scene.frame_end,
+                servo_animation.playback_buffer_frames,
+                servo_animation.playback_lead_time
+            )
+            cls._pending_positions = {}
+            cls._ramp = None
+
+        cls._playback.advance(scene.frame_current)
+        packets = [cls._playback.get_sync_packet()]
+        packets += cls._get_frame_packets(scene, cls._playback.get_missing_frames())
+
+        cls._send_packets(packets)
+
+    @classmethod
+    def _get_frame_packets(cls, scene, missing_frames):
+        packets = []
+
+        # Upcoming frames are only read from the cache, as calculating them would require
+        # changing the frame from within the frame change handler
+        for index, missing_frame in missing_frames:
+            target_positions = None
+
+            if bpy.context.window_manager.servo_animation.use_playback_cache:
+                target_positions = LiveCache.get(scene, missing_frame)
+
+            if target_positions is None:
+                break
+
+            packets.append(cls._get_frame_packet(index, target_positions))
+
+        # Without a cached position the current frame is calculated and sent right away
+        if cls._playback.buffered_index <= cls._playback.index:
+            packets.append(cls._get_frame_packet(
+                cls._playback.index, cls._get_target_positions(scene)))
+
+        return packets
+
+    @classmethod
+    def _get_frame_packet(cls, index, target_positions):
+        return cls._playback.get_frame_packet(
+            index,
+            [(servo_id, position) for servo_id, position, _step, _threshold in target_positions]
+        )
+
+    @classmethod
+    def _stop_buffered_playback(cls):
+        cls._playback = None
+        # The servos moved on their own, so every position has to be sent again
+        cls._last_positions = {}
+        cls._send_packets([PlaybackStream.get_clear_packet()])
+
+    @classmethod
+    def _send_packets(cls, packets):
+        if cls._sender is not None:
+            if cls._sender.error is not None:
+                bpy.ops.servo_animation.stop_live_mode(unexpected=True)
+
+                return
+
+            for packet in packets:
+                cls._sender.send_data(packet)
+
+            return
+
+        try:
+            write = cls._get_writer()
+
+            for packet in packets:
+                write(packet)
+        except Exception:
+            bpy.ops.servo_animation.stop_live_mode(unexpected=True)
+
     @classmethod
     def send_position(cls, servo_id, position):
-        if position == cls._last_positions.get(servo_id):
+        cls.send_positions([(servo_id, position)])
+
+    @classmethod
+    def send_positions(cls, positions):
+        last_positions = dict(cls._last_positions)
+        changes = []
+
+        for servo_id, position in positions:
+            if position == last_positions.get(servo_id):
+                continue
+
+            last_positions[servo_id] = position
+            changes.append((servo_id, position))
+
+        if not changes:
             return
 
-        command = [cls.COMMAND_START, servo_id]
-        command += position.to_bytes(2, 'big')
-        command += [cls.COMMAND_END]
+        if cls._write_positions(changes):
+            cls._last_positions = last_positions
 
-        servo_animation = bpy.context.window_manager.servo_animation
+    @classmethod
+    def _write_positions(cls, positions):
+        if cls._sender is not None:
+            if cls._sender.error is not None:
+                bpy.ops.servo_animation.stop_live_mode(unexpected=True)
+
+                return False
+
+            for servo_id, position in positions:
+                cls._sender.send(servo_id, position)
+
+            return True
 
         try:
-            if servo_animation.live_mode_method == LiveMode.METHOD_SERIAL:
-                cls._connection.write(command)
-            elif servo_animation.live_mode_method == LiveMode.METHOD_SOCKET:
-                cls._connection.send_binary(bytes(command))
+            write = cls._get_writer()
 
-            cls._last_positions[servo_id] = position
+            for data in cls._get_encoder()(positions):
+                write(data)
         except Exception:
             bpy.ops.servo_animation.stop_live_mode(unexpected=True)
 
+            return False
+
+        return True
+
+    @staticmethod
+    def _refresh_tick():
+        connection = LiveMode._connection
+        refresh_interval = bpy.context.window_manager.servo_animation.udp_refresh_interval
+
+        if (
+            not isinstance(connection, UdpConnection)
+            or not connection.connected
+            or refresh_interval == 0
+        ):
+            return None
+
+        # Resending the whole state lets the receiver recover from lost datagrams
+        if LiveMode._last_positions:
+            LiveMode._write_positions(list(LiveMode._last_positions.items()))
+
+        return refresh_interval
+
+    @classmethod
+    def _get_encoder(cls):
+        servo_animation = bpy.context.window_manager.servo_animation
+
+        # Each datagram has to contain complete packets, so commands are never used here
+        if servo_animation.live_mode_method == LiveMode.METHOD_UDP:
+            return encode_packets
+
+        return get_encoder(servo_animation.live_mode_protocol)
+
+    @classmethod
+    def _get_writer(cls):
+        method = bpy.context.window_manager.servo_animation.live_mode_method
+
+        if method == LiveMode.METHOD_SOCKET:
+            return cls._connection.send_binary
+
+        return cls._connection.write
+
     @classmethod
     def close_connection(cls):
         cls._last_positions = {}
+        cls._pending_positions = {}
+        cls._last_send_time = 0
+        cls._ramp = None
+        cls._playback = None
+
+        if bpy.app.timers.is_registered(cls._send_tick):
+            bpy.app.timers.unregister(cls._send_tick)
+
+        if bpy.app.timers.is_registered(cls._refresh_tick):
+            bpy.app.timers.unregister(cls._refresh_tick)
+
+        if cls._sender:
+            cls._sender.close()
+            cls._sender = None
 
         if cls._connection:
             cls._connection.close()
@@ -0,0 +1,72 @@
+# pylint: disable=broad-exception-caught
+
+import threading
+
+from collections import deque
+
+from ..utils.protocol import encode_commands
+
+
+class LiveSender:  # pylint: disable=too-many-instance-attributes
+    MAX_PENDING_DATA = 256
+
+    def __init__(self, write, encode=encode_commands, max_pending_data=MAX_PENDING_DATA):
+        self.write = write
+        self.encode = encode
+        self.error = None
+        self._pending = {}
+        # The oldest data is dropped once a slow connection falls behind
+        self._pending_data = deque(maxlen=max_pending_data)
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def send(self, servo_id, position):
+        with self._condition:
+            if self._closed:
+                return
+
+            # Only the latest position per servo is kept, outdated ones are never sent
+            self._pending[servo_id] = position
+            self._condition.notify()
+
+    def send_data(self, data):
+        with self._condition:
+            if self._closed:
+                return
+
+            self._pending_data.append(data)
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._pending_data and not self._closed:
+                    self._condition.wait()
+
+                if not self._pending and not self._pending_data:
+                    return
+
+                pending, self._pending = self._pending, {}
+                pending_data = list(self._pending_data)
+                self._pending_data.clear()
+
+            try:
+                for data in pending_data + self.encode(pending.items()):
+                    self.write(data)
+            except Exception as error:
+                with self._condition:
+                    self.error = error
+                    self._closed = True
+                    self._pending = {}
+                    self._pending_data.clear()
+
+                return
+
+    def close(self, timeout=1):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self._thread.join(timeout)
@@ -0,0 +1,12 @@
+def get_unique_name(name, used_names):
+    unique_name = name
+    suffix = 2
+
+    # Compare case insensitive as file systems might not distinguish the case
+    while unique_name.lower() in used_names:
+        unique_name = f"{name}_{suffix}"
+        suffix += 1
+
+    used_names.add(unique_name.lower())
+
+    return unique_name
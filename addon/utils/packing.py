@@ -0,0 +1,242 @@
+from ..utils.binary_v2 import get_bitmap_length
+
+MAGIC = b"SRVP"
+VERSION = 1
+HEADER_LENGTH = 14
+FRAMES_OFFSET = 8
+SERVO_ENTRY_LENGTH = 7
+COMMAND_LENGTH = 5
+
+
+class ServoQuantizer:
+    def __init__(self, servo_id, position_min, position_max, step=1):
+        self.servo_id = servo_id
+        self.position_min = position_min
+        self.position_max = position_max
+        self.step = step
+        self.max_value = -(-(position_max - position_min) // self.step)
+        self.bits = max(1, self.max_value.bit_length())
+
+    def quantize(self, position):
+        value = (2 * (position - self.position_min) + self.step) // (2 * self.step)
+
+        return min(max(value, 0), self.max_value)
+
+    def dequantize(self, value):
+        return min(self.position_min + value * self.step, self.position_max)
+
+
+def get_frame_bits(quantizers, bitmap):
+    bits = 0
+
+    for column, quantizer in enumerate(quantizers):
+        if bitmap[column >> 3] & 1 << (column & 7):
+            bits += quantizer.bits
+
+    return bits
+
+
+class PositionPacker:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, fps, quantizers):
+        self.fps = fps
+        self.quantizers = list(quantizers)
+        self.columns = {
+            quantizer.servo_id: index for index, quantizer in enumerate(self.quantizers)}
+        self.bitmap_length = get_bitmap_length(len(self.quantizers))
+        self.errors = {quantizer.servo_id: [0, 0, 0] for quantizer in self.quantizers}
+        self.command_length = 0
+        self.packed_length = 0
+
+    @classmethod
+    def from_servo_settings(cls, fps, servo_settings, max_error=0):
+        # Rounding to the closest step never exceeds half a step
+        step = 2 * max_error + 1
+        quantizers = {}
+
+        for settings in servo_settings:
+            quantizers.setdefault(settings.servo_id, ServoQuantizer(
+                settings.servo_id, settings.position_min, settings.position_max, step))
+
+        return cls(fps, quantizers.values())
+
+    def get_header(self, frames=0):
+        data = bytearray(MAGIC)
+        data += bytes([VERSION, 0])
+        data += self.fps.to_bytes(2, 'big')
+        data += frames.to_bytes(4, 'big')
+        data += len(self.quantizers).to_bytes(2, 'big')
+
+        for quantizer in self.quantizers:
+            data.append(quantizer.servo_id)
+            data += quantizer.position_min.to_bytes(2, 'big')
+            data += quantizer.position_max.to_bytes(2, 'big')
+            data += quantizer.step.to_bytes(2, 'big')
+
+        self.packed_length += len(data)
+
+        return bytes(data)
+
+    def encode_frame(self, frame_positions):
+        bitmap = bytearray(self.bitmap_length)
+        changes = sorted(
+            (self.columns[servo_id], position) for servo_id, position in frame_positions.items())
+        value = 0
+        bits = 0
+
+        for column, position in changes:
+            quantizer = self.quantizers[column]
+            quantized = quantizer.quantize(position)
+            bitmap[column >> 3] |= 1 << (column & 7)
+            value = value << quantizer.bits | quantized
+            bits += quantizer.bits
+            self.record_error(quantizer.servo_id, abs(quantizer.dequantize(quantized) - position))
+
+        padding = -bits % 8
+        data = bytes(bitmap) + (value << padding).to_bytes((bits + padding) // 8, 'big')
+
+        self.command_length += len(changes) * COMMAND_LENGTH + 1
+        self.packed_length += len(data)
+
+        return data
+
+    def record_error(self, servo_id, error):
+        errors = self.errors[servo_id]
+        errors[0] += 1
+        errors[1] += error
+        errors[2] = max(errors[2], error)
+
+    def get_stats(self):
+        servos = {}
+
+        for quantizer in self.quantizers:
+            count, total, maximum = self.errors[quantizer.servo_id]
+            servos[quantizer.servo_id] = {
+                "bits": quantizer.bits,
+                "step": quantizer.step,
+                "max_error": maximum,
+                "mean_error": total / count if count else 0,
+            }
+
+        return {
+            "command_length": self.command_length,
+            "packed_length": self.packed_length,
+            "servos": servos,
+        }
+
+    def get_summary(self):
+        stats = self.get_stats()
+        count = sum(errors[0] for errors in self.errors.values())
+        total = sum(errors[1] for errors in self.errors.values())
+        max_error = max((servo["max_error"] for servo in stats["servos"].values()), default=0)
+        saving = 0
+
+        if stats["command_length"]:
+            saving = round(100 - 100 * stats["packed_length"] / stats["command_length"])
+
+        return (
+            f"Packed {count} positions into {stats['packed_length']} bytes instead of "
+            f"{stats['command_length']} bytes ({saving}% smaller), "
+            f"max error {max_error}, mean error {total / count if count else 0:.2f}"
+        )
+
+
+class PackedBinaryEncoder:
+    def __init__(self, file, packer):
+        self.file = file
+        self.packer = packer
+        self.frames = 0
+
+        self.file.write(packer.get_header())
+
+    def write(self, frame_positions):
+        self.file.write(self.packer.encode_frame(frame_positions))
+        self.frames += 1
+
+    def start_keyframe(self):
+        pass
+
+    def close(self):
+        # The number of frames is only known at the end, so it is patched into the header
+        self.file.seek(FRAMES_OFFSET)
+        self.file.write(self.frames.to_bytes(4, 'big'))
+        self.file.seek(0, 2)
+
+
+def decode_header(data):
+    if len(data) < HEADER_LENGTH or data[:4] != MAGIC:
+        raise ValueError("Invalid packed header")
+
+    if data[4] != VERSION:
+        raise ValueError(f"Unsupported packed version {data[4]}")
+
+    servo_count = int.from_bytes(data[12:14], 'big')
+    quantizers = []
+
+    for index in range(servo_count):
+        offset = HEADER_LENGTH + index * SERVO_ENTRY_LENGTH
+        entry = data[offset:offset + SERVO_ENTRY_LENGTH]
+
+        if len(entry) != SERVO_ENTRY_LENGTH:
+            raise ValueError("Truncated servo table")
+
+        step = int.from_bytes(entry[5:7], 'big')
+
+        if step < 1:
+            raise ValueError("Invalid quantization step")
+
+        quantizers.append(ServoQuantizer(
+            entry[0], int.from_bytes(entry[1:3], 'big'), int.from_bytes(entry[3:5], 'big'), step))
+
+    return {
+        "version": data[4],
+        "fps": int.from_bytes(data[6:8], 'big'),
+        "frames": int.from_bytes(data[FRAMES_OFFSET:12], 'big'),
+        "quantizers": quantizers,
+    }
+
+
+def get_frames_offset(header):
+    return HEADER_LENGTH + len(header["quantizers"]) * SERVO_ENTRY_LENGTH
+
+
+def decode_frame(data, offset, quantizers):
+    bitmap_length = get_bitmap_length(len(quantizers))
+    bitmap = data[offset:offset + bitmap_length]
+
+    if len(bitmap) != bitmap_length:
+        raise ValueError("Truncated frame")
+
+    offset += bitmap_length
+    bits = get_frame_bits(quantizers, bitmap)
+    length = (bits + 7) // 8
+    packed = data[offset:offset + length]
+
+    if len(packed) != length:
+        raise ValueError("Truncated frame")
+
+    value = int.from_bytes(packed, 'big')
+    shift = length * 8
+    frame_positions = {}
+
+    for column, quantizer in enumerate(quantizers):
+        if bitmap[column >> 3] & 1 << (column & 7):
+            shift -= quantizer.bits
+            quantized = value >> shift & (1 << quantizer.bits) - 1
+            frame_positions[quantizer.servo_id] = quantizer.dequantize(quantized)
+
+    return frame_positions, offset + length
+
+
+def decode(data, end=None):
+    header = decode_header(data)
+    offset = get_frames_offset(header)
+    frames = []
+
+    for _frame in range(header["frames"]):
+        frame_positions, offset = decode_frame(data, offset, header["quantizers"])
+        frames.append(frame_positions)
+
+    if offset != (len(data) if end is None else end):
+        raise ValueError("Unexpected data after the last frame")
+
+    return header, frames
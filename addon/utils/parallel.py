@@ -0,0 +1,140 @@
+import os
+import sys
+import subprocess
+import tempfile
+
+from array import array
+
+import bpy
+
+from ..utils.batch_converter import BatchConverter
+from ..utils.converter import filter_frame_positions, get_scene_depsgraph
+from ..utils.servo_settings import get_active_pose_bones, get_servo_ids
+
+ADDON_PACKAGE = __package__.rsplit('.', 1)[0]
+WORKER_EXPR = f"import importlib; importlib.import_module('{__name__}').run_worker()"
+
+
+def split_frames(start, end, worker_count):
+    frame_count = end - start
+    worker_count = max(1, min(worker_count, frame_count))
+    slices = []
+
+    for index in range(worker_count):
+        slice_start = start + frame_count * index // worker_count
+        slice_end = start + frame_count * (index + 1) // worker_count
+        slices.append((slice_start, slice_end))
+
+    return slices
+
+
+def iter_positions_parallel(context, skip_duplicates, worker_count, scene=None):
+    scene = scene or context.scene
+    servo_ids = get_servo_ids(scene)
+    slices = split_frames(scene.frame_start, scene.frame_end + 1, worker_count)
+    last_positions = {}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_files = run_workers(context, scene, slices, temp_dir)
+
+        for (start, end), output_file in zip(slices, output_files):
+            for positions, in_range in read_slice(output_file, end - start, len(servo_ids)):
+                yield filter_frame_positions(
+                    servo_ids, positions, in_range, last_positions, skip_duplicates)
+
+
+def run_workers(context, scene, slices, temp_dir):
+    blend_file = os.path.join(temp_dir, "export.blend")
+    output_files = [
+        os.path.join(temp_dir, f"slice_{index}.bin") for index in range(len(slices))]
+    processes = []
+
+    bpy.ops.wm.save_as_mainfile(filepath=blend_file, copy=True)
+    context.window_manager.progress_begin(0, len(slices))
+
+    try:
+        processes += [
+            start_worker(blend_file, scene.name, start, end, output_file)
+            for (start, end), output_file in zip(slices, output_files)
+        ]
+
+        for index, process in enumerate(processes):
+            _stdout, stderr = process.communicate()
+            context.window_manager.progress_update(index + 1)
+
+            if process.returncode != 0:
+                lines = stderr.decode('utf-8', errors='replace').strip().splitlines()
+                reason = lines[-1] if lines else f"exit code {process.returncode}"
+
+                raise RuntimeError(f"Export worker failed: {reason}")
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+
+        context.window_manager.progress_end()
+
+    return output_files
+
+
+def start_worker(blend_file, scene_name, start, end, output_file):
+    return subprocess.Popen(
+        [
+            bpy.app.binary_path,
+            "--background",
+            "-noaudio",
+            blend_file,
+            "--addons",
+            ADDON_PACKAGE,
+            "--python-exit-code",
+            "1",
+            "--python-expr",
+            WORKER_EXPR,
+            "--",
+            scene_name,
+            str(start),
+            str(end),
+            output_file
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+
+
+def read_slice(output_file, frame_count, bone_count):
+    length = frame_count * bone_count
+    positions = array('i')
+
+    with open(output_file, 'rb') as file:
+        try:
+            positions.fromfile(file, length)
+        except EOFError as error:
+            raise RuntimeError(f"Incomplete export worker output in {output_file}") from error
+
+        in_range = file.read(length)
+
+    if len(in_range) != length:
+        raise RuntimeError(f"Incomplete export worker output in {output_file}")
+
+    for offset in range(0, length, bone_count):
+        yield positions[offset:offset + bone_count], in_range[offset:offset + bone_count]
+
+
+def run_worker():
+    argv = sys.argv[sys.argv.index("--") + 1:]
+    scene_name, start, end, output_file = argv[0], int(argv[1]), int(argv[2]), argv[3]
+    scene = bpy.data.scenes[scene_name]
+    converter = BatchConverter(get_active_pose_bones(scene))
+    depsgraph = get_scene_depsgraph(bpy.context, scene)
+    positions = array('i')
+    in_range = bytearray()
+
+    for frame_positions, frame_in_range in converter.calculate_frames(
+        scene, range(start, end), depsgraph
+    ):
+        positions.extend(frame_positions)
+        in_range.extend(frame_in_range)
+
+    with open(output_file, 'wb') as file:
+        positions.tofile(file)
+        file.write(in_range)
@@ -0,0 +1,84 @@
+import heapq
+
+from ..utils.protocol import (
+    TIMED_PACKET_CLEAR, TIMED_PACKET_FRAME, TIMED_PACKET_SYNC,
+    TimedPacketDecoder, encode_timed_packet
+)
+
+
+class PlaybackStream:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, fps, frame_start, frame_end, buffer_frames, lead_time):
+        self.fps = fps
+        self.frame_start = frame_start
+        self.frame_count = max(1, frame_end - frame_start + 1)
+        self.buffer_frames = buffer_frames
+        self.lead_time = lead_time
+        self.frame = None
+        self.index = 0
+        self.buffered_index = 0
+
+    def get_timestamp(self, index):
+        return round(index * 1000 / self.fps)
+
+    def advance(self, frame):
+        if self.frame is not None:
+            # Frames are counted continuously, also when the playback loops
+            self.index += (frame - self.frame) % self.frame_count
+
+        self.frame = frame
+        self.buffered_index = max(self.buffered_index, self.index)
+
+    def get_missing_frames(self):
+        if self.buffered_index - self.index > self.buffer_frames // 2:
+            return []
+
+        missing_frames = []
+
+        for index in range(self.buffered_index, self.index + self.buffer_frames):
+            offset = self.frame - self.frame_start + index - self.index
+            missing_frames.append((index, self.frame_start + offset % self.frame_count))
+
+        return missing_frames
+
+    def get_sync_packet(self):
+        return encode_timed_packet(
+            TIMED_PACKET_SYNC, self.get_timestamp(self.index) + self.lead_time)
+
+    def get_frame_packet(self, index, positions):
+        self.buffered_index = max(self.buffered_index, index + 1)
+
+        return encode_timed_packet(TIMED_PACKET_FRAME, self.get_timestamp(index), positions)
+
+    @staticmethod
+    def get_clear_packet():
+        return encode_timed_packet(TIMED_PACKET_CLEAR, 0)
+
+
+class PlaybackReceiver:
+    def __init__(self):
+        self.decoder = TimedPacketDecoder()
+        self.offset = None
+        self.frames = []
+        self.count = 0
+
+    def feed(self, data, now):
+        for packet_type, timestamp, positions in self.decoder.feed(data):
+            if packet_type == TIMED_PACKET_SYNC:
+                self.offset = now * 1000 - timestamp
+            elif packet_type == TIMED_PACKET_CLEAR:
+                self.frames = []
+            elif packet_type == TIMED_PACKET_FRAME:
+                heapq.heappush(self.frames, (timestamp, self.count, positions))
+                self.count += 1
+
+    def poll(self, now):
+        if self.offset is None:
+            return []
+
+        stream_time = now * 1000 - self.offset
+        due_frames = []
+
+        while self.frames and self.frames[0][0] <= stream_time:
+            due_frames.append(heapq.heappop(self.frames)[2])
+
+        return due_frames
@@ -0,0 +1,126 @@
+import math
+import time
+
+
+class PositionRamp:
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, start_positions, target_positions, velocities, accelerations, start=None,
+                 start_velocities=None):
+        self.targets = dict(target_positions)
+        self.velocities = velocities
+        self.accelerations = accelerations
+        self.start = time.time() if start is None else start
+        self.duration = 0
+        self.profiles = {}
+        start_velocities = start_velocities or {}
+        plans = {}
+
+        for servo_id, target in self.targets.items():
+            start_position = start_positions.get(servo_id, target)
+            phases, distance, velocity = self.get_brake_phases(
+                target - start_position, start_velocities.get(servo_id, 0),
+                accelerations[servo_id])
+            brake_duration = sum(phase[0] for phase in phases)
+            plans[servo_id] = (start_position, phases, distance, velocity, brake_duration)
+            self.duration = max(
+                self.duration,
+                brake_duration + self.get_min_duration(
+                    abs(distance), velocities[servo_id], accelerations[servo_id], velocity)
+            )
+
+        # Every servo gets its own profile with the same duration so they arrive together
+        for servo_id, (start_position, phases, distance, velocity, brake_duration) in plans.items():
+            phases += self.get_phases(
+                distance, velocity, accelerations[servo_id], self.duration - brake_duration)
+            self.profiles[servo_id] = (start_position, self.targets[servo_id], phases)
+
+    @staticmethod
+    def get_brake_phases(distance, velocity, acceleration):
+        # Moving away from the target or too fast to stop in time requires braking first
+        if velocity * distance < 0 or velocity * velocity / (2 * acceleration) > abs(distance):
+            duration = abs(velocity) / acceleration
+            phase = (duration, velocity, -math.copysign(acceleration, velocity))
+
+            return [phase], distance - velocity * duration / 2, 0
+
+        return [], distance, abs(velocity)
+
+    @staticmethod
+    def get_min_duration(distance, max_velocity, acceleration, velocity=0):
+        peak_velocity = math.sqrt(acceleration * distance + velocity * velocity / 2)
+
+        if peak_velocity <= max_velocity:
+            return (2 * peak_velocity - velocity) / acceleration
+
+        change = max_velocity - velocity
+
+        return (
+            distance / max_velocity
+            + (change * abs(change) + max_velocity * max_velocity) / (2 * acceleration * max_velocity)
+        )
+
+    @staticmethod
+    def get_velocity(distance, velocity, acceleration, duration):
+        # Solve distance = (v² - v0²) / 2a + v * (duration - (v - v0) / a - v / a) + v² / 2a
+        if acceleration * distance + velocity * velocity / 2 >= velocity * acceleration * duration:
+            linear = acceleration * duration + velocity
+            discriminant = max(
+                0, linear * linear - 4 * (acceleration * distance + velocity * velocity / 2))
+
+            return (linear - math.sqrt(discriminant)) / 2
+
+        # The remaining time is long enough to slow down to the cruise velocity instead
+        return max(0, (distance - velocity * velocity / (2 * acceleration))
+                   / (duration - velocity / acceleration))
+
+    @classmethod
+    def get_phases(cls, distance, velocity, acceleration, duration):
+        direction = 1 if distance >= 0 else -1
+        cruise_velocity = cls.get_velocity(abs(distance), velocity, acceleration, duration)
+        ramp_duration = abs(cruise_velocity - velocity) / acceleration
+        brake_duration = cruise_velocity / acceleration
+        ramp_acceleration = acceleration if cruise_velocity >= velocity else -acceleration
+
+        return [
+            (ramp_duration, direction * velocity, direction * ramp_acceleration),
+            (max(0, duration - ramp_duration - brake_duration), direction * cruise_velocity, 0),
+            (brake_duration, direction * cruise_velocity, -direction * acceleration),
+        ]
+
+    def is_finished(self, now=None):
+        now = time.time() if now is None else now
+
+        return now - self.start >= self.duration
+
+    def get_state(self, servo_id, now):
+        start_position, target, phases = self.profiles[servo_id]
+        elapsed = min(max(now - self.start, 0), self.duration)
+
+        if elapsed >= self.duration:
+            return target, 0
+
+        position = start_position
+
+        for duration, velocity, acceleration in phases:
+            if elapsed <= duration:
+                return (
+                    position + velocity * elapsed + acceleration * elapsed * elapsed / 2,
+                    velocity + acceleration * elapsed
+                )
+
+            position += velocity * duration + acceleration * duration * duration / 2
+            elapsed -= duration
+
+        return target, 0
+
+    def get_positions(self, now=None):
+        now = time.time() if now is None else now
+
+        return [
+            (servo_id, round(self.get_state(servo_id, now)[0])) for servo_id in self.profiles
+        ]
+
+    def get_velocities(self, now=None):
+        now = time.time() if now is None else now
+
+        return {servo_id: self.get_state(servo_id, now)[1] for servo_id in self.profiles}
@@ -0,0 +1,88 @@
+from array import array
+
+
+class PositionStore:
+    TYPECODE = 'H'
+
+    def __init__(self, servo_ids, positions=None, changes=None):
+        self.servo_ids = list(dict.fromkeys(servo_ids))
+        self.columns = {servo_id: index for index, servo_id in enumerate(self.servo_ids)}
+        self.positions = positions if positions is not None else array(self.TYPECODE)
+        self.changes = changes if changes is not None else bytearray()
+        self._last_positions = array(self.TYPECODE, bytes(2 * len(self.servo_ids)))
+
+        if len(self.positions) >= len(self.servo_ids) > 0:
+            self._last_positions = self.positions[-len(self.servo_ids):]
+
+    @classmethod
+    def from_frames(cls, servo_ids, frames):
+        store = cls(servo_ids)
+
+        for frame_positions in frames:
+            store.append(frame_positions)
+
+        return store
+
+    @property
+    def servo_count(self):
+        return len(self.servo_ids)
+
+    def append(self, frame_positions):
+        frame_changes = bytearray(self.servo_count)
+
+        for servo_id, position in frame_positions.items():
+            index = self.columns[servo_id]
+            self._last_positions[index] = position
+            frame_changes[index] = 1
+
+        self.positions.extend(self._last_positions)
+        self.changes.extend(frame_changes)
+
+    def __len__(self):
+        if self.servo_count == 0:
+            return 0
+
+        return len(self.changes) // self.servo_count
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.frame(index)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.frames(key.start, key.stop)
+
+        return self.frame(key)
+
+    def frame(self, index):
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+
+        offset = index * self.servo_count
+        frame_positions = {}
+
+        for servo_id, column in self.columns.items():
+            if self.changes[offset + column]:
+                frame_positions[servo_id] = self.positions[offset + column]
+
+        return frame_positions
+
+    def frames(self, start=None, stop=None):
+        start, stop, _step = slice(start, stop).indices(len(self))
+        start *= self.servo_count
+        stop = max(start, stop * self.servo_count)
+
+        return PositionStore(
+            self.servo_ids,
+            self.positions[start:stop],
+            self.changes[start:stop]
+        )
+
+    def servo(self, servo_id):
+        return self.positions[self.columns[servo_id]::self.servo_count]
+
+    def servo_changes(self, servo_id):
+        return self.changes[self.columns[servo_id]::self.servo_count]
@@ -0,0 +1,243 @@
+from ..utils.encoders import get_command
+
+PROTOCOL_COMMANDS = "COMMANDS"
+PROTOCOL_PACKETS = "PACKETS"
+
+PACKET_START = 0x5B
+PACKET_END = 0x5D
+PACKET_MAX_SERVOS = 255
+PACKET_OVERHEAD = 4
+SERVO_LENGTH = 3
+
+TIMED_PACKET_START = 0x7B
+TIMED_PACKET_END = 0x7D
+TIMED_PACKET_FRAME = 0x01
+TIMED_PACKET_SYNC = 0x02
+TIMED_PACKET_CLEAR = 0x03
+TIMED_PACKET_OVERHEAD = 9
+TIMESTAMP_MAX = 0xFFFFFFFF
+
+SEQUENCE_LENGTH = 4
+SEQUENCE_MAX = 0xFFFFFFFF
+
+
+def get_checksum(data):
+    checksum = 0
+
+    for byte in data:
+        checksum ^= byte
+
+    return checksum
+
+
+def encode_commands(positions):
+    return [bytes(get_command(servo_id, position)) for servo_id, position in positions]
+
+
+def encode_packet(positions):
+    positions = list(positions)
+
+    if len(positions) > PACKET_MAX_SERVOS:
+        raise ValueError(f"A packet can contain at most {PACKET_MAX_SERVOS} servos")
+
+    data = bytearray([len(positions)])
+
+    for servo_id, position in positions:
+        data.append(servo_id)
+        data += position.to_bytes(2, 'big')
+
+    return bytes([PACKET_START]) + bytes(data) + bytes([get_checksum(data), PACKET_END])
+
+
+def encode_packets(positions):
+    positions = list(positions)
+
+    return [
+        encode_packet(positions[offset:offset + PACKET_MAX_SERVOS])
+        for offset in range(0, len(positions), PACKET_MAX_SERVOS)
+    ]
+
+
+def get_encoder(protocol):
+    if protocol == PROTOCOL_PACKETS:
+        return encode_packets
+
+    return encode_commands
+
+
+def encode_timed_packet(packet_type, timestamp, positions=()):
+    positions = list(positions)
+
+    if len(positions) > PACKET_MAX_SERVOS:
+        raise ValueError(f"A packet can contain at most {PACKET_MAX_SERVOS} servos")
+
+    data = bytearray([packet_type])
+    data += (timestamp & TIMESTAMP_MAX).to_bytes(4, 'big')
+    data.append(len(positions))
+
+    for servo_id, position in positions:
+        data.append(servo_id)
+        data += position.to_bytes(2, 'big')
+
+    return (
+        bytes([TIMED_PACKET_START]) + bytes(data)
+        + bytes([get_checksum(data), TIMED_PACKET_END])
+    )
+
+
+def decode_servos(data):
+    positions = {}
+
+    for offset in range(0, len(data), SERVO_LENGTH):
+        positions[data[offset]] = int.from_bytes(data[offset + 1:offset + 3], 'big')
+
+    return positions
+
+
+def decode_packet(packet):
+    if len(packet) < PACKET_OVERHEAD or packet[0] != PACKET_START or packet[-1] != PACKET_END:
+        raise ValueError("Invalid packet frame")
+
+    data = packet[1:-2]
+    count = data[0]
+
+    if len(data) != 1 + count * SERVO_LENGTH:
+        raise ValueError("Invalid packet length")
+
+    if get_checksum(data) != packet[-2]:
+        raise ValueError("Invalid packet checksum")
+
+    return decode_servos(data[1:])
+
+
+def decode_timed_packet(packet):
+    if (
+        len(packet) < TIMED_PACKET_OVERHEAD
+        or packet[0] != TIMED_PACKET_START
+        or packet[-1] != TIMED_PACKET_END
+    ):
+        raise ValueError("Invalid packet frame")
+
+    data = packet[1:-2]
+    count = data[5]
+
+    if len(data) != 6 + count * SERVO_LENGTH:
+        raise ValueError("Invalid packet length")
+
+    if get_checksum(data) != packet[-2]:
+        raise ValueError("Invalid packet checksum")
+
+    return data[0], int.from_bytes(data[1:5], 'big'), decode_servos(data[6:])
+
+
+def encode_datagram(sequence, packet):
+    return (sequence & SEQUENCE_MAX).to_bytes(SEQUENCE_LENGTH, 'big') + bytes(packet)
+
+
+def decode_datagram(datagram):
+    if len(datagram) < SEQUENCE_LENGTH:
+        raise ValueError("Invalid datagram length")
+
+    return int.from_bytes(datagram[:SEQUENCE_LENGTH], 'big'), datagram[SEQUENCE_LENGTH:]
+
+
+def is_newer_sequence(sequence, last_sequence):
+    # Sequence numbers wrap around, so half of the range counts as newer
+    return 0 < (sequence - last_sequence) & SEQUENCE_MAX <= SEQUENCE_MAX // 2
+
+
+class PacketDecoder:
+    START = PACKET_START
+    OVERHEAD = PACKET_OVERHEAD
+    COUNT_INDEX = 1
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.errors = 0
+
+    @staticmethod
+    def decode(packet):
+        return decode_packet(packet)
+
+    def feed(self, data):
+        self.buffer += data
+        packets = []
+
+        while True:
+            start = self.buffer.find(self.START)
+
+            if start < 0:
+                self.buffer.clear()
+                break
+
+            del self.buffer[:start]
+
+            if len(self.buffer) <= self.COUNT_INDEX:
+                break
+
+            length = self.OVERHEAD + self.buffer[self.COUNT_INDEX] * SERVO_LENGTH
+
+            if len(self.buffer) < length:
+                break
+
+            try:
+                packets.append(self.decode(bytes(self.buffer[:length])))
+                del self.buffer[:length]
+            except ValueError:
+                # Skip the start byte to resynchronize with the next packet
+                self.errors += 1
+                del self.buffer[:1]
+
+        return packets
+
+
+class TimedPacketDecoder(PacketDecoder):
+    START = TIMED_PACKET_START
+    OVERHEAD = TIMED_PACKET_OVERHEAD
+    COUNT_INDEX = 6
+
+    @staticmethod
+    def decode(packet):
+        return decode_timed_packet(packet)
+
+
+class DatagramReceiver:
+    def __init__(self):
+        self.last_sequence = None
+        self.sequences = {}
+        self.positions = {}
+        self.dropped = 0
+        self.errors = 0
+
+    def receive(self, datagram):
+        try:
+            sequence, packet = decode_datagram(datagram)
+            positions = decode_packet(packet)
+        except (ValueError, IndexError):
+            self.errors += 1
+
+            return None
+
+        # A datagram only contains changed servos, so a late one can still be the newest
+        # state of a servo which is not part of the datagrams that overtook it
+        positions = {
+            servo_id: position for servo_id, position in positions.items()
+            if servo_id not in self.sequences
+            or is_newer_sequence(sequence, self.sequences[servo_id])
+        }
+
+        if not positions:
+            # Outdated or duplicated datagrams are dropped since a newer state already arrived
+            self.dropped += 1
+
+            return None
+
+        if self.last_sequence is None or is_newer_sequence(sequence, self.last_sequence):
+            self.last_sequence = sequence
+
+        for servo_id in positions:
+            self.sequences[servo_id] = sequence
+
+        self.positions.update(positions)
+
+        return positions
@@ -0,0 +1,57 @@
+import bpy
+import mathutils
+
+from bpy.app.handlers import persistent
+from ..utils.servo_settings import ServoSettingsTable
+
+
+class RestMatrixCache:
+    _armatures = {}
+
+    @classmethod
+    def get(cls, bone):
+        armature_key = bone.id_data.as_pointer()
+        bone_matrices = cls._armatures.setdefault(armature_key, {})
+
+        if bone.name not in bone_matrices:
+            bone_matrices[bone.name] = cls.calculate(bone)
+
+        return bone_matrices[bone.name]
+
+    @staticmethod
+    def calculate(bone):
+        matrix_bone_inverted = bone.matrix_local.copy().inverted()
+
+        if bone.parent:
+            matrix_parent_bone = bone.parent.matrix_local.copy()
+        else:
+            matrix_parent_bone = mathutils.Matrix()
+
+        matrix_rest = matrix_bone_inverted @ matrix_parent_bone
+
+        matrix_bone_inverted.freeze()
+        matrix_rest.freeze()
+
+        return matrix_bone_inverted, matrix_rest
+
+    @classmethod
+    def invalidate(cls, armature):
+        cls._armatures.pop(armature.as_pointer(), None)
+
+    @classmethod
+    def clear(cls):
+        cls._armatures = {}
+
+
+@persistent
+def invalidate_rest_matrices(_scene, depsgraph):
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Armature):
+            # Leaving the edit mode copies the edit bone settings without an update callback
+            RestMatrixCache.invalidate(update.id.original)
+            ServoSettingsTable.invalidate(update.id.original)
+
+
+@persistent
+def clear_rest_matrices(*_args):
+    RestMatrixCache.clear()
@@ -0,0 +1,51 @@
+import time
+import threading
+
+from serial.tools import list_ports
+
+
+class SerialPortRegistry:
+    TTL = 2.0
+
+    _ports = []
+    _updated = 0
+    _refreshing = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_ports(cls):
+        if cls._updated == 0:
+            cls.refresh()
+        elif time.monotonic() - cls._updated > cls.TTL:
+            cls.refresh_in_background()
+
+        return cls._ports
+
+    @classmethod
+    def refresh(cls):
+        try:
+            ports = [port.device for port in list_ports.comports()]
+
+            with cls._lock:
+                cls._ports = ports
+                cls._updated = time.monotonic()
+        finally:
+            # A failed enumeration must not block later refreshes
+            with cls._lock:
+                cls._refreshing = False
+
+    @classmethod
+    def refresh_in_background(cls):
+        with cls._lock:
+            if cls._refreshing:
+                return
+
+            cls._refreshing = True
+
+        threading.Thread(target=cls.refresh, daemon=True).start()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._ports = []
+            cls._updated = 0
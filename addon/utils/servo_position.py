@@ -0,0 +1,51 @@
+import math
+import mathutils
+
+from ..utils.rest_matrix_cache import RestMatrixCache
+from ..utils.servo_settings import ServoSettingsTable
+
+IDENTITY_MATRIX = mathutils.Matrix()
+IDENTITY_MATRIX.freeze()
+
+
+def range_map(value, from_low, from_high, to_low, to_high):
+    return (value - from_low) * (to_high - to_low) / (from_high - from_low) + to_low
+
+
+def get_matrix_visual(matrix_rest, matrix_parent_pose_bone, matrix_pose_bone):
+    if matrix_parent_pose_bone is not None:
+        matrix_parent_pose_bone_inverted = matrix_parent_pose_bone.inverted()
+    else:
+        matrix_parent_pose_bone_inverted = IDENTITY_MATRIX
+
+    return (
+        matrix_rest
+        @ matrix_parent_pose_bone_inverted
+        @ matrix_pose_bone
+    )
+
+
+def matrix_visual(pose_bone):
+    _matrix_bone_inverted, matrix_rest = RestMatrixCache.get(pose_bone.bone)
+    matrix_parent_pose_bone = pose_bone.parent.matrix if pose_bone.parent else None
+
+    return get_matrix_visual(matrix_rest, matrix_parent_pose_bone, pose_bone.matrix)
+
+
+def get_position(servo_settings, matrix):
+    rotation_euler = matrix.to_euler()
+    rotation_in_degrees = round(math.degrees(
+        rotation_euler[servo_settings.rotation_axis]) * servo_settings.multiplier, 2)
+    rotation_in_degrees = rotation_in_degrees * servo_settings.direction
+
+    angle = servo_settings.neutral_angle - rotation_in_degrees
+    position = round(range_map(angle, 0, servo_settings.rotation_range,
+                     servo_settings.position_min, servo_settings.position_max))
+
+    in_range = servo_settings.position_min <= position <= servo_settings.position_max
+
+    return position, round(angle, 2), in_range
+
+
+def calculate_position(pose_bone):
+    return get_position(ServoSettingsTable.get(pose_bone.bone), matrix_visual(pose_bone))
@@ -1,3 +1,6 @@
+from bpy.app.handlers import persistent
+
+
 def get_active_pose_bones(scene):
     pose_bones = []
 
@@ -36,3 +39,68 @@ def has_unique_servo_id(bone, scene):
             return False
 
     return True
+
+
+class ServoSettingsSnapshot:  # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        'servo_id',
+        'threshold',
+        'rotation_axis',
+        'multiplier',
+        'direction',
+        'neutral_angle',
+        'rotation_range',
+        'position_min',
+        'position_max',
+        'position_span'
+    )
+
+    def __init__(self, servo_settings):
+        self.servo_id = servo_settings.servo_id
+        self.threshold = servo_settings.threshold
+        self.rotation_axis = int(servo_settings.rotation_axis)
+        self.multiplier = servo_settings.multiplier
+        self.direction = -1 if servo_settings.reverse_direction else 1
+        self.neutral_angle = servo_settings.neutral_angle
+        self.rotation_range = servo_settings.rotation_range
+        self.position_min = servo_settings.position_min
+        self.position_max = servo_settings.position_max
+        self.position_span = self.position_max - self.position_min
+
+
+class ServoSettingsTable:
+    _snapshots = {}
+
+    @classmethod
+    def get(cls, bone):
+        key = (bone.id_data.as_pointer(), bone.name)
+        snapshot = cls._snapshots.get(key)
+
+        if snapshot is None:
+            snapshot = ServoSettingsSnapshot(bone.servo_settings)
+            cls._snapshots[key] = snapshot
+
+        return snapshot
+
+    @classmethod
+    def invalidate(cls, armature):
+        armature_key = armature.as_pointer()
+        cls._snapshots = {
+            key: snapshot for key, snapshot in cls._snapshots.items() if key[0] != armature_key
+        }
+
+    @classmethod
+    def clear(cls):
+        cls._snapshots = {}
+
+
+def get_servo_ids(scene):
+    return [
+        ServoSettingsTable.get(pose_bone.bone).servo_id
+        for pose_bone in get_active_pose_bones(scene)
+    ]
+
+
+@persistent
+def clear_servo_settings(*_args):
+    ServoSettingsTable.clear()
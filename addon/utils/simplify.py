@@ -0,0 +1,157 @@
+from ..utils.encoders import RAMP_MAX_FRAMES, Ramp
+from ..utils.positions import PositionStore
+
+
+def interpolate(start, target, step, frames):
+    # Positions are never negative, so controllers can use the same integer division
+    return (start * (frames - step) + target * step + frames // 2) // frames
+
+
+def get_segment_error(values, start, end):
+    frames = end - start
+    max_error = 0
+    max_index = start
+
+    for step in range(1, frames):
+        error = abs(
+            values[start + step] - interpolate(values[start], values[end], step, frames))
+
+        if error > max_error:
+            max_error = error
+            max_index = start + step
+
+    return max_error, max_index
+
+
+def simplify_curve(values, tolerance, max_frames=RAMP_MAX_FRAMES):
+    breakpoints = [0]
+    segments = [(0, len(values) - 1)]
+
+    # Ramer-Douglas-Peucker using the vertical distance to the interpolated positions
+    while segments:
+        start, end = segments.pop()
+
+        if end - start < 2:
+            breakpoints.append(end)
+            continue
+
+        error, index = get_segment_error(values, start, end)
+
+        if error <= tolerance and end - start > max_frames:
+            index = (start + end) // 2
+        elif error <= tolerance:
+            breakpoints.append(end)
+            continue
+
+        segments.append((index, end))
+        segments.append((start, index))
+
+    return sorted(set(breakpoints))
+
+
+def get_curve_commands(first_frame, values, tolerance):
+    breakpoints = simplify_curve(values, tolerance)
+    commands = [(first_frame, values[0])]
+    errors = []
+
+    for start, end in zip(breakpoints, breakpoints[1:]):
+        frames = end - start
+
+        for step in range(1, frames + 1):
+            errors.append(abs(
+                values[start + step] - interpolate(values[start], values[end], step, frames)))
+
+        # Holding the position is the same as a ramp to the same position
+        if values[end] == values[start]:
+            continue
+
+        if frames == 1:
+            commands.append((first_frame + end, values[end]))
+        else:
+            commands.append((first_frame + start + 1, Ramp(values[end], frames)))
+
+    return commands, errors
+
+
+class SimplifyingEncoder:
+    def __init__(self, encoder, tolerance, servo_ids):
+        self.encoder = encoder
+        self.tolerance = tolerance
+        self.store = PositionStore(servo_ids)
+        self.commands = 0
+        self.max_error = 0
+        self.total_error = 0
+        self.positions = 0
+
+    def write(self, frame_positions):
+        self.store.append(frame_positions)
+
+    def close(self):
+        frames = [{} for _frame in range(len(self.store))]
+
+        for servo_id in self.store.servo_ids:
+            first_frame = self.store.servo_changes(servo_id).find(1)
+
+            # Servos are only simplified once their first position is known
+            if first_frame == -1:
+                continue
+
+            values = self.store.servo(servo_id)[first_frame:]
+            commands, errors = get_curve_commands(first_frame, values, self.tolerance)
+            self.commands += len(commands)
+            self.max_error = max([self.max_error] + errors)
+            self.total_error += sum(errors)
+            self.positions += len(values)
+
+            for frame, position in commands:
+                frames[frame][servo_id] = position
+
+        for frame_positions in frames:
+            self.encoder.write(frame_positions)
+
+        self.encoder.close()
+
+    def get_summary(self):
+        mean_error = self.total_error / self.positions if self.positions else 0
+
+        return (
+            f"Simplified {sum(self.store.changes)} positions into {self.commands} commands, "
+            f"max error {self.max_error}, mean error {mean_error:.2f}"
+        )
+
+
+def expand_ramps(frames):
+    positions = {}
+    ramps = {}
+
+    for frame_positions in frames:
+        expanded = {}
+
+        for servo_id, (start, ramp, step) in list(ramps.items()):
+            expanded[servo_id] = interpolate(start, ramp.target, step, ramp.frames)
+
+            if step == ramp.frames:
+                del ramps[servo_id]
+            else:
+                ramps[servo_id] = (start, ramp, step + 1)
+
+        for servo_id, position in frame_positions.items():
+            if isinstance(position, Ramp):
+                start = positions.get(servo_id, position.target)
+                expanded[servo_id] = interpolate(start, position.target, 1, position.frames)
+
+                if position.frames > 1:
+                    ramps[servo_id] = (start, position, 2)
+                else:
+                    ramps.pop(servo_id, None)
+            else:
+                expanded[servo_id] = position
+                ramps.pop(servo_id, None)
+
+        expanded = {
+            servo_id: position for servo_id, position in expanded.items()
+            if positions.get(servo_id) != position
+        }
+        positions.update(expanded)
+
+        yield expanded
@@ -0,0 +1,33 @@
+import socket
+
+from ..utils.protocol import SEQUENCE_MAX, encode_datagram
+
+
+class UdpConnection:
+    def __init__(self, host, port):
+        self.address = (host, port)
+        self.sequence = 0
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        try:
+            self.socket.connect(self.address)
+        except OSError:
+            self.socket.close()
+            raise
+
+    @property
+    def connected(self):
+        return self.socket.fileno() != -1
+
+    def write(self, packet):
+        self.sequence = (self.sequence + 1) & SEQUENCE_MAX
+
+        try:
+            self.socket.send(encode_datagram(self.sequence, packet))
+        except ConnectionRefusedError:
+            # There is no delivery guarantee anyway, a receiver which isn't listening yet
+            # will catch up with the next datagram or full state refresh
+            pass
+
+    def close(self):
+        self.socket.close()
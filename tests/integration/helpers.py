@@ -0,0 +1,14 @@
+import importlib
+import os
+
+import bpy
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "examples")
+TEST_FILE = os.path.join(os.path.dirname(__file__), "test.blend")
+
+
+def import_addon_module(name):
+    # The package name of the add-on depends on how it was installed
+    package = bpy.types.SERVO_ANIMATION_OT_start_live_mode.__module__.rsplit('.ops.', 1)[0]
+
+    return importlib.import_module(f"{package}.{name}")
@@ -0,0 +1,126 @@
+import unittest
+import os
+
+import numpy as np
+from parameterized import parameterized
+
+import bpy
+import mathutils
+
+from helpers import EXAMPLES_DIR, TEST_FILE, import_addon_module
+
+
+class TestBatchConverter(unittest.TestCase):
+    def setUp(self):
+        self.converter = import_addon_module("utils.converter")
+        self.batch_converter = import_addon_module("utils.batch_converter")
+        self.servo_settings = import_addon_module("utils.servo_settings")
+        self.servo_position = import_addon_module("utils.servo_position")
+        self.rest_matrix_cache = import_addon_module("utils.rest_matrix_cache")
+
+    @classmethod
+    def tearDownClass(cls):
+        bpy.ops.wm.open_mainfile(filepath=TEST_FILE)
+
+    def get_reference_positions(self, scene, frame, depsgraph):
+        positions = []
+        in_range = []
+
+        scene.frame_set(frame)
+
+        for pose_bone in self.servo_settings.get_active_pose_bones(scene):
+            # Other scenes than the active one only update their evaluated pose
+            if depsgraph is not None:
+                pose_bone = pose_bone.id_data.evaluated_get(depsgraph).pose.bones[pose_bone.name]
+
+            position, _angle, position_in_range = self.servo_position.calculate_position(pose_bone)
+            positions.append(position if position_in_range else 0)
+            in_range.append(position_in_range)
+
+        return positions, in_range
+
+    @parameterized.expand([
+        ("ik", os.path.join("IK", "ik.blend")),
+        ("scenes", os.path.join("Scenes", "scenes.blend")),
+    ])
+    def test_examples(self, _name, filename):
+        bpy.ops.wm.open_mainfile(filepath=os.path.join(EXAMPLES_DIR, filename))
+
+        for scene in bpy.data.scenes:
+            converter = self.batch_converter.BatchConverter(
+                self.servo_settings.get_active_pose_bones(scene))
+            depsgraph = self.converter.get_scene_depsgraph(bpy.context, scene)
+            frames = range(scene.frame_start, scene.frame_end + 1)
+            calculated = list(converter.calculate_frames(scene, frames, depsgraph))
+
+            assert converter.servo_ids, f"expected servos in scene {scene.name}"
+
+            for frame, batch_positions in zip(frames, calculated):
+                expected = self.get_reference_positions(scene, frame, depsgraph)
+
+                assert batch_positions == expected, \
+                    f"scene {scene.name} frame {frame}: got {batch_positions}, expected {expected}"
+
+    def get_random_pose_matrices(self, obj, count):
+        rng = np.random.default_rng(42)
+        quaternions = rng.normal(size=(count, len(obj.pose.bones), 4))
+        quaternions /= np.linalg.norm(quaternions, axis=-1, keepdims=True)
+        w, x, y, z = np.moveaxis(quaternions, -1, 0)
+        pose_matrices = np.zeros((count, len(obj.pose.bones) + 1, 4, 4), dtype=np.float32)
+        pose_matrices[..., :, :] = np.identity(4)
+        pose_matrices[:, :-1, :3, :3] = np.stack((
+            np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)), -1),
+            np.stack((2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)), -1),
+            np.stack((2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)), -1),
+        ), -2)
+
+        return pose_matrices
+
+    def get_matrix_position(self, pose_bone, pose_matrices, indices):
+        matrix_parent_pose_bone = None
+
+        if pose_bone.parent:
+            matrix_parent_pose_bone = mathutils.Matrix(
+                pose_matrices[indices[pose_bone.parent.name]].tolist())
+
+        matrix = self.servo_position.get_matrix_visual(
+            self.rest_matrix_cache.RestMatrixCache.get(pose_bone.bone)[1],
+            matrix_parent_pose_bone,
+            mathutils.Matrix(pose_matrices[indices[pose_bone.name]].tolist())
+        )
+        position, _angle, in_range = self.servo_position.get_position(
+            self.servo_settings.ServoSettingsTable.get(pose_bone.bone), matrix)
+
+        return position if in_range else 0
+
+    def test_random_poses(self):
+        bpy.ops.wm.open_mainfile(filepath=os.path.join(EXAMPLES_DIR, "IK", "ik.blend"))
+        pose_bones = self.servo_settings.get_active_pose_bones(bpy.context.scene)
+        obj = pose_bones[0].id_data
+        indices = {pose_bone.name: index for index, pose_bone in enumerate(obj.pose.bones)}
+        pose_matrices = self.get_random_pose_matrices(obj, 100000)
+
+        assert all(pose_bone.id_data == obj for pose_bone in pose_bones)
+
+        positions, _in_range = self.batch_converter.BatchConverter(pose_bones).calculate(
+            pose_matrices)
+
+        for frame_matrices, frame_positions in zip(pose_matrices, positions.tolist()):
+            expected = [
+                self.get_matrix_position(pose_bone, frame_matrices, indices)
+                for pose_bone in pose_bones
+            ]
+
+            assert frame_positions == expected, f"got {frame_positions}, expected {expected}"
+
+    @parameterized.expand([
+        ("halves", np.arange(-2000, 2001) / 200),
+        ("float representation", np.array([0.125, 0.375, 1.005, 2.675, 1.115, -2.675, 89.995])),
+        ("single precision", np.arange(-2000, 2001, dtype=np.float32) / np.float32(200)),
+    ])
+    def test_round_decimals(self, _name, values):
+        values = values.astype(np.float64)
+        rounded = self.batch_converter.round_decimals(values, 2)
+        expected = [round(float(value), 2) for value in values]
+
+        assert rounded.tolist() == expected
@@ -0,0 +1,92 @@
+import unittest
+import glob
+import io
+import os
+
+from parameterized import parameterized
+
+from helpers import EXAMPLES_DIR, import_addon_module
+
+
+class TestBinaryV2(unittest.TestCase):
+    def setUp(self):
+        self.binary_v2 = import_addon_module("utils.binary_v2")
+        self.encoders = import_addon_module("utils.encoders")
+
+    def encode(self, frames, servo_ids, fps=30):
+        file = io.BytesIO()
+        encoder = self.binary_v2.BinaryV2Encoder(file, fps, servo_ids)
+
+        for frame_positions in frames:
+            encoder.write(frame_positions)
+
+        encoder.close()
+
+        return file.getvalue()
+
+    @parameterized.expand([
+        ("zero", 0, 0),
+        ("positive", 1, 2),
+        ("negative", -1, 1),
+        ("large positive", 1000, 2000),
+        ("large negative", -1000, 1999),
+    ])
+    def test_zigzag(self, _name, value, expected):
+        assert self.binary_v2.zigzag_encode(value) == expected
+        assert self.binary_v2.zigzag_decode(expected) == value
+
+    @parameterized.expand([
+        ("single byte", 127, b"\x7f"),
+        ("two bytes", 128, b"\x80\x01"),
+        ("three bytes", 65535, b"\xff\xff\x03"),
+    ])
+    def test_varint(self, _name, value, expected):
+        assert bytes(self.binary_v2.encode_varint(value)) == expected
+        assert self.binary_v2.decode_varint(expected, 0) == (value, len(expected))
+
+    def test_encode_frames(self):
+        data = self.encode([{1: 90, 4: 45}, {4: 50}, {}], [1, 4])
+
+        assert data == (
+            b"SRVA\x02\x00\x00\x1e\x00\x00\x00\x03\x00\x02\x01\x04"
+            + b"\x03\xb4\x01\x5a"
+            + b"\x02\x0a"
+            + b"\x00"
+        )
+
+    def test_round_trip_examples(self):
+        paths = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "*", "*.bin")))
+
+        assert paths, "expected example binary files"
+
+        for path in paths:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            frames = self.encoders.decode_frame_commands(data)
+            servo_ids = list(dict.fromkeys(
+                servo_id for frame_positions in frames for servo_id in frame_positions))
+            encoded = self.encode(frames, servo_ids, 60)
+            header, decoded = self.binary_v2.decode(encoded)
+
+            assert header["fps"] == 60
+            assert header["frames"] == len(frames)
+            assert header["servo_ids"] == servo_ids
+            assert decoded == frames, f"expected {path} to round trip"
+            # A single servo needs at least a bitmap byte and a varint per frame
+            assert len(encoded) * 2.75 < len(data), f"expected {path} to be smaller"
+
+    @parameterized.expand([
+        ("magic", b"SRVB\x02\x00\x00\x1e\x00\x00\x00\x00\x00\x00"),
+        ("version", b"SRVA\x03\x00\x00\x1e\x00\x00\x00\x00\x00\x00"),
+        ("servo table", b"SRVA\x02\x00\x00\x1e\x00\x00\x00\x00\x00\x02\x01"),
+        ("truncated frame", b"SRVA\x02\x00\x00\x1e\x00\x00\x00\x01\x00\x01\x00\x01\x80"),
+        ("trailing data", b"SRVA\x02\x00\x00\x1e\x00\x00\x00\x00\x00\x00\x00"),
+    ])
+    def test_invalid_data(self, _name, data):
+        with self.assertRaises(ValueError):
+            self.binary_v2.decode(data)
+
+    def test_too_many_servos(self):
+        with self.assertRaises(ValueError):
+            self.binary_v2.encode_header(30, 0, list(range(257)))
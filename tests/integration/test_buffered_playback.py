@@ -0,0 +1,118 @@
+# pylint: disable=protected-access
+
+import unittest
+import threading
+
+import bpy
+
+from helpers import import_addon_module
+
+
+class MockSender:
+    def __init__(self):
+        self.error = None
+        self.data = []
+
+    def send_data(self, data):
+        self.data.append(data)
+
+
+class TestBufferedPlayback(unittest.TestCase):
+    def setUp(self):
+        self.live_mode = import_addon_module("utils.live_mode").LiveMode
+        self.live_cache = import_addon_module("utils.live_cache").LiveCache
+        self.playback = import_addon_module("utils.playback")
+        self.sender = MockSender()
+        self.frame_changes = 0
+        self.live_mode._sender = self.sender
+        self.live_cache.clear()
+        bpy.context.scene.frame_set(1)
+        bpy.context.window_manager.servo_animation.playback_buffer_frames = 4
+        bpy.app.handlers.frame_change_post.append(self.count_frame_changes)
+
+    def tearDown(self):
+        bpy.app.handlers.frame_change_post.remove(self.count_frame_changes)
+        servo_animation = bpy.context.window_manager.servo_animation
+        servo_animation.use_playback_cache = False
+        servo_animation.playback_buffer_frames = 24
+        self.live_mode._sender = None
+        self.live_mode._playback = None
+        self.live_cache.clear()
+
+    def count_frame_changes(self, _scene, _depsgraph):
+        self.frame_changes += 1
+
+    def receive(self):
+        receiver = self.playback.PlaybackReceiver()
+        receiver.feed(b"".join(self.sender.data), 0)
+
+        return receiver.poll(1000)
+
+    def test_cached_frames(self):
+        bpy.ops.servo_animation.bake_live_cache()
+        self.frame_changes = 0
+
+        self.live_mode._handle_buffered_playback(bpy.context.scene)
+
+        expected = [
+            {0: self.live_cache.get(bpy.context.scene, frame)[0][1]} for frame in range(1, 5)
+        ]
+
+        assert self.frame_changes == 0
+        assert bpy.context.scene.frame_current == 1
+        assert self.receive() == expected
+
+    def test_unrelated_cache_updates(self):
+        scene = bpy.context.scene
+        obj = bpy.context.object
+        bone = obj.data.bones["Bone"]
+        bpy.ops.servo_animation.bake_live_cache()
+        frame_count = self.live_cache.get_frame_count(scene)
+
+        for _toggle in range(2):
+            obj.select_set(not obj.select_get())
+            bone.select = not bone.select
+            bpy.context.view_layer.update()
+
+        assert frame_count > 0
+        assert self.live_cache.get_frame_count(scene) == frame_count
+
+        pose_bone = obj.pose.bones["Bone"]
+        location_x = pose_bone.location.x
+        pose_bone.location.x += 1
+        bpy.context.view_layer.update()
+        pose_bone.location.x = location_x
+        bpy.context.view_layer.update()
+
+        assert self.live_cache.get_frame_count(scene) == 0
+
+    def test_uncached_frames(self):
+        self.live_mode._handle_buffered_playback(bpy.context.scene)
+
+        # Only the current frame is sent, as upcoming frames are never calculated in the handler
+        assert self.frame_changes == 0
+        assert bpy.context.scene.frame_current == 1
+        assert self.receive() == [{0: 90}]
+
+
+class TestLiveSender(unittest.TestCase):
+    def test_bounded_data(self):
+        live_sender = import_addon_module("utils.live_sender")
+        written = []
+        release = threading.Event()
+
+        def write(data):
+            release.wait(1)
+            written.append(data)
+
+        sender = live_sender.LiveSender(write, max_pending_data=4)
+        sender.send_data(b"0")
+
+        for index in range(1, 100):
+            sender.send_data(str(index).encode())
+
+        release.set()
+        sender.close()
+
+        assert len(written) <= 5
+        assert written[-4:] == [b"96", b"97", b"98", b"99"]
@@ -0,0 +1,198 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import shutil
+import stat
+import tempfile
+
+from parameterized import parameterized
+
+import bpy
+
+from helpers import import_addon_module
+
+STUB_RESULT = [{
+    "scene": "Scene",
+    "format": "json",
+    "path": "Scene.json",
+    "error": None,
+    "duration": 0.1,
+    "size": 42
+}]
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.cli = import_addon_module("cli")
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, "export")
+        self.summary = os.path.join(self.temp_dir, "summary.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_stub(self, script):
+        path = os.path.join(self.temp_dir, "blender")
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("#!/bin/sh\n" + script)
+
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+        return path
+
+    def run_batch(self, stub, *argv, files=("a.blend", "b.blend")):
+        args = self.cli.parse_args([
+            "--blender", stub,
+            "--output-dir", self.output_dir,
+            "--summary", self.summary,
+            *argv,
+            *files,
+        ])
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            exit_code = self.cli.run_batch(args)
+
+        with open(self.summary, encoding="utf-8") as file:
+            summary = json.load(file)
+
+        assert json.loads(output.getvalue()) == summary
+
+        return exit_code, summary
+
+    def test_parse_args(self):
+        args = self.cli.parse_args(["a.blend", "b.blend"])
+
+        assert args.files == ["a.blend", "b.blend"]
+        assert args.formats == ["h", "json", "bin"]
+        assert args.scenes == []
+        assert args.skip_duplicates
+        assert args.binary_format == "commands"
+        assert args.simplify is None
+        assert not args.job
+
+        args = self.cli.parse_args([
+            "--formats", "json", "bin",
+            "--scenes", "Scene A", "Scene B",
+            "--no-skip-duplicates",
+            "--binary-format", "packed",
+            "--max-error", "2",
+            "--simplify", "1",
+            "--timeout", "30",
+            "a.blend",
+        ])
+
+        assert args.formats == ["json", "bin"]
+        assert args.scenes == ["Scene A", "Scene B"]
+        assert not args.skip_duplicates
+        assert args.binary_format == "packed"
+        assert args.max_error == 2
+        assert args.simplify == 1
+        assert args.timeout == 30
+
+    def test_invalid_format(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            self.cli.parse_args(["--formats", "txt", "a.blend"])
+
+    def test_job_command(self):
+        args = self.cli.parse_args([
+            "--blender", "blender", "--formats", "bin", "--compress-holds", "a.blend"])
+        command = self.cli.get_job_command(args, "a.blend", "export/a", "result.json")
+
+        assert command[:4] == ["blender", "--background", "-noaudio", "a.blend"]
+        assert command[-1] == "a.blend"
+        assert "--job" in command
+        assert "--compress-holds" in command
+        assert command[command.index("--result") + 1] == "result.json"
+        assert command[command.index("--output-dir") + 1] == "export/a"
+        assert command[command.index("--formats") + 1] == "bin"
+
+    def test_summary(self):
+        stub = self.create_stub(
+            'while [ "$#" -gt 0 ]; do\n'
+            '  if [ "$1" = "--result" ]; then\n'
+            f"    echo '{json.dumps(STUB_RESULT)}' > \"$2\"\n"
+            '  fi\n'
+            '  shift\n'
+            'done\n'
+        )
+        exit_code, summary = self.run_batch(stub)
+
+        assert exit_code == 0
+        assert summary["failed"] == 0
+        assert [result["file"] for result in summary["files"]] == ["a.blend", "b.blend"]
+
+        for result in summary["files"]:
+            assert result["status"] == "FINISHED"
+            assert result["error"] is None
+            assert result["exports"] == STUB_RESULT
+
+    def test_duplicate_file_names(self):
+        output_dirs = os.path.join(self.temp_dir, "output_dirs.txt")
+        stub = self.create_stub(
+            'while [ "$#" -gt 0 ]; do\n'
+            '  if [ "$1" = "--output-dir" ]; then\n'
+            f'    echo "$2" >> "{output_dirs}"\n'
+            '  fi\n'
+            '  shift\n'
+            'done\n'
+        )
+        exit_code, summary = self.run_batch(
+            stub, files=[os.path.join("a", "show.blend"), os.path.join("b", "show.blend")])
+
+        with open(output_dirs, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+
+        assert exit_code == 0
+        assert summary["failed"] == 0
+        assert sorted(lines) == [
+            os.path.join(self.output_dir, "show"), os.path.join(self.output_dir, "show_2")]
+
+    def test_failed_job(self):
+        exit_code, summary = self.run_batch(self.create_stub('echo "export failed" >&2\nexit 1\n'))
+
+        assert exit_code == 1
+        assert summary["failed"] == 2
+        assert all(result["status"] == "FAILED" for result in summary["files"])
+        assert all(result["error"] == "export failed" for result in summary["files"])
+
+    def test_timeout(self):
+        exit_code, summary = self.run_batch(self.create_stub("exec sleep 10\n"), "--timeout", ".5")
+
+        assert exit_code == 1
+        assert summary["failed"] == 2
+        assert all(result["status"] == "TIMEOUT" for result in summary["files"])
+        assert all(result["duration"] < 5 for result in summary["files"])
+
+    @parameterized.expand([
+        ("unique", ["a", "b"], ["a", "b"]),
+        ("duplicate", ["a", "a", "a"], ["a", "a_2", "a_3"]),
+        ("case", ["a", "A"], ["a", "A_2"]),
+        ("suffix taken", ["a_2", "a", "a"], ["a_2", "a", "a_3"]),
+    ])
+    def test_unique_name(self, _name, names, expected):
+        used_names = set()
+
+        assert [self.cli.get_unique_name(name, used_names) for name in names] == expected
+
+    def test_duplicate_scene_names(self):
+        scenes = [bpy.data.scenes.new("Scene A"), bpy.data.scenes.new("Scene_A")]
+        result = os.path.join(self.temp_dir, "result.json")
+        args = self.cli.parse_args([
+            "--job", "--result", result, "--output-dir", self.output_dir, "--formats", "json",
+            "--scenes", "Scene A", "Scene_A", "test.blend",
+        ])
+
+        try:
+            self.cli.run_file(args)
+        finally:
+            for scene in scenes:
+                bpy.data.scenes.remove(scene)
+
+        with open(result, encoding="utf-8") as file:
+            exports = json.load(file)
+
+        assert [os.path.basename(export["path"]) for export in exports] == [
+            "Scene_A.json", "Scene_A_2.json"]
@@ -0,0 +1,126 @@
+import unittest
+import os
+import tempfile
+
+from parameterized import parameterized
+
+from helpers import import_addon_module
+
+FRAMES = [
+    {0: 90, 1: 45},
+    {0: 91},
+    {},
+    {1: 50},
+    {0: 95, 1: 55},
+    {0: 100},
+    {},
+]
+
+
+class TestContainer(unittest.TestCase):
+    def setUp(self):
+        self.container = import_addon_module("utils.container")
+        self.encoders = import_addon_module("utils.encoders")
+        self.binary_v2 = import_addon_module("utils.binary_v2")
+        handle, self.filepath = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.filepath)
+
+    def write(self, binary_format, keyframe_interval):
+        with open(self.filepath, "wb") as file:
+            if binary_format == "COMPACT":
+                encoder = self.binary_v2.BinaryV2Encoder(file, 30, [0, 1])
+            else:
+                encoder = self.encoders.BinaryEncoder(file)
+
+            encoder = self.container.SeekableEncoder(file, encoder, keyframe_interval)
+
+            for frame_positions in FRAMES:
+                encoder.write(frame_positions)
+
+            encoder.close()
+
+    @staticmethod
+    def get_states(frames):
+        states = []
+        positions = {}
+
+        for frame_positions in frames:
+            positions.update(frame_positions)
+            states.append(dict(positions))
+
+        return states
+
+    @parameterized.expand([
+        ("commands every frame", "COMMANDS", 1),
+        ("commands every 3 frames", "COMMANDS", 3),
+        ("compact every frame", "COMPACT", 1),
+        ("compact every 3 frames", "COMPACT", 3),
+        ("compact single keyframe", "COMPACT", 100),
+    ])
+    def test_seek(self, _name, binary_format, keyframe_interval):
+        self.write(binary_format, keyframe_interval)
+        states = self.get_states(FRAMES)
+
+        with self.container.ContainerReader(self.filepath) as reader:
+            assert len(reader) == len(FRAMES)
+            assert len(reader.index["offsets"]) == -(-len(FRAMES) // keyframe_interval)
+
+            for frame in reversed(range(len(FRAMES))):
+                assert reader.get_state(frame) == states[frame], f"frame {frame}"
+
+            frames = list(reader.iter_frames())
+
+        for frame, frame_positions in enumerate(frames):
+            if frame % keyframe_interval == 0:
+                assert frame_positions == states[frame]
+            else:
+                assert frame_positions == FRAMES[frame]
+
+    def test_keyframe_offsets(self):
+        self.write("COMMANDS", 2)
+
+        with open(self.filepath, "rb") as file:
+            data = file.read()
+
+        index = self.container.decode_index(data)
+
+        for keyframe, offset in enumerate(index["offsets"]):
+            frame_positions, _offset = self.encoders.decode_command_frame(data, offset)
+
+            assert frame_positions == self.get_states(FRAMES)[keyframe * 2]
+
+        assert self.encoders.decode_frame_commands(data, index["index_offset"])[1] == {0: 91}
+
+    def test_compact_sequential_decode(self):
+        self.write("COMPACT", 3)
+
+        with open(self.filepath, "rb") as file:
+            data = file.read()
+
+        index = self.container.decode_index(data)
+        header, frames = self.binary_v2.decode(data, 3, index["index_offset"])
+
+        assert header["frames"] == len(FRAMES)
+        assert self.get_states(frames) == self.get_states(FRAMES)
+
+    @parameterized.expand([
+        ("no index", b"<\x00\x00Z>\n"),
+        ("empty", b""),
+        ("invalid index", b"<\x00\x00Z>\nSRVJ\x00\x00\x00\x06SRVX"),
+    ])
+    def test_invalid_container(self, _name, data):
+        with open(self.filepath, "wb") as file:
+            file.write(data)
+
+        with self.assertRaises(ValueError):
+            self.container.ContainerReader(self.filepath)
+
+    def test_out_of_range(self):
+        self.write("COMMANDS", 2)
+
+        with self.container.ContainerReader(self.filepath) as reader:
+            with self.assertRaises(IndexError):
+                reader.get_state(len(FRAMES))
@@ -0,0 +1,56 @@
+import unittest
+import math
+
+import bpy
+
+from helpers import TEST_FILE, import_addon_module
+
+
+class TestEditMode(unittest.TestCase):
+    def setUp(self):
+        self.servo_settings = import_addon_module("utils.servo_settings")
+        self.servo_position = import_addon_module("utils.servo_position")
+        self.rest_matrix_cache = import_addon_module("utils.rest_matrix_cache")
+        self.obj = bpy.context.object
+        self.pose_bone = self.obj.pose.bones["Bone"]
+
+    def tearDown(self):
+        bpy.ops.wm.open_mainfile(filepath=TEST_FILE)
+
+    def edit_bone(self, callback):
+        bpy.ops.object.mode_set(mode='EDIT')
+        callback(self.obj.data.edit_bones["Bone"])
+
+        # Values calculated while editing still see the settings of the original bone
+        self.servo_position.calculate_position(self.pose_bone)
+
+        bpy.ops.object.mode_set(mode='OBJECT')
+        bpy.context.view_layer.update()
+
+    def test_servo_settings(self):
+        scene = bpy.context.scene
+
+        assert self.servo_settings.get_servo_ids(scene) == [0]
+
+        self.edit_bone(lambda edit_bone: setattr(edit_bone.servo_settings, "servo_id", 1))
+
+        assert self.obj.data.bones["Bone"].servo_settings.servo_id == 1
+        assert self.servo_settings.get_servo_ids(scene) == [1]
+
+    def test_rest_matrices(self):
+        bone = self.obj.data.bones["Bone"]
+        matrix_bone_inverted = self.rest_matrix_cache.RestMatrixCache.get(bone)[0].copy()
+
+        def rotate(edit_bone):
+            edit_bone.roll += math.pi / 2
+
+        self.edit_bone(rotate)
+        position = self.servo_position.calculate_position(self.pose_bone)
+        cached_matrix = self.rest_matrix_cache.RestMatrixCache.get(bone)[0]
+
+        assert cached_matrix != matrix_bone_inverted
+        assert cached_matrix == bone.matrix_local.inverted()
+
+        self.rest_matrix_cache.RestMatrixCache.clear()
+
+        assert position == self.servo_position.calculate_position(self.pose_bone)
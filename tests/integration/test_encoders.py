@@ -0,0 +1,52 @@
+import unittest
+
+from helpers import import_addon_module
+
+
+class MockEncoder:
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+
+    def write(self, frame_positions):
+        self.frames.append(frame_positions)
+
+    def close(self):
+        self.closed = True
+
+
+def iter_failing_positions(frames):
+    for frame in range(frames):
+        yield {0: frame}
+
+    raise RuntimeError("calculation failed")
+
+
+class TestFanOutEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoders = import_addon_module("utils.encoders")
+        self.targets = [MockEncoder(), MockEncoder()]
+        self.encoder = self.encoders.FanOutEncoder(self.targets)
+        self.threads = list(self.encoder.threads)
+
+    def test_encode(self):
+        self.encoders.encode(self.encoder, ({0: frame} for frame in range(10)))
+
+        for target in self.targets:
+            assert target.closed
+            assert target.frames == [{0: frame} for frame in range(10)]
+
+        assert not any(thread.is_alive() for thread in self.threads)
+
+    def test_abort_on_error(self):
+        with self.assertRaises(RuntimeError):
+            self.encoders.encode(self.encoder, iter_failing_positions(3))
+
+        assert not any(thread.is_alive() for thread in self.threads)
+        assert not any(target.closed for target in self.targets)
+
+    def test_abort_after_close(self):
+        self.encoder.close()
+        self.encoder.abort()
+
+        assert all(target.closed for target in self.targets)
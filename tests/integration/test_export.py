@@ -7,6 +7,8 @@ from parameterized import parameterized
 
 import bpy
 
+from helpers import EXAMPLES_DIR, TEST_FILE, import_addon_module
+
 
 def assert_file_hash(file_path, expected):
     assert os.path.exists(
@@ -88,6 +90,281 @@ class TestExport(unittest.TestCase):
 
         assert_file_hash(export_file, expected)
 
+    @parameterized.expand([
+        ("with skipping", True,
+         "f6d5d5b3e0012e63e28b51bfe7416ffebf9517b67e4a873f947ff1c998a4a512"),
+        ("without skipping", False,
+         "11f06c27463865d5e6a4f014c515a01c1c0212c413d0434698908a562c13237f")
+    ])
+    def test_parallel_export(self, _name, skip_duplicates, expected):
+        export_file = self.output_dir + "/export.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=export_file,
+            skip_duplicates=skip_duplicates,
+            worker_count=3
+        )
+
+        assert_file_hash(export_file, expected)
+
+    @parameterized.expand([
+        ("with skipping", True),
+        ("without skipping", False)
+    ])
+    def test_compact_binary_export(self, _name, skip_duplicates):
+        binary_v2 = import_addon_module("utils.binary_v2")
+        encoders = import_addon_module("utils.encoders")
+        export_file = self.output_dir + "/export.bin"
+        compact_file = self.output_dir + "/compact.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=export_file, skip_duplicates=skip_duplicates)
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=compact_file, skip_duplicates=skip_duplicates, binary_format='COMPACT')
+
+        with open(export_file, "rb") as file:
+            frames = encoders.decode_frame_commands(file.read())
+
+        with open(compact_file, "rb") as file:
+            header, compact_frames = binary_v2.decode(file.read())
+
+        assert header["fps"] == bpy.context.scene.render.fps
+        assert header["frames"] == len(frames)
+        assert compact_frames == frames
+        assert os.path.getsize(compact_file) < os.path.getsize(export_file)
+
+    @parameterized.expand([
+        ("commands", 'COMMANDS'),
+        ("compact", 'COMPACT')
+    ])
+    def test_seekable_binary_export(self, _name, binary_format):
+        container = import_addon_module("utils.container")
+        encoders = import_addon_module("utils.encoders")
+        export_file = self.output_dir + "/export.bin"
+        seekable_file = self.output_dir + "/seekable.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(filepath=export_file)
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=seekable_file, binary_format=binary_format, keyframe_interval=10)
+
+        with open(export_file, "rb") as file:
+            frames = encoders.decode_frame_commands(file.read())
+
+        positions = {}
+
+        with container.ContainerReader(seekable_file) as reader:
+            assert len(reader) == len(frames)
+
+            for frame, frame_positions in enumerate(frames):
+                positions.update(frame_positions)
+
+                assert reader.get_state(frame) == positions
+
+    @parameterized.expand([
+        ("stream", 0),
+        ("seekable", 10),
+    ])
+    def test_compressed_holds_binary_export(self, _name, keyframe_interval):
+        container = import_addon_module("utils.container")
+        encoders = import_addon_module("utils.encoders")
+        export_file = self.output_dir + "/export.bin"
+        compressed_file = self.output_dir + "/compressed.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(filepath=export_file)
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=compressed_file, keyframe_interval=keyframe_interval, compress_holds=True)
+
+        with open(export_file, "rb") as file:
+            frames = encoders.decode_frame_commands(file.read())
+
+        if keyframe_interval == 0:
+            with open(compressed_file, "rb") as file:
+                assert encoders.decode_frame_commands(file.read()) == frames
+
+            assert os.path.getsize(compressed_file) <= os.path.getsize(export_file)
+
+            return
+
+        positions = {}
+
+        with container.ContainerReader(compressed_file) as reader:
+            assert len(reader) == len(frames)
+
+            for frame, frame_positions in enumerate(frames):
+                positions.update(frame_positions)
+
+                assert reader.get_state(frame) == positions
+
+    @parameterized.expand([
+        ("exact", 0),
+        ("with tolerance", 3)
+    ])
+    def test_simplified_binary_export(self, _name, tolerance):
+        simplify = import_addon_module("utils.simplify")
+        encoders = import_addon_module("utils.encoders")
+        export_file = self.output_dir + "/export.bin"
+        simplified_file = self.output_dir + "/simplified.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(filepath=export_file)
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=simplified_file, simplify=True, tolerance=tolerance, compress_holds=True)
+
+        with open(export_file, "rb") as file:
+            frames = encoders.decode_frame_commands(file.read())
+
+        with open(simplified_file, "rb") as file:
+            simplified_frames = list(simplify.expand_ramps(
+                encoders.decode_frame_commands(file.read())))
+
+        assert len(simplified_frames) == len(frames)
+
+        positions = {}
+        simplified_positions = {}
+
+        for frame_positions, simplified_frame_positions in zip(frames, simplified_frames):
+            positions.update(frame_positions)
+            simplified_positions.update(simplified_frame_positions)
+
+            assert all(
+                abs(simplified_positions[servo_id] - position) <= tolerance
+                for servo_id, position in positions.items()
+            )
+
+        assert os.path.getsize(simplified_file) < os.path.getsize(export_file)
+
+    def test_simplified_seekable_binary_export(self):
+        export_file = self.output_dir + "/export.bin"
+
+        error_msg = ""
+
+        try:
+            bpy.ops.export_anim.servo_animation_binary(
+                filepath=export_file, simplify=True, keyframe_interval=10)
+        except RuntimeError as error:
+            error_msg = str(error)
+
+        assert not os.path.exists(
+            export_file), "did not expect export file to be present"
+        assert "require the commands binary format without keyframes" in error_msg
+
+    @parameterized.expand([
+        ("compact binary", "binary", {"binary_format": 'COMPACT'},
+         "require the commands binary format"),
+        ("packed binary", "binary", {"binary_format": 'PACKED'},
+         "require the commands binary format"),
+        ("packed arduino", "arduino", {"packed": True},
+         "can not be combined with compressed holds"),
+    ])
+    def test_unsupported_compressed_holds(self, _name, export_type, options, expected):
+        export_file = self.output_dir + "/export." + ("h" if export_type == "arduino" else "bin")
+        operator = getattr(bpy.ops.export_anim, f"servo_animation_{export_type}")
+
+        error_msg = ""
+
+        try:
+            operator(filepath=export_file, compress_holds=True, **options)
+        except RuntimeError as error:
+            error_msg = str(error)
+
+        assert not os.path.exists(
+            export_file), "did not expect export file to be present"
+        assert expected in error_msg, f"got '{error_msg}'"
+
+    @parameterized.expand([
+        ("without error", 0),
+        ("with error", 5)
+    ])
+    def test_packed_binary_export(self, _name, max_error):
+        packing = import_addon_module("utils.packing")
+        encoders = import_addon_module("utils.encoders")
+        export_file = self.output_dir + "/export.bin"
+        packed_file = self.output_dir + "/packed.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(filepath=export_file)
+        bpy.ops.export_anim.servo_animation_binary(
+            filepath=packed_file, binary_format='PACKED', max_error=max_error)
+
+        with open(export_file, "rb") as file:
+            frames = encoders.decode_frame_commands(file.read())
+
+        with open(packed_file, "rb") as file:
+            _header, packed_frames = packing.decode(file.read())
+
+        assert len(packed_frames) == len(frames)
+
+        for frame_positions, packed_positions in zip(frames, packed_frames):
+            assert frame_positions.keys() == packed_positions.keys()
+
+            for servo_id, position in frame_positions.items():
+                assert abs(packed_positions[servo_id] - position) <= max_error
+
+        assert os.path.getsize(packed_file) * 1.5 < os.path.getsize(export_file)
+
+    def test_packed_arduino_export(self):
+        export_file = self.output_dir + "/export.h"
+
+        bpy.ops.export_anim.servo_animation_arduino(filepath=export_file, packed=True)
+
+        with open(export_file, encoding="utf-8") as file:
+            content = file.read()
+
+        assert "ANIMATION_DATA[LENGTH] = {\n    0x53, 0x52, 0x56, 0x50, 0x01," in content
+
+    def test_background_export(self):
+        export_file = self.output_dir + "/export.bin"
+
+        bpy.ops.export_anim.servo_animation_binary(filepath=export_file, use_background=True)
+
+        assert_file_hash(
+            export_file, "f6d5d5b3e0012e63e28b51bfe7416ffebf9517b67e4a873f947ff1c998a4a512")
+        assert os.listdir(self.output_dir) == ["export.bin"], "expected no temporary files"
+
+    def test_multi_export(self):
+        export_file = self.output_dir + "/export"
+
+        bpy.ops.export_anim.servo_animation_multi(filepath=export_file)
+
+        assert_file_hash(
+            export_file + ".h",
+            "91f67d84a30e52f6c1f985c392596fc492d8441691becf118fb76c91f54b192d"
+        )
+        assert_file_hash(
+            export_file + ".json",
+            "d9daf933670642efc973b2cf2a44516630a0c31a7b11ca64cc7668d64b550cb8"
+        )
+        assert_file_hash(
+            export_file + ".bin",
+            "f6d5d5b3e0012e63e28b51bfe7416ffebf9517b67e4a873f947ff1c998a4a512"
+        )
+
+    def test_scene_batch_export(self):
+        export_file = self.output_dir + "/export"
+        scene_name = bpy.context.scene.name
+
+        bpy.ops.export_anim.servo_animation_scenes(
+            filepath=export_file, export_format='BINARY')
+
+        assert_file_hash(
+            f"{export_file}_{bpy.path.clean_name(scene_name)}.bin",
+            "f6d5d5b3e0012e63e28b51bfe7416ffebf9517b67e4a873f947ff1c998a4a512"
+        )
+
+    def test_scene_batch_export_single_header(self):
+        export_file = self.output_dir + "/export"
+
+        bpy.ops.export_anim.servo_animation_scenes(
+            filepath=export_file, export_format='ARDUINO', single_file=True)
+
+        with open(export_file + ".h", encoding="utf-8") as file:
+            content = file.read()
+
+        namespace = bpy.types.EXPORT_ANIM_OT_servo_animation_arduino.format_scene_name(
+            bpy.context.scene)
+
+        assert content.count("#include <Arduino.h>") == 1
+        assert f"namespace {namespace} {{" in content
+        assert f"}} // namespace {namespace}" in content
+
     @parameterized.expand([
         ("arduino", ".h"),
         ("json", ".json"),
@@ -123,5 +400,105 @@ class TestExport(unittest.TestCase):
         assert got == exp, f"expected error message '{exp}', got '{got}' instead"
 
 
+class TestExampleSceneExport(unittest.TestCase):
+    def setUp(self):
+        self.encoders = import_addon_module("utils.encoders")
+        self.output_dir = os.path.join(os.path.dirname(__file__), "output")
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        os.mkdir(self.output_dir)
+        bpy.ops.wm.open_mainfile(filepath=os.path.join(EXAMPLES_DIR, "Scenes", "scenes.blend"))
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        bpy.ops.wm.open_mainfile(filepath=TEST_FILE)
+
+    def read_frames(self, filepath):
+        with open(filepath, "rb") as file:
+            return self.encoders.decode_frame_commands(file.read())
+
+    def test_inactive_scene(self):
+        export_file = self.output_dir + "/export"
+        servo_settings = import_addon_module("utils.servo_settings")
+        scenes = [
+            scene for scene in bpy.data.scenes
+            if scene != bpy.context.scene and servo_settings.get_active_pose_bones(scene)
+        ]
+
+        assert scenes, "expected scenes besides the active one"
+
+        bpy.ops.export_anim.servo_animation_scenes(
+            filepath=export_file,
+            export_format='BINARY',
+            scenes=[{"name": scene.name, "selected": True} for scene in scenes]
+        )
+
+        assert len(os.listdir(self.output_dir)) == len(scenes)
+
+        for scene in scenes:
+            # The examples are single scene exports made with each scene being active
+            example_file = os.path.join(
+                EXAMPLES_DIR, "Scenes", scene.name.replace("Scene", "scene-").lower() + ".bin")
+            frames = self.read_frames(f"{export_file}_{bpy.path.clean_name(scene.name)}.bin")
+
+            assert frames == self.read_frames(example_file), f"scene {scene.name}"
+
+    def rename_scenes(self, names):
+        servo_settings = import_addon_module("utils.servo_settings")
+        scenes = [scene for scene in bpy.data.scenes if servo_settings.get_active_pose_bones(scene)]
+        example_files = {}
+
+        assert len(scenes) >= len(names), "expected enough scenes with servos"
+
+        for scene, name in zip(scenes, names):
+            example_files[name] = os.path.join(
+                EXAMPLES_DIR, "Scenes", scene.name.replace("Scene", "scene-").lower() + ".bin")
+            scene.name = name
+
+        return [{"name": name, "selected": True} for name in names], example_files
+
+    def test_colliding_scene_names(self):
+        export_file = self.output_dir + "/export"
+        scenes, example_files = self.rename_scenes(["Scene A", "Scene_A"])
+
+        bpy.ops.export_anim.servo_animation_scenes(
+            filepath=export_file, export_format='BINARY', scenes=scenes)
+
+        assert sorted(os.listdir(self.output_dir)) == ["export_Scene_A.bin", "export_Scene_A_2.bin"]
+        assert self.read_frames(export_file + "_Scene_A.bin") == self.read_frames(
+            example_files["Scene A"])
+        assert self.read_frames(export_file + "_Scene_A_2.bin") == self.read_frames(
+            example_files["Scene_A"])
+
+    def test_colliding_namespaces(self):
+        export_file = self.output_dir + "/export"
+        scenes, _example_files = self.rename_scenes(["Scene A", "Scene_A"])
+
+        bpy.ops.export_anim.servo_animation_scenes(
+            filepath=export_file, export_format='ARDUINO', single_file=True, scenes=scenes)
+
+        with open(export_file + ".h", encoding="utf-8") as file:
+            content = file.read()
+
+        assert content.count("namespace Scene_A {") == 1
+        assert content.count("namespace Scene_A_2 {") == 1
+
+    def test_active_scene(self):
+        export_file = self.output_dir + "/export"
+        scene = bpy.context.scene
+
+        bpy.ops.export_anim.servo_animation_binary(filepath=export_file + ".bin")
+        bpy.ops.export_anim.servo_animation_scenes(
+            filepath=export_file,
+            export_format='BINARY',
+            scenes=[{"name": scene.name, "selected": True}]
+        )
+
+        assert self.read_frames(export_file + ".bin") == self.read_frames(
+            f"{export_file}_{bpy.path.clean_name(scene.name)}.bin")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+# pylint: disable=protected-access
+
+import unittest
+import glob
+import os
+import shutil
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from helpers import import_addon_module
+
+
+class TestExportTask(unittest.TestCase):
+    def setUp(self):
+        self.encoders = import_addon_module("utils.encoders")
+        self.export_task = import_addon_module("utils.export_task")
+        self.output_dir = tempfile.mkdtemp()
+        self.files = self.encoders.OutputFiles()
+        self.threads = []
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def get_jobs(self, frames):
+        for name in ["a", "b"]:
+            base_path = os.path.join(self.output_dir, name)
+            encoder = self.encoders.FanOutEncoder([
+                self.encoders.BinaryEncoder(self.files.open(base_path + ".bin", "wb")),
+                self.encoders.JsonEncoder(
+                    self.files.open(base_path + ".json"),
+                    {"fps": 30, "frames": frames, "seconds": 1, "file": "", "scene": name},
+                    None
+                ),
+            ])
+            self.threads += encoder.threads
+
+            yield ({0: frame} for frame in range(frames)), encoder
+
+    def test_process(self):
+        task = self.export_task.ExportTask(self.get_jobs(50), self.files, 100)
+        slices = 1
+
+        while not task.process(time.time() + 0.0001):
+            slices += 1
+
+        assert slices > 1
+        assert task.frame_count == 100
+        assert sorted(os.listdir(self.output_dir)) == ["a.bin", "a.json", "b.bin", "b.json"]
+        assert not any(thread.is_alive() for thread in self.threads)
+
+    def test_cancel(self):
+        task = self.export_task.ExportTask(self.get_jobs(1000), self.files, 2000)
+        task.process(time.time() + 0.001)
+
+        assert self.threads, "expected a running export job"
+
+        task.cancel()
+
+        assert not any(thread.is_alive() for thread in self.threads)
+        assert not glob.glob(os.path.join(self.output_dir, "*.part"))
+        assert not os.listdir(self.output_dir)
+
+    def get_failing_jobs(self):
+        encoder = self.encoders.BinaryEncoder(
+            self.files.open(os.path.join(self.output_dir, "a.bin"), "wb"))
+
+        def get_positions():
+            yield {0: 90}
+            raise ValueError("unexpected")
+
+        yield get_positions(), encoder
+
+    def test_unexpected_error(self):
+        base_export = import_addon_module("ops.base_export")
+        export = base_export.BaseExport()
+        export._task = self.export_task.ExportTask(self.get_failing_jobs(), self.files, 2)
+        export._timer = object()
+        export._original_frames = []
+        export._original_live_mode = False
+        context = SimpleNamespace(window_manager=mock.Mock(), workspace=mock.Mock())
+
+        with self.assertRaises(ValueError):
+            export.modal(context, SimpleNamespace(type='TIMER'))
+
+        context.window_manager.event_timer_remove.assert_called_once_with(export._timer)
+        context.workspace.status_text_set.assert_called_once_with(None)
+        assert not os.listdir(self.output_dir)
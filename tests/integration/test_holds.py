@@ -0,0 +1,130 @@
+import unittest
+import glob
+import io
+import os
+import tempfile
+
+from parameterized import parameterized
+
+from helpers import EXAMPLES_DIR, import_addon_module
+
+FRAMES = [{0: 90, 1: 45}] + [{}] * 300 + [{0: 91}, {}, {}, {1: 50}] + [{}] * 10
+
+
+class TestHolds(unittest.TestCase):
+    def setUp(self):
+        self.encoders = import_addon_module("utils.encoders")
+        self.container = import_addon_module("utils.container")
+
+    def encode(self, frames, compress_holds=True):
+        file = io.BytesIO()
+        encoder = self.encoders.BinaryEncoder(file, compress_holds)
+
+        for frame_positions in frames:
+            encoder.write(frame_positions)
+
+        encoder.close()
+
+        return file.getvalue()
+
+    @parameterized.expand([
+        ("none", 0, b""),
+        ("short", 4, b"\n\n\n\n"),
+        ("wait", 5, b"\x28\x00\x05\x29"),
+        ("long", 300, b"\x28\x01\x2c\x29"),
+        ("maximum", 65535, b"\x28\xff\xff\x29"),
+        ("split", 65539, b"\x28\xff\xff\x29\n\n\n\n"),
+        ("split twice", 65540, b"\x28\xff\xff\x29\x28\x00\x05\x29"),
+    ])
+    def test_hold_commands(self, _name, frames, expected):
+        assert bytes(self.encoders.get_hold_commands(frames)) == expected
+
+    def test_encode_frames(self):
+        data = self.encode([{1: 90}] + [{}] * 6 + [{1: 91}, {}])
+
+        assert data == (
+            b"\x3c\x01\x00\x5a\x3e\n"
+            + b"\x28\x00\x06\x29"
+            + b"\x3c\x01\x00\x5b\x3e\n"
+            + b"\n"
+        )
+
+    def test_round_trip(self):
+        data = self.encode(FRAMES)
+
+        assert self.encoders.decode_frame_commands(data) == FRAMES
+        assert len(data) < len(self.encode(FRAMES, False)) - 290
+        assert bytes(self.encoders.get_commands(FRAMES, True)) == data
+
+    def test_disabled_by_default(self):
+        assert self.encode(FRAMES, False) == bytes(self.encoders.get_commands(FRAMES))
+
+    def test_round_trip_examples(self):
+        paths = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "*", "*.bin")))
+
+        assert paths, "expected example binary files"
+
+        for path in paths:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            frames = self.encoders.decode_frame_commands(data)
+            encoded = self.encode(frames)
+
+            assert self.encoders.decode_frame_commands(encoded) == frames
+            assert len(encoded) <= len(data)
+
+    def test_arduino(self):
+        file = io.StringIO()
+        meta = {"fps": 30, "frames": len(FRAMES), "seconds": 10, "scene": "Scene", "file": ""}
+        encoder = self.encoders.ArduinoEncoder(file, meta, 12, compress_holds=True)
+
+        for frame_positions in FRAMES:
+            encoder.write(frame_positions)
+
+        encoder.close()
+        content = file.getvalue()
+        expected = self.encode(FRAMES)
+
+        assert f"const int LENGTH = {len(expected)};" in content
+        assert "    0x3c, 0x00, 0x00, 0x5a, 0x3e, 0x3c, 0x01, 0x00, 0x2d, 0x3e, 0x0a, 0x28,\n" \
+            "    0x01, 0x2c, 0x29," in content
+
+    @parameterized.expand([
+        ("every frame", 1),
+        ("every 100 frames", 100),
+        ("single keyframe", 1000),
+    ])
+    def test_seek(self, _name, keyframe_interval):
+        handle, filepath = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+
+        try:
+            with open(filepath, "wb") as file:
+                encoder = self.container.SeekableEncoder(
+                    file, self.encoders.BinaryEncoder(file, True), keyframe_interval)
+
+                for frame_positions in FRAMES:
+                    encoder.write(frame_positions)
+
+                encoder.close()
+
+            positions = {}
+
+            with self.container.ContainerReader(filepath) as reader:
+                assert len(reader) == len(FRAMES)
+
+                for frame, frame_positions in enumerate(FRAMES):
+                    positions.update(frame_positions)
+
+                    assert reader.get_state(frame) == positions, f"frame {frame}"
+        finally:
+            os.remove(filepath)
+
+    @parameterized.expand([
+        ("truncated", b"\x28\x00\x05"),
+        ("end byte", b"\x28\x00\x05\x3e"),
+    ])
+    def test_invalid_wait_command(self, _name, data):
+        with self.assertRaises(ValueError):
+            self.encoders.decode_frame_commands(data)
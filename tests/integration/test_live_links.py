@@ -0,0 +1,156 @@
+import unittest
+import os
+import threading
+
+from parameterized import parameterized
+
+import bpy
+
+from helpers import import_addon_module
+
+
+class MockConnection:
+    def __init__(self, fail=False):
+        self.data = b""
+        self.fail = fail
+        self.closed = False
+        self.written = threading.Event()
+
+    def write(self, data):
+        if self.fail:
+            raise OSError("link failed")
+
+        self.data += data
+        self.written.set()
+
+    def close(self):
+        self.closed = True
+
+
+class TestLiveLinks(unittest.TestCase):
+    def setUp(self):
+        self.live_links = import_addon_module("utils.live_links")
+
+    def create_link(self, servo_ids, fail=False):
+        connection = MockConnection(fail)
+
+        return self.live_links.LiveLink("mock", connection, connection.write, servo_ids)
+
+    @parameterized.expand([
+        ("empty", "", None),
+        ("single", "3", {3}),
+        ("list", "1, 4,7", {1, 4, 7}),
+        ("range", "0-3", {0, 1, 2, 3}),
+        ("mixed", "0-1,9", {0, 1, 9}),
+    ])
+    def test_parse_servo_ids(self, _name, text, expected):
+        assert self.live_links.parse_servo_ids(text) == expected
+
+    @parameterized.expand([
+        ("invalid", "a"),
+        ("out of range", "0-300"),
+    ])
+    def test_parse_invalid_servo_ids(self, _name, text):
+        with self.assertRaises(ValueError):
+            self.live_links.parse_servo_ids(text)
+
+    def test_routing(self):
+        first = self.create_link({0, 1})
+        second = self.create_link(None)
+        router = self.live_links.LiveRouter([first, second])
+
+        router.send(0, 90)
+        router.send(5, 45)
+        router.close()
+
+        assert first.connection.data == b"<\x00\x00Z>"
+        assert second.connection.data == b"<\x00\x00Z><\x05\x00->"
+        assert first.connection.closed and second.connection.closed
+
+    def test_failing_link(self):
+        failing = self.create_link(None, fail=True)
+        working = self.create_link(None)
+        router = self.live_links.LiveRouter([failing, working])
+
+        router.send(0, 90)
+        working.connection.written.wait(1)
+        failing.sender.close()
+
+        assert router.error is None
+        assert router.is_connected()
+
+        stats = router.get_stats()
+        router.close()
+
+        assert not stats[0]["healthy"]
+        assert stats[0]["error"] == "link failed"
+        assert stats[1]["healthy"]
+        assert stats[1]["bytes_sent"] == 5
+        assert stats[1]["writes"] == 1
+
+    def test_all_links_failing(self):
+        router = self.live_links.LiveRouter([self.create_link(None, fail=True)])
+
+        router.send(0, 90)
+        router.links[0].sender.close()
+
+        assert isinstance(router.error, OSError)
+        assert not router.is_connected()
+
+        router.close()
+
+
+class TestLiveLinksLiveMode(unittest.TestCase):
+    def setUp(self):
+        self.ptys = [os.openpty(), os.openpty()]
+        servo_animation = bpy.context.window_manager.servo_animation
+
+        for (_receiver, sender), servo_ids in zip(self.ptys, ["0", "1-255"]):
+            live_link = servo_animation.live_links.add()
+            live_link.method = 'SERIAL'
+            live_link.serial_port = os.ttyname(sender)
+            live_link.servo_ids = servo_ids
+
+    def tearDown(self):
+        for receiver, sender in self.ptys:
+            for descriptor in (sender, receiver):
+                try:
+                    os.close(descriptor)
+                except OSError:
+                    pass
+
+        servo_animation = bpy.context.window_manager.servo_animation
+        servo_animation.live_links.clear()
+        servo_animation.live_mode_method = 'SERIAL'
+        bpy.context.scene.frame_set(1)
+
+    @staticmethod
+    def read_data(receiver, sender):
+        data = b""
+
+        try:
+            os.close(sender)
+            with os.fdopen(receiver, "rb") as reader:
+                while len(reader.peek()) > 0:
+                    data += reader.read(1)
+        except OSError:
+            pass
+
+        return data
+
+    def test_routing(self):
+        bpy.ops.servo_animation.start_live_mode('EXEC_DEFAULT', method='LINKS')
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        assert self.read_data(*self.ptys[0]) == b"<\x00\x00Z>"
+        assert self.read_data(*self.ptys[1]) == b""
+
+    def test_invalid_link(self):
+        live_mode = import_addon_module("utils.live_mode")
+        bpy.context.window_manager.servo_animation.live_links[1].serial_port = "/dev/ttyInvalid"
+
+        with self.assertRaises(RuntimeError):
+            bpy.ops.servo_animation.start_live_mode('EXEC_DEFAULT', method='LINKS')
+
+        assert not live_mode.LiveMode.is_connected()
+        assert self.read_data(*self.ptys[0]) == b""
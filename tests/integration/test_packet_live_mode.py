@@ -0,0 +1,121 @@
+import unittest
+import os
+
+from parameterized import parameterized
+
+import bpy
+
+PACKET_START = 0x5B
+PACKET_END = 0x5D
+
+
+class MockReceiver:
+    def __init__(self, data):
+        self.data = data
+        self.packets = []
+        self.errors = 0
+
+    def receive(self):
+        offset = 0
+
+        while offset < len(self.data):
+            if self.data[offset] != PACKET_START:
+                self.errors += 1
+                offset += 1
+                continue
+
+            count = self.data[offset + 1]
+            end = offset + 2 + count * 3
+            payload = self.data[offset + 1:end]
+            checksum = 0
+
+            for byte in payload:
+                checksum ^= byte
+
+            assert self.data[end] == checksum, "expected valid checksum"
+            assert self.data[end + 1] == PACKET_END, "expected packet end"
+
+            positions = {}
+
+            for index in range(count):
+                servo_offset = offset + 2 + index * 3
+                servo_id = self.data[servo_offset]
+                positions[servo_id] = int.from_bytes(
+                    self.data[servo_offset + 1:servo_offset + 3], 'big')
+
+            self.packets.append(positions)
+            offset = end + 2
+
+        return self.packets
+
+
+class TestPacketLiveMode(unittest.TestCase):
+    def setUp(self):
+        self.receiver, self.sender = os.openpty()
+        self.ttyname = os.ttyname(self.sender)
+        bpy.context.window_manager.servo_animation.live_mode_protocol = 'PACKETS'
+
+    def tearDown(self):
+        try:
+            os.close(self.sender)
+            os.close(self.receiver)
+        except OSError:
+            pass
+
+        servo_animation = bpy.context.window_manager.servo_animation
+        servo_animation.live_mode_protocol = 'COMMANDS'
+        servo_animation.position_jump_handling = False
+        servo_animation.use_sender_thread = False
+        bpy.context.object.data.bones['Bone'].servo_settings.threshold = 20
+        bpy.context.scene.frame_set(1)
+
+    def read_data(self):
+        data = b""
+
+        try:
+            os.close(self.sender)
+            with os.fdopen(self.receiver, "rb") as reader:
+                while len(reader.peek()) > 0:
+                    data += reader.read(1)
+        except OSError:
+            pass
+
+        return data
+
+    def start_live_mode(self):
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='SERIAL',
+            serial_port=self.ttyname,
+            serial_baud=115200
+        )
+
+    @parameterized.expand([
+        ('without handling', False, 10, [90, 45]),
+        ('threshold reached', True, 10, range(90, 44, -1)),
+    ])
+    def test_packets(self, _name, handling, threshold, positions):
+        self.start_live_mode()
+        bpy.context.window_manager.servo_animation.position_jump_handling = handling
+        bpy.context.object.data.bones['Bone'].servo_settings.threshold = threshold
+        bpy.context.scene.frame_set(33)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        receiver = MockReceiver(self.read_data())
+        packets = receiver.receive()
+
+        assert receiver.errors == 0
+        assert packets == [{0: position} for position in positions], f"got {packets}"
+
+    def test_packets_with_sender_thread(self):
+        bpy.context.window_manager.servo_animation.use_sender_thread = True
+        self.start_live_mode()
+        bpy.context.scene.frame_set(33)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        receiver = MockReceiver(self.read_data())
+        packets = receiver.receive()
+
+        assert receiver.errors == 0
+        assert 0 < len(packets) <= 2
+        assert packets[-1] == {0: 45}
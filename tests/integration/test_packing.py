@@ -0,0 +1,134 @@
+import unittest
+import glob
+import io
+import os
+
+from parameterized import parameterized
+
+from helpers import EXAMPLES_DIR, import_addon_module
+
+
+class TestPacking(unittest.TestCase):
+    def setUp(self):
+        self.packing = import_addon_module("utils.packing")
+        self.encoders = import_addon_module("utils.encoders")
+
+    def encode(self, packer, frames):
+        file = io.BytesIO()
+        encoder = self.packing.PackedBinaryEncoder(file, packer)
+
+        for frame_positions in frames:
+            encoder.write(frame_positions)
+
+        encoder.close()
+
+        return file.getvalue()
+
+    @staticmethod
+    def assert_within_error(frames, decoded, max_error):
+        assert len(decoded) == len(frames)
+
+        for frame_positions, decoded_positions in zip(frames, decoded):
+            assert frame_positions.keys() == decoded_positions.keys()
+
+            for servo_id, position in frame_positions.items():
+                assert abs(decoded_positions[servo_id] - position) <= max_error
+
+    def create_quantizers(self, frames, max_error):
+        servo_ids = list(dict.fromkeys(
+            servo_id for frame_positions in frames for servo_id in frame_positions))
+
+        return [
+            self.packing.ServoQuantizer(
+                servo_id,
+                min(frame[servo_id] for frame in frames if servo_id in frame),
+                max(frame[servo_id] for frame in frames if servo_id in frame),
+                2 * max_error + 1
+            )
+            for servo_id in servo_ids
+        ]
+
+    @parameterized.expand([
+        ("default range", 150, 600, 1, 9),
+        ("byte range", 0, 255, 1, 8),
+        ("reduced steps", 150, 600, 3, 8),
+        ("fixed position", 90, 90, 1, 1),
+        ("microseconds", 500, 2500, 5, 9),
+    ])
+    def test_bits(self, _name, position_min, position_max, step, bits):
+        quantizer = self.packing.ServoQuantizer(0, position_min, position_max, step)
+
+        assert quantizer.bits == bits
+
+    @parameterized.expand([
+        ("no error", 0),
+        ("error of 1", 1),
+        ("error of 4", 4),
+    ])
+    def test_max_error(self, _name, max_error):
+        quantizer = self.packing.ServoQuantizer(0, 150, 600, 2 * max_error + 1)
+
+        for position in range(150, 601):
+            quantized = quantizer.quantize(position)
+
+            assert 0 <= quantized < 1 << quantizer.bits
+            assert abs(quantizer.dequantize(quantized) - position) <= max_error
+
+    def test_encode_frames(self):
+        packer = self.packing.PositionPacker(30, [
+            self.packing.ServoQuantizer(1, 0, 255),
+            self.packing.ServoQuantizer(4, 0, 3),
+        ])
+        data = self.encode(packer, [{1: 255, 4: 2}, {4: 3}, {}])
+
+        assert data == (
+            b"SRVP\x01\x00\x00\x1e\x00\x00\x00\x03\x00\x02"
+            + b"\x01\x00\x00\x00\xff\x00\x01"
+            + b"\x04\x00\x00\x00\x03\x00\x01"
+            + b"\x03\xff\x80"
+            + b"\x02\xc0"
+            + b"\x00"
+        )
+
+        header, frames = self.packing.decode(data)
+
+        assert header["frames"] == 3
+        assert frames == [{1: 255, 4: 2}, {4: 3}, {}]
+
+    @parameterized.expand([
+        ("no error", 0),
+        ("error of 2", 2),
+    ])
+    def test_round_trip_examples(self, _name, max_error):
+        paths = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "*", "*.bin")))
+
+        assert paths, "expected example binary files"
+
+        for path in paths:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            frames = self.encoders.decode_frame_commands(data)
+            packer = self.packing.PositionPacker(30, self.create_quantizers(frames, max_error))
+            packed = self.encode(packer, frames)
+            _header, decoded = self.packing.decode(packed)
+            stats = packer.get_stats()
+
+            self.assert_within_error(frames, decoded, max_error)
+            assert stats["packed_length"] == len(packed)
+            assert stats["command_length"] == len(data)
+            assert len(packed) * 1.8 < len(data), f"expected {path} to be smaller"
+            assert all(
+                servo["max_error"] <= max_error for servo in stats["servos"].values())
+            assert "smaller" in packer.get_summary()
+
+    @parameterized.expand([
+        ("magic", b"SRVA\x01\x00\x00\x1e\x00\x00\x00\x00\x00\x00"),
+        ("version", b"SRVP\x02\x00\x00\x1e\x00\x00\x00\x00\x00\x00"),
+        ("servo table", b"SRVP\x01\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x01\x00"),
+        ("truncated frame", b"SRVP\x01\x00\x00\x1e\x00\x00\x00\x01\x00\x01"
+                            b"\x00\x00\x00\x00\xff\x00\x01\x01"),
+    ])
+    def test_invalid_data(self, _name, data):
+        with self.assertRaises(ValueError):
+            self.packing.decode(data)
@@ -0,0 +1,51 @@
+import unittest
+
+from helpers import import_addon_module
+
+
+class TestPlayback(unittest.TestCase):
+    def setUp(self):
+        playback = import_addon_module("utils.playback")
+        self.stream = playback.PlaybackStream(25, 1, 10, 6, 20)
+        self.receiver = playback.PlaybackReceiver()
+
+    def send_frame(self, frame):
+        self.stream.advance(frame)
+        packets = [self.stream.get_sync_packet()]
+
+        for index, missing_frame in self.stream.get_missing_frames():
+            packets.append(self.stream.get_frame_packet(index, [(0, missing_frame * 10)]))
+
+        now = self.stream.index / 25
+        self.receiver.feed(b"".join(packets), now)
+
+        return self.receiver.poll(now)
+
+    def test_buffered_frames(self):
+        self.stream.advance(8)
+
+        assert self.stream.get_missing_frames() == [
+            (0, 8), (1, 9), (2, 10), (3, 1), (4, 2), (5, 3)
+        ]
+
+    def test_receiver_schedule(self):
+        due_frames = []
+
+        for frame in [8, 9, 10, 1, 2, 3, 4]:
+            due_frames += self.send_frame(frame)
+
+        assert due_frames == [{0: position} for position in [80, 90, 100, 10, 20, 30, 40]]
+        assert self.receiver.decoder.errors == 0
+
+    def test_lead_time(self):
+        self.send_frame(1)
+
+        # Frames become due 20 ms before their timestamp to make up for the transmission delay
+        assert self.receiver.poll(.019) == []
+        assert self.receiver.poll(.02) == [{0: 20}]
+
+    def test_clear(self):
+        self.send_frame(1)
+        self.receiver.feed(self.stream.get_clear_packet(), 0)
+
+        assert self.receiver.poll(10) == []
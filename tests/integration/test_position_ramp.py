@@ -0,0 +1,94 @@
+import unittest
+
+from parameterized import parameterized
+
+from helpers import import_addon_module
+
+
+class TestPositionRamp(unittest.TestCase):
+    def setUp(self):
+        self.position_ramp = import_addon_module("utils.position_ramp")
+
+    def create_ramp(self):
+        return self.position_ramp.PositionRamp(
+            {0: 90, 1: 100},
+            {0: 45, 1: 400, 2: 7},
+            {0: 100, 1: 200, 2: 10},
+            {0: 500, 1: 1000, 2: 10},
+            start=0
+        )
+
+    def test_duration(self):
+        ramp = self.create_ramp()
+
+        assert abs(ramp.duration - 1.7) < 1e-9, f"got {ramp.duration}"
+        assert not ramp.is_finished(1.6)
+        assert ramp.is_finished(1.7)
+
+    @parameterized.expand([
+        ("start", 0, [(0, 90), (1, 100), (2, 7)]),
+        ("end", 1.7, [(0, 45), (1, 400), (2, 7)]),
+        ("after end", 5, [(0, 45), (1, 400), (2, 7)]),
+    ])
+    def test_positions(self, _name, now, expected):
+        positions = self.create_ramp().get_positions(now)
+
+        assert positions == expected, f"got {positions}"
+
+    def test_monotonic_movement(self):
+        ramp = self.create_ramp()
+        previous = dict(ramp.get_positions(0))
+
+        for index in range(1, 171):
+            positions = dict(ramp.get_positions(index / 100))
+
+            assert positions[0] <= previous[0]
+            assert positions[1] >= previous[1]
+            assert abs(positions[1] - previous[1]) <= 200 / 100 + 1
+
+            previous = positions
+
+    def continue_ramp(self, ramp, now, targets):
+        return self.position_ramp.PositionRamp(
+            dict(ramp.get_positions(now)),
+            targets,
+            ramp.velocities,
+            ramp.accelerations,
+            start=now,
+            start_velocities=ramp.get_velocities(now)
+        )
+
+    def test_velocities(self):
+        ramp = self.create_ramp()
+
+        assert ramp.get_velocities(0) == {0: 0, 1: 0, 2: 0}
+        assert ramp.get_velocities(1.7) == {0: 0, 1: 0, 2: 0}
+        assert abs(ramp.get_velocities(0.85)[1] - 200) < 1e-9
+
+    @parameterized.expand([
+        ("same direction", 400, 1),
+        ("further", 1000, 1),
+        ("closer", 200, -1),
+        ("reverse", 0, -1),
+    ])
+    def test_continue_ramp(self, _name, target, direction):
+        ramp = self.create_ramp()
+        velocity = ramp.get_velocities(0.5)[1]
+        following = self.continue_ramp(ramp, 0.5, {1: target})
+
+        assert following.get_positions(0.5) == [(1, dict(ramp.get_positions(0.5))[1])]
+        assert abs(following.get_velocities(0.5)[1] - velocity) < 1e-9
+        assert following.get_positions(following.start + following.duration) == [(1, target)]
+
+        # The velocity never jumps, it only changes with the acceleration
+        previous = velocity
+
+        for index in range(1, round(following.duration * 1000) + 1):
+            current = following.get_velocities(0.5 + index / 1000)[1]
+
+            assert abs(current - previous) <= 1000 / 1000 + 1e-6
+            assert abs(current) <= 200 + 1e-6
+
+            previous = current
+
+        assert following.get_velocities(0.5 + 0.05)[1] * direction > velocity * direction - 1e-9
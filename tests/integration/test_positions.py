@@ -0,0 +1,65 @@
+import unittest
+
+from helpers import import_addon_module
+
+FRAMES = [
+    {0: 90, 3: 45},
+    {0: 91},
+    {},
+    {3: 50},
+    {0: 95, 3: 55},
+]
+
+
+class TestPositionStore(unittest.TestCase):
+    def setUp(self):
+        positions = import_addon_module("utils.positions")
+        self.store = positions.PositionStore.from_frames([0, 3], FRAMES)
+
+    def test_from_frames(self):
+        assert len(self.store) == len(FRAMES)
+        assert list(self.store) == FRAMES
+        assert self.store.positions.typecode == 'H'
+        assert len(self.store.positions) == len(FRAMES) * 2
+
+    def test_duplicate_servo_ids(self):
+        positions = import_addon_module("utils.positions")
+        store = positions.PositionStore.from_frames([0, 3, 0], FRAMES)
+
+        assert store.servo_ids == [0, 3]
+        assert list(store) == FRAMES
+
+    def test_frame(self):
+        assert self.store[0] == {0: 90, 3: 45}
+        assert self.store[2] == {}
+        assert self.store[-1] == {0: 95, 3: 55}
+
+        with self.assertRaises(IndexError):
+            self.store.frame(len(FRAMES))
+
+    def test_slice(self):
+        assert list(self.store[1:4]) == FRAMES[1:4]
+        assert list(self.store[3:]) == FRAMES[3:]
+        assert list(self.store[:-3]) == FRAMES[:-3]
+        assert len(self.store[4:2]) == 0
+        assert list(self.store.frames(1, 3).servo(3)) == [45, 45]
+
+    def test_columns(self):
+        # Unchanged servos keep their last position in the columns
+        assert list(self.store.servo(0)) == [90, 91, 91, 91, 95]
+        assert list(self.store.servo(3)) == [45, 45, 45, 50, 55]
+
+        with self.assertRaises(KeyError):
+            self.store.servo(1)
+
+    def test_change_mask(self):
+        assert list(self.store.servo_changes(0)) == [1, 1, 0, 0, 1]
+        assert list(self.store.servo_changes(3)) == [1, 0, 0, 1, 1]
+        assert list(self.store.changes) == [1, 1, 1, 0, 0, 0, 0, 1, 1, 1]
+
+    def test_append_after_slice(self):
+        store = self.store[:2]
+        store.append({3: 60})
+
+        assert list(store) == [{0: 90, 3: 45}, {0: 91}, {3: 60}]
+        assert list(store.servo(0)) == [90, 91, 91]
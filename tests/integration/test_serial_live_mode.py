@@ -1,10 +1,16 @@
+# pylint: disable=protected-access
+
 import unittest
 import os
+import time
+from unittest import mock
 
 from parameterized import parameterized
 
 import bpy
 
+from helpers import import_addon_module
+
 COMMAND_LENGTH = 5
 COMMAND_START = b"<"
 COMMAND_END = b">"
@@ -23,6 +29,9 @@ class TestSerialLiveMode(unittest.TestCase):
             pass
 
         bpy.context.window_manager.servo_animation.position_jump_handling = False
+        bpy.context.window_manager.servo_animation.use_sender_thread = False
+        bpy.context.window_manager.servo_animation.max_send_rate = 0
+        bpy.context.window_manager.servo_animation.use_playback_cache = False
         bpy.context.object.data.bones['Bone'].servo_settings.servo_id = 0
         bpy.context.object.data.bones['Bone'].servo_settings.threshold = 20
         bpy.context.scene.frame_set(1)
@@ -101,6 +110,151 @@ class TestSerialLiveMode(unittest.TestCase):
             assert int.from_bytes(position_byte_a+position_byte_b, 'big') == position
             assert read_bytes[offset + 4] == COMMAND_END
 
+    def test_running_ramp(self):
+        live_mode = import_addon_module("utils.live_mode").LiveMode
+        position_ramp = import_addon_module("utils.position_ramp")
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='SERIAL',
+            serial_port=self.ttyname,
+            serial_baud=115200
+        )
+        bpy.context.window_manager.servo_animation.position_jump_handling = True
+        ramp = position_ramp.PositionRamp({0: 45}, {0: 90}, {0: 100}, {0: 500})
+        live_mode._ramp = ramp
+
+        # An unchanged target keeps the running ramp
+        live_mode.handler(bpy.context.scene, None)
+
+        assert live_mode._ramp is ramp
+
+        bpy.context.scene.frame_set(10)
+
+        assert live_mode._ramp is not ramp
+        assert live_mode._ramp.targets == {0: 81}
+
+        bpy.context.window_manager.servo_animation.position_jump_handling = False
+        bpy.context.scene.frame_set(1)
+
+        assert live_mode._ramp is None
+
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+    def test_sender_thread(self):
+        bpy.context.window_manager.servo_animation.use_sender_thread = True
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='SERIAL',
+            serial_port=self.ttyname,
+            serial_baud=115200
+        )
+        bpy.context.scene.frame_set(10)
+        bpy.context.scene.frame_set(33)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        read_bytes = self.read_bytes()
+
+        assert len(read_bytes) % COMMAND_LENGTH == 0
+        assert 0 < len(read_bytes) <= 3 * COMMAND_LENGTH
+        assert read_bytes[-COMMAND_LENGTH] == COMMAND_START
+        assert int.from_bytes(read_bytes[-3] + read_bytes[-2], 'big') == 45
+        assert read_bytes[-1] == COMMAND_END
+
+    def test_unrelated_update(self):
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='SERIAL',
+            serial_port=self.ttyname,
+            serial_baud=115200
+        )
+
+        live_mode = import_addon_module("utils.live_mode").LiveMode
+
+        with mock.patch.object(live_mode, "handler") as handler:
+            empty = bpy.data.objects.new("Unrelated", None)
+            bpy.context.scene.collection.objects.link(empty)
+            bpy.context.view_layer.update()
+            empty.location.x = 1
+            bpy.context.view_layer.update()
+            bpy.data.objects.remove(empty)
+            bpy.context.view_layer.update()
+
+            assert handler.call_count == 0, f"got {handler.call_count} handler calls"
+
+            location_x = bpy.context.object.location.x
+            bpy.context.object.location.x += 1
+            bpy.context.view_layer.update()
+            bpy.context.object.location.x = location_x
+            bpy.context.view_layer.update()
+
+            assert handler.call_count > 0, "expected handler calls for the armature"
+
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        read_bytes = self.read_bytes()
+
+        assert len(read_bytes) == COMMAND_LENGTH
+        assert int.from_bytes(read_bytes[2] + read_bytes[3], 'big') == 90
+
+    @parameterized.expand([
+        ("within interval", 0, [90]),
+        ("after interval", .05, [90, 45]),
+    ])
+    def test_max_send_rate(self, _name, delay, positions):
+        servo_animation = bpy.context.window_manager.servo_animation
+        servo_animation.position_jump_handling = False
+        servo_animation.max_send_rate = 50
+
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='SERIAL',
+            serial_port=self.ttyname,
+            serial_baud=115200
+        )
+        time.sleep(delay)
+        bpy.context.scene.frame_set(33)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        read_bytes = self.read_bytes()
+
+        assert len(read_bytes) == len(positions) * COMMAND_LENGTH
+
+        for i, position in enumerate(positions):
+            offset = i * COMMAND_LENGTH
+            position_bytes = read_bytes[offset + 2] + read_bytes[offset + 3]
+
+            assert int.from_bytes(position_bytes, 'big') == position
+
+    def test_playback_cache(self):
+        servo_animation = bpy.context.window_manager.servo_animation
+        servo_animation.position_jump_handling = False
+
+        assert bpy.ops.servo_animation.bake_live_cache() == {'FINISHED'}
+        assert servo_animation.use_playback_cache is True
+
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='SERIAL',
+            serial_port=self.ttyname,
+            serial_baud=115200
+        )
+        bpy.context.scene.frame_set(33)
+        bpy.context.object.data.bones['Bone'].servo_settings.servo_id = 1
+        bpy.context.scene.frame_set(66)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        read_bytes = self.read_bytes()
+        expected = [(0, 90), (0, 45), (1, 135)]
+
+        assert len(read_bytes) == len(expected) * COMMAND_LENGTH
+
+        for i, (servo_id, position) in enumerate(expected):
+            offset = i * COMMAND_LENGTH
+            position_bytes = read_bytes[offset + 2] + read_bytes[offset + 3]
+
+            assert int.from_bytes(read_bytes[offset + 1], 'big') == servo_id
+            assert int.from_bytes(position_bytes, 'big') == position
+
     @parameterized.expand([
         ("invalid serial port", "/dev/ttyInvalid", 115200),
         ("invalid baud rate", None, -1),
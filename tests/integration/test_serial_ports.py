@@ -0,0 +1,144 @@
+# pylint: disable=protected-access
+
+import unittest
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from helpers import import_addon_module
+
+
+class TestSerialPortRegistry(unittest.TestCase):
+    def setUp(self):
+        serial_ports = import_addon_module("utils.serial_ports")
+        self.registry = serial_ports.SerialPortRegistry
+        self.registry.clear()
+        self.devices = ["/dev/ttyUSB0"]
+        self.now = 100.0
+        self.patches = [
+            mock.patch.object(serial_ports.list_ports, "comports", side_effect=self.get_comports),
+            mock.patch.object(serial_ports, "time", SimpleNamespace(monotonic=lambda: self.now)),
+        ]
+        self.comports = self.patches[0].start()
+        self.patches[1].start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+        self.registry.clear()
+
+    def get_comports(self):
+        return [SimpleNamespace(device=device) for device in self.devices]
+
+    def wait_for_ports(self, expected):
+        for _attempt in range(100):
+            if self.registry.get_ports() == expected:
+                return
+
+            time.sleep(.01)
+
+        assert self.registry.get_ports() == expected
+
+    def wait_for_refresh(self):
+        for _attempt in range(100):
+            if not self.registry._refreshing:
+                return
+
+            time.sleep(.01)
+
+        assert not self.registry._refreshing
+
+    def test_initial_refresh(self):
+        assert self.registry.get_ports() == ["/dev/ttyUSB0"]
+        assert self.comports.call_count == 1
+
+    def test_ttl(self):
+        self.registry.get_ports()
+        self.devices = ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+        self.now += self.registry.TTL
+
+        assert self.registry.get_ports() == ["/dev/ttyUSB0"]
+        assert self.comports.call_count == 1
+
+    def block_comports(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def get_blocking_comports():
+            started.set()
+            release.wait(1)
+
+            return self.get_comports()
+
+        self.comports.side_effect = get_blocking_comports
+
+        return started, release
+
+    def test_background_refresh(self):
+        self.registry.get_ports()
+        started, release = self.block_comports()
+        self.devices = ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+        self.now += self.registry.TTL + 1
+
+        # The cached ports are returned while the enumeration runs in the background
+        assert self.registry.get_ports() == ["/dev/ttyUSB0"]
+        assert started.wait(1), "expected a background refresh"
+
+        release.set()
+        self.wait_for_ports(["/dev/ttyUSB0", "/dev/ttyUSB1"])
+
+        assert self.comports.call_count == 2
+
+    def test_single_background_refresh(self):
+        self.registry.get_ports()
+        started, release = self.block_comports()
+        self.devices = []
+        self.now += self.registry.TTL + 1
+        self.registry.get_ports()
+
+        assert started.wait(1), "expected a background refresh"
+
+        self.registry.get_ports()
+        self.registry.refresh_in_background()
+        release.set()
+        self.wait_for_ports([])
+
+        assert self.comports.call_count == 2
+
+    def test_failed_refresh(self):
+        self.registry.get_ports()
+        failed = threading.Event()
+
+        def get_failing_comports():
+            self.comports.side_effect = self.get_comports
+            failed.set()
+
+            raise OSError("enumeration failed")
+
+        self.comports.side_effect = get_failing_comports
+        self.devices = ["/dev/ttyUSB1"]
+        self.now += self.registry.TTL + 1
+
+        with mock.patch("threading.excepthook"):
+            self.registry.get_ports()
+
+            assert failed.wait(1), "expected a background refresh"
+
+            self.wait_for_refresh()
+
+        # The failed refresh keeps the previous ports and the next access retries it
+        assert self.registry._ports == ["/dev/ttyUSB0"]
+
+        self.wait_for_ports(["/dev/ttyUSB1"])
+
+        assert self.comports.call_count == 3
+
+    def test_clear(self):
+        self.registry.get_ports()
+        self.devices = []
+        self.registry.clear()
+
+        assert self.registry.get_ports() == []
+        assert self.comports.call_count == 2
@@ -0,0 +1,148 @@
+import unittest
+import glob
+import io
+import os
+
+from parameterized import parameterized
+
+from helpers import EXAMPLES_DIR, import_addon_module
+
+
+def get_states(frames):
+    states = []
+    positions = {}
+
+    for frame_positions in frames:
+        positions.update(frame_positions)
+        states.append(dict(positions))
+
+    return states
+
+
+class TestSimplify(unittest.TestCase):
+    def setUp(self):
+        self.simplify = import_addon_module("utils.simplify")
+        self.encoders = import_addon_module("utils.encoders")
+
+    def encode(self, frames, tolerance, compress_holds=False):
+        file = io.BytesIO()
+        servo_ids = dict.fromkeys(
+            servo_id for frame_positions in frames for servo_id in frame_positions)
+        encoder = self.simplify.SimplifyingEncoder(
+            self.encoders.BinaryEncoder(file, compress_holds), tolerance, servo_ids)
+
+        for frame_positions in frames:
+            encoder.write(frame_positions)
+
+        encoder.close()
+
+        return file.getvalue(), encoder
+
+    def decode(self, data):
+        return list(self.simplify.expand_ramps(self.encoders.decode_frame_commands(data)))
+
+    def assert_within_tolerance(self, frames, decoded, tolerance):
+        assert len(decoded) == len(frames)
+
+        for frame, (state, decoded_state) in enumerate(
+            zip(get_states(frames), get_states(decoded))
+        ):
+            assert state.keys() == decoded_state.keys(), f"frame {frame}"
+
+            for servo_id, position in state.items():
+                assert abs(decoded_state[servo_id] - position) <= tolerance, f"frame {frame}"
+
+    @parameterized.expand([
+        ("start", 100, 200, 0, 4, 100),
+        ("middle", 100, 200, 2, 4, 150),
+        ("end", 100, 200, 4, 4, 200),
+        ("rounded", 0, 1, 1, 2, 1),
+        ("falling", 200, 100, 1, 3, 167),
+    ])
+    def test_interpolate(self, _name, start, target, step, frames, expected):
+        assert self.simplify.interpolate(start, target, step, frames) == expected
+
+    @parameterized.expand([
+        ("line", [0, 10, 20, 30, 40], 0, [0, 4]),
+        ("corner", [0, 10, 20, 10, 0], 0, [0, 2, 4]),
+        ("noise within tolerance", [0, 11, 19, 31, 40], 1, [0, 4]),
+        ("noise above tolerance", [0, 13, 20, 30, 40], 1, [0, 1, 2, 4]),
+        ("single frame", [5], 0, [0]),
+        ("two frames", [5, 7], 0, [0, 1]),
+    ])
+    def test_simplify_curve(self, _name, values, tolerance, expected):
+        assert self.simplify.simplify_curve(values, tolerance) == expected
+
+    def test_max_frames(self):
+        values = list(range(10))
+
+        assert self.simplify.simplify_curve(values, 0, 4) == [0, 4, 6, 9]
+
+    def test_encode_ramp(self):
+        frames = [{1: 100}] + [{1: 100 + step * 10} for step in range(1, 11)] + [{}] * 2
+        data, encoder = self.encode(frames, 0)
+
+        assert data == (
+            b"\x3c\x01\x00\x64\x3e\n"
+            + b"\x2f\x01\x00\xc8\x00\x0a\x5c\n"
+            + b"\n" * 11
+        )
+        assert encoder.commands == 2
+        assert self.decode(data) == frames
+
+    def test_round_trip(self):
+        frames = [{0: 90, 1: 45}]
+        frames += [{0: 90 + step} for step in range(1, 60)]
+        frames += [{}] * 20
+        frames += [{0: 150 - step * 3, 1: 45 + step} for step in range(1, 20)]
+        frames += [{1: 200}, {1: 100}, {}]
+
+        for tolerance in [0, 1, 5]:
+            data, encoder = self.encode(frames, tolerance, True)
+
+            self.assert_within_tolerance(frames, self.decode(data), tolerance)
+            assert encoder.max_error <= tolerance
+            assert len(data) * 5 < len(bytes(self.encoders.get_commands(frames)))
+
+    def test_late_servo(self):
+        frames = [{0: 90}, {0: 91}, {1: 10, 0: 92}, {1: 20}, {1: 30}]
+        data, _encoder = self.encode(frames, 0)
+
+        self.assert_within_tolerance(frames, self.decode(data), 0)
+
+    def test_servo_without_positions(self):
+        file = io.BytesIO()
+        encoder = self.simplify.SimplifyingEncoder(
+            self.encoders.BinaryEncoder(file), 0, [0, 5])
+
+        for frame_positions in [{0: 90}, {0: 100}, {0: 110}]:
+            encoder.write(frame_positions)
+
+        encoder.close()
+
+        assert self.decode(file.getvalue()) == [{0: 90}, {0: 100}, {0: 110}]
+        assert encoder.positions == 3
+
+    @parameterized.expand([
+        ("exact", 0),
+        ("tolerance of 2", 2),
+    ])
+    def test_round_trip_examples(self, _name, tolerance):
+        paths = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "*", "*.bin")))
+
+        assert paths, "expected example binary files"
+
+        for path in paths:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            frames = self.encoders.decode_frame_commands(data)
+            simplified, encoder = self.encode(frames, tolerance)
+
+            self.assert_within_tolerance(frames, self.decode(simplified), tolerance)
+            assert len(simplified) < len(data), f"expected {path} to be smaller"
+            assert "max error" in encoder.get_summary()
+
+    def test_invalid_ramp_command(self):
+        with self.assertRaises(ValueError):
+            self.encoders.decode_frame_commands(b"\x2f\x01\x00\xc8\x00\x00\x5c\n")
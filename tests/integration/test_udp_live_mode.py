@@ -0,0 +1,144 @@
+import unittest
+import socket
+
+from parameterized import parameterized
+
+import bpy
+
+from helpers import import_addon_module
+
+
+class TestDatagramReceiver(unittest.TestCase):
+    def setUp(self):
+        self.protocol = import_addon_module("utils.protocol")
+
+    def create_datagram(self, sequence, positions):
+        return self.protocol.encode_datagram(sequence, self.protocol.encode_packet(positions))
+
+    @parameterized.expand([
+        ("next", 2, 1, True),
+        ("same", 1, 1, False),
+        ("older", 1, 2, False),
+        ("wrap around", 0, 0xFFFFFFFF, True),
+        ("before wrap around", 0xFFFFFFFF, 0, False),
+    ])
+    def test_is_newer_sequence(self, _name, sequence, last_sequence, expected):
+        assert self.protocol.is_newer_sequence(sequence, last_sequence) is expected
+
+    def test_receive(self):
+        receiver = self.protocol.DatagramReceiver()
+
+        assert receiver.receive(self.create_datagram(1, [(0, 90), (1, 45)])) == {0: 90, 1: 45}
+        assert receiver.receive(self.create_datagram(3, [(0, 100)])) == {0: 100}
+        assert receiver.receive(self.create_datagram(2, [(0, 95)])) is None
+        assert receiver.receive(b"\x00\x00\x00\x04[") is None
+
+        assert receiver.positions == {0: 100, 1: 45}
+        assert receiver.last_sequence == 3
+        assert receiver.dropped == 1
+        assert receiver.errors == 1
+
+    def test_receive_reordered(self):
+        receiver = self.protocol.DatagramReceiver()
+
+        assert receiver.receive(self.create_datagram(1, [(0, 90), (1, 45)])) == {0: 90, 1: 45}
+        assert receiver.receive(self.create_datagram(3, [(0, 100)])) == {0: 100}
+
+        # The late datagram for another servo is still the newest state of that servo
+        assert receiver.receive(self.create_datagram(2, [(1, 50)])) == {1: 50}
+        assert receiver.receive(self.create_datagram(2, [(0, 95), (1, 55)])) is None
+        assert receiver.receive(self.create_datagram(4, [(1, 60)])) == {1: 60}
+        assert receiver.receive(self.create_datagram(3, [(0, 105), (1, 65)])) is None
+
+        assert receiver.positions == {0: 100, 1: 60}
+        assert receiver.sequences == {0: 3, 1: 4}
+        assert receiver.last_sequence == 4
+        assert receiver.dropped == 2
+
+
+class TestUdpLiveMode(unittest.TestCase):
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.settimeout(.5)
+        self.host, self.port = self.server.getsockname()
+        self.receiver = import_addon_module("utils.protocol").DatagramReceiver()
+
+    def tearDown(self):
+        self.server.close()
+
+        servo_animation = bpy.context.window_manager.servo_animation
+        servo_animation.live_mode_method = 'SERIAL'
+        servo_animation.position_jump_handling = False
+        servo_animation.use_sender_thread = False
+        bpy.context.object.data.bones['Bone'].servo_settings.threshold = 20
+        bpy.context.scene.frame_set(1)
+
+    def start_live_mode(self):
+        bpy.ops.servo_animation.start_live_mode(
+            'EXEC_DEFAULT',
+            method='UDP',
+            udp_host=self.host,
+            udp_port=self.port
+        )
+
+    def receive(self):
+        packets = []
+
+        try:
+            while True:
+                positions = self.receiver.receive(self.server.recv(1024))
+
+                if positions is not None:
+                    packets.append(positions)
+        except socket.timeout:
+            pass
+
+        return packets
+
+    @parameterized.expand([
+        ("without handling", False, [90, 45]),
+        ("threshold reached", True, range(90, 44, -1)),
+    ])
+    def test_datagrams(self, _name, handling, positions):
+        self.start_live_mode()
+        bpy.context.window_manager.servo_animation.position_jump_handling = handling
+        bpy.context.object.data.bones['Bone'].servo_settings.threshold = 10
+        bpy.context.scene.frame_set(33)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        packets = self.receive()
+
+        assert self.receiver.errors == 0
+        assert self.receiver.dropped == 0
+        assert packets == [{0: position} for position in positions], f"got {packets}"
+        assert self.receiver.last_sequence == len(packets)
+
+    def test_datagrams_with_sender_thread(self):
+        bpy.context.window_manager.servo_animation.use_sender_thread = True
+        self.start_live_mode()
+        bpy.context.scene.frame_set(33)
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+        self.receive()
+
+        assert self.receiver.errors == 0
+        assert self.receiver.positions == {0: 45}
+
+    def test_without_receiver(self):
+        self.server.close()
+        self.start_live_mode()
+        bpy.context.scene.frame_set(33)
+
+        assert import_addon_module("utils.live_mode").LiveMode.is_connected()
+
+        bpy.ops.servo_animation.stop_live_mode('EXEC_DEFAULT')
+
+    def test_invalid_host(self):
+        with self.assertRaises(RuntimeError):
+            bpy.ops.servo_animation.start_live_mode(
+                'EXEC_DEFAULT',
+                method='UDP',
+                udp_host="invalid host",
+                udp_port=self.port
+            )